@@ -12,6 +12,11 @@ from datetime import datetime
 from fastapi.staticfiles import StaticFiles
 from admin_app.routers import admin_property_management_router, admin_user_management_router, admin_ads_management_router
 from auth_layer.admin.admin_services import admin_user_management_service
+from database import client, async_client
+from common_layer import constants
+from common_layer.common_services import index_registry
+from common_layer.common_services.query_instrumentation import QueryInstrumentationMiddleware
+from core_layer.aws_cloudfront import core_cloudfront
 
 middleware = [
     Middleware(
@@ -26,6 +31,8 @@ middleware = [
 app = FastAPI(middleware=middleware, title="Square Admin", description="Trading Platform", version="0.1.0")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+if constants.QUERY_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryInstrumentationMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -53,4 +60,13 @@ def get_terms_and_conditions(request: Request):
 
 @app.on_event("startup")
 async def startup_event():
+    index_registry.ensure_indexes()
     logger.debug("App startup: " + str(datetime.now()))
+
+
+@app.on_event("shutdown")
+def close_database_connections():
+    logger.debug("Closing MongoDB connections")
+    async_client.close()
+    client.close()
+    core_cloudfront.shutdown_sign_pool()
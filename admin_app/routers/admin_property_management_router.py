@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Form, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, UploadFile, File
 from logging_module import logger
 from pydantic import EmailStr
 from typing import Annotated, Optional
@@ -209,6 +209,20 @@ def add_farm_property(request :FarmPropertyRequestSchema , token: str = Depends(
     response = customer_property_service.add_farm_property(request=request, token=token)
     logger.debug("Returning From the Add Farm Property Router")
     return response
+
+@router.post("/import-properties")
+def import_properties(background_tasks: BackgroundTasks, file: UploadFile = File(...), token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Import Properties Router")
+    response = customer_property_service.import_properties(file=file, background_tasks=background_tasks, token=token)
+    logger.debug("Returning From the Import Properties Router")
+    return response
+
+@router.get("/import-properties/{job_id}")
+def get_property_import_job(job_id: str, token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Get Property Import Job Router")
+    response = customer_property_service.get_property_import_job(job_id=job_id, token=token)
+    logger.debug("Returning From the Get Property Import Job Router")
+    return response
     
 @router.put("/update-farm-property")
 def update_farm_property(property_id:str, request: FarmPropertyRequestSchema, token: str = Depends(oauth2_scheme)):
@@ -246,11 +260,11 @@ def get_property_details(property_id:str):
     return response
 
 @router.post("/get-property-list")
-def get_property_list(per_page:int, page_number:int, filter_dict:dict, sort_dict:dict):
+async def get_property_list(per_page:int, filter_dict:dict, sort_dict:dict, page_number:int = 1, cursor: str = None, include_total: bool = True):
     logger.debug("Inside Get Property List Router")
-    response = customer_property_service.get_property_list(
+    response = await customer_property_service.get_property_list(
         per_page=per_page, page_number=page_number,
-        filter_dict=filter_dict, sort_dict=sort_dict
+        filter_dict=filter_dict, sort_dict=sort_dict, cursor=cursor, include_total=include_total
     )
     logger.debug("Returning From the Get Property List Router")
     return response
\ No newline at end of file
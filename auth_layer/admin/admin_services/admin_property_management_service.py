@@ -14,6 +14,8 @@ from common_layer.common_schemas.property_schema import UpdateCandleDataSchema
 from common_layer.common_services.oauth_handler import oauth2_scheme
 from core_layer.aws_s3 import s3
 from core_layer.aws_cloudfront import core_cloudfront
+from auth_layer.prospect.prospect_services import customer_property_service
+from common_layer.common_services import region_stats, region_locator, top_gainers
 
 
 def get_regions(page_number, per_page, region, status,token: Annotated[str, Depends(oauth2_scheme)]):
@@ -95,6 +97,10 @@ def add_region(
         )
         inserted_index = region_collection.insert_one(validated_index)
         logger.debug(f"Region Added Successfully with Id: {inserted_index.inserted_id}")
+        region_stats.sync_region_details(inserted_index.inserted_id)
+        region_locator.rebuild_region_index()
+        top_gainers.refresh_region_leaderboard(inserted_index.inserted_id)
+        customer_property_service.invalidate_regions_cache()
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -140,6 +146,10 @@ def deactivate_region(
             {constants.INDEX_ID: ObjectId(region_id)},
             {constants.UPDATE_INDEX_DATA: {constants.IS_ACTIVE_FIELD: not region_data.get(constants.IS_ACTIVE_FIELD)}},
         )
+        region_stats.sync_region_details(region_id)
+        region_locator.rebuild_region_index()
+        top_gainers.refresh_region_leaderboard(region_id)
+        customer_property_service.invalidate_regions_cache()
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={"message": "Region Status Changed Successfully"},
@@ -284,6 +294,9 @@ def update_region_icon(
             {constants.UPDATE_INDEX_DATA: {constants.UPDATED_AT_FIELD: time.time()}},
         )
 
+        region_stats.sync_region_details(region_id)
+        customer_property_service.invalidate_regions_cache()
+
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -352,6 +365,10 @@ def update_region(
             {constants.UPDATE_INDEX_DATA: validated_index},
             return_document=True,
         )
+        region_stats.sync_region_details(request.id)
+        region_locator.rebuild_region_index()
+        top_gainers.refresh_region_leaderboard(request.id)
+        customer_property_service.invalidate_regions_cache()
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -1002,6 +1019,11 @@ def set_candles_of_property(request: UpdateCandleDataSchema, token):
                 }
             },
         )
+        customer_property_service.invalidate_property_detail_cache(property_id)
+        if property_details.get(constants.REGION_ID_FIELD):
+            top_gainers.refresh_region_leaderboard(
+                property_details[constants.REGION_ID_FIELD]
+            )
 
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
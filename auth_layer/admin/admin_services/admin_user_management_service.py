@@ -515,9 +515,11 @@ def get_users_list(
             )
             return response
         user_details = list(user_details)
+        avatars = core_cloudfront.sign_many(
+            user.get("profile_picture_url_key") for user in user_details
+        )
         for user in user_details:
-            profile_picture_url_key = user.get("profile_picture_url_key")
-            user["avatar"] = core_cloudfront.cloudfront_sign(profile_picture_url_key)
+            user["avatar"] = avatars.get(user.get("profile_picture_url_key"))
             user[constants.ID] = str(user[constants.INDEX_ID])
             del user[constants.INDEX_ID]
         total_documents = user_collection.count_documents(
@@ -2,13 +2,15 @@ import time
 from uuid import uuid4
 from common_layer.common_services.utils import token_decoder
 from prospect_app.logging_module import logger
-from database import db
+from database import db, async_db
 from common_layer import constants
 from http import HTTPStatus
 from bson import ObjectId
 from fastapi.encoders import jsonable_encoder
 from core_layer.aws_cloudfront.core_cloudfront import cloudfront_sign
 from auth_layer.prospect.prospect_services import customer_management_service
+from common_layer.common_services.batch_loader import BatchLoader
+from common_layer.common_services.document_counts import count_documents_cached
 from auth_layer.prospect.prospect_schemas.customer_conversation_schema import (
     ResponseMessage,
     CustomerConversationInDB,
@@ -16,7 +18,9 @@ from auth_layer.prospect.prospect_schemas.customer_conversation_schema import (
 )
 
 
-def get_customer_conversations(page_number: int, per_page: int, type: str, token: str):
+async def get_customer_conversations(
+    page_number: int, per_page: int, type: str, token: str, include_total: bool = True
+):
     logger.debug("Inside Get Customer Conversations Service")
 
     try:
@@ -33,7 +37,7 @@ def get_customer_conversations(page_number: int, per_page: int, type: str, token
             )
             return response
 
-        customer_conversation_collection = db[constants.CUSTOMER_CONVERSATION_SCHEMA]
+        customer_conversation_collection = async_db[constants.CUSTOMER_CONVERSATION_SCHEMA]
 
         filter = {}
         if type == "buyer":
@@ -48,14 +52,15 @@ def get_customer_conversations(page_number: int, per_page: int, type: str, token
                 ]
             }
 
-        customer_conversation = (
+        customer_conversation = await (
             customer_conversation_collection.find(filter)
             .sort(constants.CREATED_AT_FIELD, -1)
             .skip((page_number - 1) * per_page)
             .limit(per_page)
+            .to_list(length=per_page)
         )
 
-        response_list = []
+        person_info_ids = []
         for conversation in customer_conversation:
             if type == "buyer":
                 person_info_id = conversation.get(constants.RECIEVER_ID_FIELD)
@@ -66,23 +71,31 @@ def get_customer_conversations(page_number: int, per_page: int, type: str, token
                     person_info_id = conversation.get(constants.RECIEVER_ID_FIELD)
                 else:
                     person_info_id = conversation.get(constants.SENDER_ID_FIELD)
-            person_info = db[constants.USER_DETAILS_SCHEMA].find_one(
-                {constants.INDEX_ID: ObjectId(person_info_id)},
-                {"legal_name": 1, constants.INDEX_ID: 0},
-            )
-            if person_info:
-                conversation["person_info"] = person_info
-            else:
-                conversation["person_info"] = {}
+            person_info_ids.append(person_info_id)
+
+        user_loader = BatchLoader(
+            constants.USER_DETAILS_SCHEMA, {"legal_name": 1, constants.INDEX_ID: 0}
+        )
+        user_loader.add_many(person_info_ids)
+        property_loader = BatchLoader(
+            constants.PROPERTY_DETAILS_SCHEMA,
+            {
+                constants.PROJECT_TITLE_FIELD: 1,
+                constants.INDEX_ID: 0,
+                constants.PROJECT_LOGO_FIELD: 1,
+            },
+        )
+        property_loader.add_many(
+            conversation.get("property_id") for conversation in customer_conversation
+        )
+        await user_loader.load_async()
+        await property_loader.load_async()
+
+        response_list = []
+        for conversation, person_info_id in zip(customer_conversation, person_info_ids):
+            conversation["person_info"] = user_loader.get(person_info_id, {})
             conversation[constants.ID] = str(conversation[constants.INDEX_ID])
-            property_details = db[constants.PROPERTY_DETAILS_SCHEMA].find_one(
-                {constants.INDEX_ID: ObjectId(conversation.get("property_id"))},
-                {
-                    constants.PROJECT_TITLE_FIELD: 1,
-                    constants.INDEX_ID: 0,
-                    constants.PROJECT_LOGO_FIELD: 1,
-                },
-            )
+            property_details = property_loader.get(conversation.get("property_id"))
             if property_details:
                 conversation["property_details"] = property_details
                 conversation["property_details"]["project_logo"] = cloudfront_sign(
@@ -95,7 +108,9 @@ def get_customer_conversations(page_number: int, per_page: int, type: str, token
 
             del conversation[constants.INDEX_ID]
             response_list.append(conversation)
-        chat_count = customer_conversation_collection.count_documents(filter)
+        chat_count = await count_documents_cached(
+            customer_conversation_collection, filter, include_total
+        )
         response = ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -2,7 +2,7 @@ import time
 from uuid import uuid4
 from common_layer.common_services.utils import token_decoder, fcm_push_notification
 from prospect_app.logging_module import logger
-from database import db
+from database import db, async_db
 from common_layer import constants
 from http import HTTPStatus
 from bson import ObjectId
@@ -18,18 +18,18 @@ from auth_layer.prospect.prospect_schemas.customer_investment_schema import (
 )
 
 
-def get_user_wallet(token):
+async def get_user_wallet(token):
     logger.debug("Inside Get User Wallet Service")
     try:
         logger.debug("Decoding Token")
         decoded_token = token_decoder(token)
         user_id = decoded_token.get(constants.ID)
         logger.debug("Getting User Wallet for User: " + str(user_id))
-        user_wallet_collection = db[constants.USER_WALLET_SCHEMA]
-        user_wallet = user_wallet_collection.find_one({"user_id": user_id})
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        candlestick_data_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        portfolio_analysis_collection = db[constants.PORTFOLIO_ANALYSIS_SCHEMA]
+        user_wallet_collection = async_db[constants.USER_WALLET_SCHEMA]
+        user_wallet = await user_wallet_collection.find_one({"user_id": user_id})
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        candlestick_data_collection = async_db[constants.CANDLE_DETAILS_SCHEMA]
+        portfolio_analysis_collection = async_db[constants.PORTFOLIO_ANALYSIS_SCHEMA]
         if user_wallet is None:
             response = ResponseMessage(
                 type=constants.HTTP_RESPONSE_FAILURE,
@@ -46,7 +46,7 @@ def get_user_wallet(token):
                 continue
             property_ids.append(ObjectId(property_id))
 
-        property_details = property_details_collection.find(
+        property_details = await property_details_collection.find(
             {constants.INDEX_ID: {"$in": property_ids}},
             {
                 "project_title": 1,
@@ -56,23 +56,23 @@ def get_user_wallet(token):
                 "_id": 1,
                 "roi_percentage": 1,
             },
-        )
+        ).to_list(length=None)
         property_id_list = [str(property_id) for property_id in property_ids]
-        candlestick_data = candlestick_data_collection.find(
+        candlestick_data = await candlestick_data_collection.find(
             {
                 constants.PROPERTY_ID_FIELD: {
                     "$in": property_id_list
                 }
             },
             {"candle_data": 1, "property_id": 1},
-        )
+        ).to_list(length=None)
         candle_dict = {}
         for candle in candlestick_data:
             candle_dict[str(candle.get(constants.PROPERTY_ID_FIELD))] = candle.get(
                 "candle_data"
             )
 
-        portfolio_analysis = portfolio_analysis_collection.find_one({constants.USER_ID_FIELD:user_id})
+        portfolio_analysis = await portfolio_analysis_collection.find_one({constants.USER_ID_FIELD:user_id})
         if not portfolio_analysis:
             portfolio_analysis = {}
 
@@ -292,92 +292,98 @@ def withdraw_balance(token, amount):
     return response
 
 
-def fetch_available_shared(property_details):
-    if property_details.get(constants.CATEGORY_FIELD) == "residential":
-        residentail_category_collection = db[
-            constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA
-        ]
-        residential_category = residentail_category_collection.find_one(
-            {
-                constants.INDEX_ID: ObjectId(
-                    property_details.get(constants.PROPERTY_DETAILS_ID_FIELD)
-                )
-            }
-        )
-        if residential_category is None:
-            response = ResponseMessage(
-                type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: "Residential Category Not Found"},
-                status_code=HTTPStatus.NOT_FOUND,
-            )
-            return response
-        current_available_shares = residential_category.get("carpet_area")
-    elif property_details.get(constants.CATEGORY_FIELD) == "commercial":
-        commercial_category_collection = db[
-            constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA
-        ]
-        commercial_category = commercial_category_collection.find_one(
-            {
-                constants.INDEX_ID: ObjectId(
-                    property_details.get(constants.PROPERTY_DETAILS_ID_FIELD)
-                )
-            }
-        )
-        if commercial_category is None:
-            response = ResponseMessage(
-                type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: "Commercial Category Not Found"},
-                status_code=HTTPStatus.NOT_FOUND,
-            )
-            return response
-        current_available_shares = commercial_category.get("carpet_area")
-
-    elif property_details.get(constants.CATEGORY_FIELD) == "farm":
-        farm_category_collection = db[constants.FARM_PROPERTY_DETAILS_SCHEMA]
-        farm_category = farm_category_collection.find_one(
-            {
-                constants.INDEX_ID: ObjectId(
-                    property_details.get(constants.PROPERTY_DETAILS_ID_FIELD)
-                )
-            }
-        )
-        if farm_category is None:
-            response = ResponseMessage(
-                type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: "Farm Category Not Found"},
-                status_code=HTTPStatus.NOT_FOUND,
-            )
-            return response
-        current_available_shares = farm_category.get("plot_area")
-    else:
+AVAILABLE_SHARES_SOURCE = {
+    "residential": (
+        constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+        "carpet_area",
+        "Residential Category Not Found",
+    ),
+    "commercial": (
+        constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA,
+        "carpet_area",
+        "Commercial Category Not Found",
+    ),
+    "farm": (
+        constants.FARM_PROPERTY_DETAILS_SCHEMA,
+        "plot_area",
+        "Farm Category Not Found",
+    ),
+}
+
+
+def available_shares_source(property_details):
+    """
+    (schema, filter, area field, not-found message) of the category document
+    holding a property's share count, or None for an unknown category.
+    """
+    source = AVAILABLE_SHARES_SOURCE.get(property_details.get(constants.CATEGORY_FIELD))
+    if source is None:
+        return None
+    schema, area_field, not_found_message = source
+    category_filter = {
+        constants.INDEX_ID: ObjectId(
+            property_details.get(constants.PROPERTY_DETAILS_ID_FIELD)
+        )
+    }
+    return schema, category_filter, area_field, not_found_message
+
+
+def available_shares_response(category_details, source):
+    _, _, area_field, not_found_message = source
+    if category_details is None:
         response = ResponseMessage(
             type=constants.HTTP_RESPONSE_FAILURE,
-            data={constants.MESSAGE: "Invalid Category"},
+            data={constants.MESSAGE: not_found_message},
             status_code=HTTPStatus.NOT_FOUND,
         )
         return response
     response = ResponseMessage(
         type=constants.HTTP_RESPONSE_SUCCESS,
-        data={"available_shares": current_available_shares},
+        data={"available_shares": category_details.get(area_field)},
         status_code=HTTPStatus.OK,
     )
     return response
 
 
-def buy_investment_share(token, quantity, property_id):
+def invalid_category_response():
+    response = ResponseMessage(
+        type=constants.HTTP_RESPONSE_FAILURE,
+        data={constants.MESSAGE: "Invalid Category"},
+        status_code=HTTPStatus.NOT_FOUND,
+    )
+    return response
+
+
+def fetch_available_shared(property_details):
+    source = available_shares_source(property_details)
+    if source is None:
+        return invalid_category_response()
+    schema, category_filter = source[:2]
+    return available_shares_response(db[schema].find_one(category_filter), source)
+
+
+async def fetch_available_shared_async(property_details):
+    source = available_shares_source(property_details)
+    if source is None:
+        return invalid_category_response()
+    schema, category_filter = source[:2]
+    return available_shares_response(await async_db[schema].find_one(category_filter), source)
+
+
+async def buy_investment_share(token, quantity, property_id):
     logger.debug("Inside Buy Investment Share Service")
     try:
         logger.debug("Decoding Token")
         decoded_token = token_decoder(token)
         user_id = decoded_token.get(constants.ID)
         logger.debug("Getting User Wallet for User: " + str(user_id))
-        user_wallet_collection = db[constants.USER_WALLET_SCHEMA]
-        customer_fiat_collection = db[constants.CUSTOMER_FIAT_TRANSACTIONS_SCHEMA]
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        customer_transaction_details_collection = db[
+        user_wallet_collection = async_db[constants.USER_WALLET_SCHEMA]
+        customer_fiat_collection = async_db[constants.CUSTOMER_FIAT_TRANSACTIONS_SCHEMA]
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        customer_transaction_details_collection = async_db[
             constants.CUSTOMER_TRANSACTION_SCHEMA
         ]
-        user_wallet = user_wallet_collection.find_one({"user_id": user_id})
+        user_wallet = await user_wallet_collection.find_one({"user_id": user_id})
         if user_wallet is None:
             response = ResponseMessage(
                 type=constants.HTTP_RESPONSE_FAILURE,
@@ -386,7 +392,7 @@ def buy_investment_share(token, quantity, property_id):
             )
             return response
 
-        property_details = property_details_collection.find_one(
+        property_details = await property_details_collection.find_one(
             {constants.INDEX_ID: ObjectId(property_id)}
         )
 
@@ -399,7 +405,7 @@ def buy_investment_share(token, quantity, property_id):
             return response
         if property_details.get("available_shares") is None:
             fetch_available_shared_response = jsonable_encoder(
-                fetch_available_shared(property_details)
+                await fetch_available_shared_async(property_details)
             )
             if (
                 fetch_available_shared_response.get("type")
@@ -464,9 +470,9 @@ def buy_investment_share(token, quantity, property_id):
             user_wallet[property_id]["updated_at"] = time.time()
         user_wallet["balance"] = user_wallet.get("balance") - (quantity * current_price)
 
-        user_wallet_collection.update_one({"user_id": user_id}, {"$set": user_wallet})
+        await user_wallet_collection.update_one({"user_id": user_id}, {"$set": user_wallet})
 
-        property_details_collection.update_one(
+        await property_details_collection.update_one(
             {constants.INDEX_ID: ObjectId(property_id)},
             {"$set": {"available_shares": current_available_shares - quantity}},
         )
@@ -485,7 +491,7 @@ def buy_investment_share(token, quantity, property_id):
             updated_at=time.time()
         )
 
-        transaction_index = customer_transaction_details_collection.insert_one(
+        transaction_index = await customer_transaction_details_collection.insert_one(
             jsonable_encoder(customer_transaction_index)
         )
 
@@ -501,9 +507,9 @@ def buy_investment_share(token, quantity, property_id):
             )
         )
 
-        customer_fiat_collection.insert_one(fiat_record)
+        await customer_fiat_collection.insert_one(fiat_record)
         body = f"{quantity} shares of {property_details.get('project_title')} bought successfully."
-        customer_management_service.add_notifications("buy", "Buy", body, property_id,  token)
+        await customer_management_service.add_notifications_async("buy", "Buy", body, property_id,  token)
 
         del user_wallet["_id"]
         response = ResponseMessage(
@@ -525,19 +531,19 @@ def buy_investment_share(token, quantity, property_id):
     return response
 
 
-def sell_investment_share(token, quantity, property_id):
+async def sell_investment_share(token, quantity, property_id):
     logger.debug("Inside Sell Investment Share Service")
     try:
         logger.debug("Decoding Token")
         decoded_token = token_decoder(token)
         user_id = decoded_token.get(constants.ID)
         logger.debug("Getting User Wallet for User: " + str(user_id))
-        user_wallet_collection = db[constants.USER_WALLET_SCHEMA]
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        customer_fiat_collection = db[constants.CUSTOMER_FIAT_TRANSACTIONS_SCHEMA]
+        user_wallet_collection = async_db[constants.USER_WALLET_SCHEMA]
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        customer_fiat_collection = async_db[constants.CUSTOMER_FIAT_TRANSACTIONS_SCHEMA]
 
-        user_wallet = user_wallet_collection.find_one({"user_id": user_id})
-        customer_transaction_details_collection = db[
+        user_wallet = await user_wallet_collection.find_one({"user_id": user_id})
+        customer_transaction_details_collection = async_db[
             constants.CUSTOMER_TRANSACTION_SCHEMA
         ]
         if user_wallet is None:
@@ -548,7 +554,7 @@ def sell_investment_share(token, quantity, property_id):
             )
             return response
 
-        property_details = property_details_collection.find_one(
+        property_details = await property_details_collection.find_one(
             {constants.INDEX_ID: ObjectId(property_id)}
         )
 
@@ -604,9 +610,9 @@ def sell_investment_share(token, quantity, property_id):
 
         user_wallet["balance"] = user_wallet.get("balance") + (quantity * current_price)
 
-        user_wallet_collection.update_one({"user_id": user_id}, {"$set": user_wallet})
+        await user_wallet_collection.update_one({"user_id": user_id}, {"$set": user_wallet})
 
-        property_details_collection.update_one(
+        await property_details_collection.update_one(
             {constants.INDEX_ID: ObjectId(property_id)},
             {"$set": {"available_shares": current_available_shares + quantity}},
         )
@@ -625,7 +631,7 @@ def sell_investment_share(token, quantity, property_id):
             updated_at=time.time()
         )
 
-        customer_transaction_index = customer_transaction_details_collection.insert_one(
+        customer_transaction_index = await customer_transaction_details_collection.insert_one(
             jsonable_encoder(transaction_index)
         )
 
@@ -643,9 +649,9 @@ def sell_investment_share(token, quantity, property_id):
             )
         )
 
-        customer_fiat_collection.insert_one(fiat_record)
+        await customer_fiat_collection.insert_one(fiat_record)
         body = f"{quantity} shares of {property_details.get('project_title')} sold successfully."
-        customer_management_service.add_notifications("sell", "Sell", body, property_id,  token)
+        await customer_management_service.add_notifications_async("sell", "Sell", body, property_id,  token)
 
         del user_wallet["_id"]
         response = ResponseMessage(
@@ -1,4 +1,5 @@
 import time
+from datetime import date
 import io
 from typing import Annotated
 from fastapi import Depends, HTTPException
@@ -12,6 +13,9 @@ from common_layer.common_services.utils import token_decoder
 from common_layer.common_services.oauth_handler import oauth2_scheme
 from core_layer.aws_s3 import s3
 from core_layer.aws_cloudfront import core_cloudfront
+from common_layer.common_services.batch_loader import BatchLoader
+from common_layer.common_services import view_rollups
+from common_layer.common_schemas.property_schema import AnalyticsGranularity
 from auth_layer.prospect.prospect_schemas.customer_leads_management_schema import (
     ResponseMessage,
     CustomerLeadsInDB,
@@ -28,7 +32,6 @@ def get_investors_projects(page_number: int, per_page: int, token: str):
         logger.debug("User Id : " + str(user_id))
 
         property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        candle_details_collection = db[constants.CANDLE_DETAILS_SCHEMA]
         """
             Title, address, logo, candle, change, change_percent
         """
@@ -48,12 +51,20 @@ def get_investors_projects(page_number: int, per_page: int, token: str):
             .limit(per_page)
         )
 
+        property_details = list(property_details)
+        candle_loader = BatchLoader(
+            constants.CANDLE_DETAILS_SCHEMA,
+            {constants.INDEX_ID: 0, "candle_data": 1},
+            key_field=constants.PROPERTY_ID_FIELD,
+        )
+        candle_loader.add_many(
+            property_detail[constants.INDEX_ID] for property_detail in property_details
+        )
+        candle_loader.load()
+
         response_list = []
         for property_detail in property_details:
-            candle_data = candle_details_collection.find_one(
-                {constants.PROPERTY_ID_FIELD: str(property_detail[constants.INDEX_ID])},
-                {constants.INDEX_ID: 0, "candle_data": 1},
-            )
+            candle_data = candle_loader.get(property_detail[constants.INDEX_ID])
             property_detail[constants.ID] = str(property_detail[constants.INDEX_ID])
             property_detail[
                 constants.PROJECT_LOGO_FIELD
@@ -235,7 +246,6 @@ def get_investors_leads(page_number: int, per_page: int, token: str):
         logger.debug("User Id : " + str(user_id))
 
         customer_leads_collection = db[constants.CUSTOMER_LEADS_SCHEMA]
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
         """
             Name, email, phone, property name, property address, property logo, property candle, property change, property change percent
         """
@@ -252,20 +262,25 @@ def get_investors_leads(page_number: int, per_page: int, token: str):
             .skip((page_number - 1) * per_page)
             .limit(per_page)
         )
+        customer_leads = list(customer_leads)
+        property_loader = BatchLoader(
+            constants.PROPERTY_DETAILS_SCHEMA,
+            {
+                constants.INDEX_ID: 1,
+                constants.PROJECT_TITLE_FIELD: 1,
+                constants.PROJECT_LOGO_FIELD: 1,
+                constants.ADDRESS_FIELD: 1,
+            },
+        )
+        property_loader.add_many(
+            customer_lead[constants.PROPERTY_ID_FIELD] for customer_lead in customer_leads
+        )
+        property_loader.load()
+
         response_list = []
         for customer_lead in customer_leads:
-            property_details = property_details_collection.find_one(
-                {
-                    constants.INDEX_ID: ObjectId(
-                        customer_lead[constants.PROPERTY_ID_FIELD]
-                    )
-                },
-                {
-                    constants.INDEX_ID: 1,
-                    constants.PROJECT_TITLE_FIELD: 1,
-                    constants.PROJECT_LOGO_FIELD: 1,
-                    constants.ADDRESS_FIELD: 1,
-                },
+            property_details = property_loader.get(
+                customer_lead[constants.PROPERTY_ID_FIELD]
             )
             property_details[constants.ID] = str(property_details[constants.INDEX_ID])
             property_details[
@@ -528,15 +543,17 @@ def change_lead_status(lead_id: str, status: str, token: str = Depends(oauth2_sc
     return response
 
 
-def get_property_analytics(property_id: str, token: str = Depends(oauth2_scheme)):
+def get_property_analytics(
+    property_id: str,
+    from_date: date = None,
+    to_date: date = None,
+    granularity: str = AnalyticsGranularity.DAILY.value,
+    token: str = Depends(oauth2_scheme),
+):
     logger.debug("Inside Get Property Analytics Service")
     try:
-        customer_property_analytics_collection = db[
-            constants.CUSTOMER_PROPERTY_ANALYTICS_SCHEMA
-        ]
-
-        customer_property_analytics = customer_property_analytics_collection.find(
-            {constants.PROPERTY_ID_FIELD: property_id}, {constants.PROPERTY_ID_FIELD: 0}
+        customer_property_analytics = view_rollups.property_view_series(
+            property_id, from_date, to_date, granularity
         )
 
         if not customer_property_analytics:
@@ -548,13 +565,18 @@ def get_property_analytics(property_id: str, token: str = Depends(oauth2_scheme)
             return response
 
         response_dict = {}
+        total_views_dict = {}
         for analytics in customer_property_analytics:
-            print(analytics)
-            response_dict[analytics["timestamp"]] = analytics["view_count"]
+            response_dict[analytics["period"]] = analytics[constants.VIEW_COUNT_FIELD]
+            total_views_dict[analytics["period"]] = analytics.get("total_views", 0)
 
         response = ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
-            data={"analytics": response_dict},
+            data={
+                "analytics": response_dict,
+                "total_views": total_views_dict,
+                "granularity": granularity,
+            },
             status_code=HTTPStatus.OK,
         )
     except Exception as e:
@@ -568,20 +590,22 @@ def get_property_analytics(property_id: str, token: str = Depends(oauth2_scheme)
     return response
 
 
-def get_dashboard_analytics(token: str = Depends(oauth2_scheme)):
+def get_dashboard_analytics(
+    from_date: date = None,
+    to_date: date = None,
+    granularity: str = AnalyticsGranularity.DAILY.value,
+    token: str = Depends(oauth2_scheme),
+):
     logger.debug("Inside Get All Property Views From Analytics Service")
     try:
         decoded_token = token_decoder(token)
         logger.debug("Decoded Token : " + str(decoded_token))
         user_id = decoded_token.get(constants.ID)
 
-        customer_daily_count = db[constants.CUSTOMER_DAILY_PROPERTY_ANALYTICS_SCHEMA]
-        pipeline = [
-            {"$match": {"user_id": user_id}},  # Replace with the desired user_id
-            {"$group": {"_id": "$data", "view_count": {"$sum": "$view_count"}}},
-        ]
-        # Aggregate the view count by date filed
-        customer_property_analytics = customer_daily_count.aggregate(pipeline)
+        # Per-period sums over the partner's rollup buckets for the range.
+        customer_property_analytics = view_rollups.user_view_series(
+            user_id, from_date, to_date, granularity
+        )
 
         if not customer_property_analytics:
             response = ResponseMessage(
@@ -592,12 +616,18 @@ def get_dashboard_analytics(token: str = Depends(oauth2_scheme)):
             return response
 
         response_dict = {}
+        views_dict = {}
         for analytics in customer_property_analytics:
-            response_dict[analytics[constants.INDEX_ID]] = analytics[constants.VIEW_COUNT_FIELD]
+            response_dict[analytics[constants.INDEX_ID]] = analytics["total_views"]
+            views_dict[analytics[constants.INDEX_ID]] = analytics[constants.VIEW_COUNT_FIELD]
 
         response = ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
-            data={"analytics": response_dict},
+            data={
+                "analytics": response_dict,
+                "views": views_dict,
+                "granularity": granularity,
+            },
             status_code=HTTPStatus.OK,
         )
     except Exception as e:
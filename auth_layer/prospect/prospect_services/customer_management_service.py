@@ -2,7 +2,7 @@ import time
 from http import HTTPStatus
 from common_layer.common_schemas import user_schema
 from core_layer.aws_cloudfront import core_cloudfront
-from database import db
+from database import db, async_db
 from common_layer import constants
 from datetime import timedelta
 from prospect_app.logging_module import logger
@@ -18,6 +18,8 @@ from auth_layer.prospect.prospect_schemas import device_details_schema
 from common_layer.common_services.utils import fcm_push_notification, token_decoder
 from common_layer import roles
 from fastapi.encoders import jsonable_encoder
+from common_layer.common_services.batch_loader import BatchLoader
+from common_layer.common_services.document_counts import count_documents_cached
 
 
 def login_user(
@@ -157,59 +159,97 @@ def verify_secure_pin(mobile_number: str, code: str):
     return response
 
 
+def notification_document(user_id, source_type, title, body, redirection):
+    created_at = time.time()
+    return jsonable_encoder(
+        user_schema.NotificationDetails(
+            user_id=user_id,
+            source_type=source_type,
+            title=title,
+            body=body,
+            redirection=redirection,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+    )
+
+
+def user_not_exist_response():
+    response = user_schema.ResponseMessage(
+        type=constants.HTTP_RESPONSE_FAILURE,
+        data={constants.MESSAGE: constants.USER_NOT_EXIST},
+        status_code=HTTPStatus.FORBIDDEN,
+    )
+    return response
+
+
+def notification_added_response():
+    response = user_schema.ResponseMessage(
+        type=constants.HTTP_RESPONSE_SUCCESS,
+        data={constants.MESSAGE: constants.NOTIFICATION_ADDED},
+        status_code=HTTPStatus.ACCEPTED,
+    )
+    return response
+
+
+def add_notification_error_response(e):
+    logger.error(f"Error in Add Notification Service: {e}")
+    response = user_schema.ResponseMessage(
+        type=constants.HTTP_RESPONSE_FAILURE,
+        data={constants.MESSAGE: f"Error in Add Notification Service: {e}"},
+        status_code=e.status_code if hasattr(e, "status_code") else 500,
+    )
+    return response
+
+
+# add_notifications and add_notifications_async differ only in the driver
+# they await on; validation and the document live in the helpers above.
 def add_notifications(source_type, title, body, redirection, token):
     logger.debug("Inside Add Notifications")
     try:
-        decoded_token = token_decoder(token)
-        user_id = decoded_token.get(constants.ID)
-        user_collection = db[constants.USER_DETAILS_SCHEMA]
-        user_details = user_collection.find_one({constants.INDEX_ID: ObjectId(user_id)})
+        user_id = token_decoder(token).get(constants.ID)
+        user_details = db[constants.USER_DETAILS_SCHEMA].find_one(
+            {constants.INDEX_ID: ObjectId(user_id)}
+        )
         if not user_details:
-            response = user_schema.ResponseMessage(
-                type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: constants.USER_NOT_EXIST},
-                status_code=HTTPStatus.FORBIDDEN,
-            )
-            return response
-        notification_collection = db[constants.NOTIFICATION_DETAILS_SCHEMA]
-        notification_index = jsonable_encoder(
-            user_schema.NotificationDetails(
-                user_id=user_id,
-                source_type=source_type,
-                title=title,
-                body=body,
-                redirection=redirection,
-                created_at=time.time(),
-                updated_at=time.time(),
-            )
+            return user_not_exist_response()
+        db[constants.NOTIFICATION_DETAILS_SCHEMA].insert_one(
+            notification_document(user_id, source_type, title, body, redirection)
         )
-        notification_collection.insert_one(notification_index)
+        response = notification_added_response()
+    except Exception as e:
+        response = add_notification_error_response(e)
+    logger.debug("Returning From the Add Notification Service")
+    return response
 
-        response = user_schema.ResponseMessage(
-            type=constants.HTTP_RESPONSE_SUCCESS,
-            data={constants.MESSAGE: constants.NOTIFICATION_ADDED},
-            status_code=HTTPStatus.ACCEPTED,
+
+async def add_notifications_async(source_type, title, body, redirection, token):
+    logger.debug("Inside Add Notifications")
+    try:
+        user_id = token_decoder(token).get(constants.ID)
+        user_details = await async_db[constants.USER_DETAILS_SCHEMA].find_one(
+            {constants.INDEX_ID: ObjectId(user_id)}
         )
-    except Exception as e:
-        logger.error(f"Error in Add Notification Service: {e}")
-        response = user_schema.ResponseMessage(
-            type=constants.HTTP_RESPONSE_FAILURE,
-            data={constants.MESSAGE: f"Error in Add Notification Service: {e}"},
-            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        if not user_details:
+            return user_not_exist_response()
+        await async_db[constants.NOTIFICATION_DETAILS_SCHEMA].insert_one(
+            notification_document(user_id, source_type, title, body, redirection)
         )
+        response = notification_added_response()
+    except Exception as e:
+        response = add_notification_error_response(e)
     logger.debug("Returning From the Add Notification Service")
     return response
 
 
-def get_notifications(page_number, per_page, token):
+async def get_notifications(page_number, per_page, token, include_total=True):
     logger.debug("Inside Get Notifications")
     try:
         decoded_token = token_decoder(token)
         user_id = decoded_token.get(constants.ID)
-        user_collection = db[constants.USER_DETAILS_SCHEMA]
-        notification_collection = db[constants.NOTIFICATION_DETAILS_SCHEMA]
-        property_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        user_details = user_collection.find_one({constants.INDEX_ID: ObjectId(user_id)})
+        user_collection = async_db[constants.USER_DETAILS_SCHEMA]
+        notification_collection = async_db[constants.NOTIFICATION_DETAILS_SCHEMA]
+        user_details = await user_collection.find_one({constants.INDEX_ID: ObjectId(user_id)})
         if not user_details:
             response = user_schema.ResponseMessage(
                 type=constants.HTTP_RESPONSE_FAILURE,
@@ -218,12 +258,27 @@ def get_notifications(page_number, per_page, token):
             )
             return response
 
-        customer_notifications = (
+        customer_notifications = await (
             notification_collection.find({constants.USER_ID_FIELD: user_id})
             .sort(constants.CREATED_AT_FIELD, -1)
             .skip((page_number - 1) * per_page)
             .limit(per_page)
+            .to_list(length=per_page)
+        )
+
+        property_loader = BatchLoader(
+            constants.PROPERTY_DETAILS_SCHEMA, {constants.PROJECT_LOGO_FIELD: 1}
         )
+        sender_loader = BatchLoader(
+            constants.USER_DETAILS_SCHEMA, {constants.PROFILE_IMAGE_FIELD: 1}
+        )
+        for notification in customer_notifications:
+            if notification.get(constants.SOURCE_TYPE_FIELD) in ["buy", "sell", "property"]:
+                property_loader.add(notification.get("redirection"))
+            elif notification.get(constants.SOURCE_TYPE_FIELD) == "chat":
+                sender_loader.add(notification.get("redirection"))
+        await property_loader.load_async()
+        await sender_loader.load_async()
 
         notifications = []
         for notification in customer_notifications:
@@ -234,24 +289,15 @@ def get_notifications(page_number, per_page, token):
                 "sell",
                 "property",
             ]:
-                property_id = notification.get("redirection")
-                property_details = property_collection.find_one(
-                    {constants.INDEX_ID: ObjectId(property_id)},
-                    {constants.PROJECT_LOGO_FIELD: 1},
-                )
+                property_details = property_loader.get(notification.get("redirection"))
                 if property_details:
-                    print(property_details)
                     notification["image_url"] = core_cloudfront.cloudfront_sign(
                         property_details[constants.PROJECT_LOGO_FIELD]
                     )
                 else:
                     notification["image_url"] = ""
             elif notification.get(constants.SOURCE_TYPE_FIELD) == "chat":
-                sender_id = notification.get("redirection")
-                sender_details = user_collection.find_one(
-                    {constants.INDEX_ID: ObjectId(sender_id)},
-                    {constants.PROFILE_IMAGE_FIELD: 1},
-                )
+                sender_details = sender_loader.get(notification.get("redirection"))
                 if sender_details:
                     notification["image_url"] = core_cloudfront.cloudfront_sign(
                         sender_details[constants.PROFILE_IMAGE_FIELD]
@@ -262,8 +308,8 @@ def get_notifications(page_number, per_page, token):
                 notification["image_url"] = ""
 
             notifications.append(notification)
-        count_documents = notification_collection.count_documents(
-            {constants.USER_ID_FIELD: user_id}
+        count_documents = await count_documents_cached(
+            notification_collection, {constants.USER_ID_FIELD: user_id}, include_total
         )
         response = user_schema.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
@@ -1,14 +1,17 @@
+import os
+import shutil
+import tempfile
 import time
-from datetime import datetime
-from database import db
+from datetime import datetime, timedelta
+from database import db, async_db
 from bson import ObjectId
+from pymongo import UpdateOne
 from common_layer import constants
 from http import HTTPStatus
 from admin_app.logging_module import logger
 from fastapi.encoders import jsonable_encoder
-from fastapi import Depends, UploadFile
+from fastapi import BackgroundTasks, Depends, Response, UploadFile
 from typing import Annotated
-from bson.son import SON
 from common_layer.common_services.utils import (
     token_decoder,
     upload_image,
@@ -21,6 +24,12 @@ from auth_layer.prospect.prospect_services import customer_management_service
 from common_layer.common_services.oauth_handler import oauth2_scheme
 from core_layer.aws_s3 import s3
 from core_layer.aws_cloudfront import core_cloudfront
+from common_layer.common_services.batch_loader import BatchLoader
+from common_layer.common_services.timed_cache import TimedCache
+from common_layer.common_services import region_stats, property_search, property_text_index, view_rollups, top_gainers, similarity_engine, recommendations, property_writes, property_import
+from common_layer.common_services.pagination import KeysetPage
+from common_layer.common_services.document_counts import count_documents_cached
+from common_layer.common_services.view_counter import view_counter
 from common_layer.common_schemas.property_schema import (
     ListingType,
     ListedBy,
@@ -41,81 +50,65 @@ from common_layer.common_schemas.property_schema import (
     FarmPropertySchema,
     PropertyStatus,
     PropertyAnalyticsSchema,
+    AnalyticsGranularity,
     PropertyDailyViewCountSchema,
     FavoritePropertySchema,
+    BatchPropertyRequestSchema,
+    PropertyRepresentation,
+    PropertyImportStatus,
 )
 
 
+regions_cache = TimedCache(constants.REGIONS_CACHE_TTL_SECONDS)
+REGIONS_CACHE_KEY = "regions"
+
+
+def build_regions_response():
+    regions = list(
+        db[constants.REGION_STATS_SCHEMA].find(
+            {constants.IS_ACTIVE_FIELD: True},
+            {
+                constants.INDEX_ID: 1,
+                constants.ICON_IMAGE_FIELD: 1,
+                constants.TITLE_FIELD: 1,
+                "listed_properties_count": 1,
+                "min_area": 1,
+                "max_area": 1,
+            },
+        ).sort(constants.CREATED_AT_FIELD, -1)
+    )
+    response_regions = []
+    for region in regions:
+        response_regions.append(
+            {
+                constants.TITLE_FIELD: region[constants.TITLE_FIELD].title(),
+                constants.ID: region[constants.INDEX_ID],
+                "listed_properties_count": region.get("listed_properties_count", 0),
+                "icon_image_url": core_cloudfront.cloudfront_sign(
+                    region[constants.ICON_IMAGE_FIELD]
+                ),
+                "max_area": region.get("max_area", 0),
+                "min_area": region.get("min_area", 0),
+            }
+        )
+    return response_regions
+
+
+def refresh_regions_cache():
+    logger.debug("Refreshing Regions Cache")
+    regions_cache.set(REGIONS_CACHE_KEY, build_regions_response())
+
+
+def invalidate_regions_cache():
+    regions_cache.invalidate(REGIONS_CACHE_KEY)
+
+
 def get_regions():
     logger.debug("Inside Get Regions Service")
     try:
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
-        regions = list(
-            region_collection.find(
-                {constants.IS_ACTIVE_FIELD: True},
-                {
-                    constants.INDEX_ID: 1,
-                    constants.ICON_IMAGE_FIELD: 1,
-                    constants.TITLE_FIELD: 1,
-                },
-            ).sort(constants.CREATED_AT_FIELD, -1)
+        response_regions = regions_cache.get_or_load(
+            REGIONS_CACHE_KEY, build_regions_response
         )
-        response_regions = []
-        for region in regions:
-            region[constants.ID] = str(region[constants.INDEX_ID])
-            region[constants.TITLE_FIELD] = region[constants.TITLE_FIELD].title()
-            region["listed_properties_count"] = db[
-                constants.PROPERTY_DETAILS_SCHEMA
-            ].count_documents(
-                {
-                    constants.REGION_ID_FIELD: str(region[constants.INDEX_ID]),
-                }
-            )
-            region["icon_image_url"] = core_cloudfront.cloudfront_sign(
-                region[constants.ICON_IMAGE_FIELD]
-            )
-            # Get maximum area of all properties in the region
-            max_doc_info = list(
-                db[constants.PROPERTY_DETAILS_SCHEMA].aggregate(
-                    [
-                        {
-                            "$match": {
-                                constants.REGION_ID_FIELD: str(
-                                    region[constants.INDEX_ID]
-                                ),
-                            }
-                        },
-                        {"$group": {"_id": None, "max_area": {"$max": "$area"}}},
-                    ]
-                )
-            )
-            region["max_area"] = (
-                0 if len(max_doc_info) == 0 else max_doc_info[0]["max_area"]
-            )
-
-            # Get minimum area of all properties in the region
-            min_doc_info = list(
-                db[constants.PROPERTY_DETAILS_SCHEMA].aggregate(
-                    [
-                        {
-                            "$match": {
-                                constants.REGION_ID_FIELD: str(
-                                    region[constants.INDEX_ID]
-                                ),
-                            }
-                        },
-                        {"$group": {"_id": None, "min_area": {"$min": "$area"}}},
-                    ]
-                )
-            )
-            region["min_area"] = (
-                0 if len(min_doc_info) == 0 else min_doc_info[0]["min_area"]
-            )
-
-            region[constants.ID] = str(region[constants.INDEX_ID])
-            del region[constants.INDEX_ID]
-            del region[constants.ICON_IMAGE_FIELD]
-            response_regions.append(region)
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={"regions": response_regions},
@@ -135,9 +128,9 @@ def get_regions():
 def get_available_regions_name():
     logger.debug("Inside Get Available Regions Name Service")
     try:
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
+        region_stats_collection = db[constants.REGION_STATS_SCHEMA]
         regions = list(
-            region_collection.find(
+            region_stats_collection.find(
                 {constants.IS_ACTIVE_FIELD: True},
                 {constants.INDEX_ID: 0, constants.TITLE_FIELD: 1},
             ).sort(constants.CREATED_AT_FIELD, -1)
@@ -285,6 +278,193 @@ def get_filter_buttons_list():
     return response
 
 
+def residential_property_documents(request, user_id, property_id):
+    """
+    Property, residential details and candle documents for a new listing, as
+    passed to property_writes. `request` is the jsonable_encoder'd
+    ResidentialPropertyRequestSchema.
+    """
+    # Property Details Index
+    property_index = PropertySchema(
+        is_investment_property=request["is_investment_property"],
+        listed_by_user_id=user_id,
+        listing_type=request["listing_type"],
+        listed_by=request["listed_by"],
+        possession_type=request["possession_type"],
+        category="residential",
+        description=request["description"],
+        project_logo="",
+        project_title=request["project_title"],
+        price=request["price"],
+        area=request["carpet_area"],
+        view_count=0,
+        video_url=request["video_url"],
+        address=request["address"],
+        location={
+            "type": "Point",
+            "coordinates": [
+                request["location"]["longitude"],
+                request["location"]["latitude"],
+            ],
+        },
+        region_id=request["region_id"],
+        verified=False,
+        property_details_id="",
+        candle_data_id="",
+        roi_percentage=request["roi_percentage"],
+    )
+    # Residential Property Index
+    residential_index = ResidentialPropertySchema(
+        property_id=str(property_id),
+        property_type=request["property_type"],
+        bedrooms=request["bedrooms"],
+        bathrooms=request["bathrooms"],
+        furnishing=request["furnishing"],
+        built_up_area=request["built_up_area"],
+        carpet_area=request["carpet_area"],
+        maintenance=request["maintenance"],
+        floor_no=request["floor_no"],
+        car_parking=request["car_parking"],
+        facing=request["facing"],
+        balcony=request["balcony"],
+    )
+
+    # Candle Data Index
+    candle_index = CandleDataSchema(
+        property_id=str(property_id),
+        property_gain=0,
+        candle_data=[{"timestamp": time.time(), "price": request["price"]}],
+    )
+    return (
+        jsonable_encoder(property_index),
+        constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+        jsonable_encoder(residential_index),
+        jsonable_encoder(candle_index),
+    )
+
+
+def commercial_property_documents(request, user_id, property_id):
+    """
+    Property, commercial details and candle documents for a new listing, as
+    passed to property_writes. `request` is the jsonable_encoder'd
+    CommercialPropertyRequestSchema.
+    """
+    # Property Details Index
+    property_index = PropertySchema(
+        is_investment_property=request["is_investment_property"],
+        region_id=request["region_id"],
+        listed_by_user_id=user_id,
+        listing_type=request["listing_type"],
+        listed_by=request["listed_by"],
+        possession_type=request["possession_type"],
+        category="commercial",
+        description=request["description"],
+        project_logo="",
+        project_title=request["project_title"],
+        price=request["price"],
+        area=request["carpet_area"],
+        view_count=0,
+        video_url=request["video_url"],
+        address=request["address"],
+        location={
+            "type": "Point",
+            "coordinates": [
+                request["location"]["longitude"],
+                request["location"]["latitude"],
+            ],
+        },
+        verified=False,
+        property_details_id="",
+        candle_data_id="",
+        roi_percentage=request["roi_percentage"],
+    )
+
+    # Commercial Property Index
+    commercial_index = CommercialPropertySchema(
+        property_id=str(property_id),
+        property_type=request["property_type"],
+        furnishing=request["furnishing"],
+        built_up_area=request["built_up_area"],
+        carpet_area=request["carpet_area"],
+        maintenance=request["maintenance"],
+        car_parking=request["car_parking"],
+        bathrooms=request["bathrooms"],
+    )
+
+    # Candle Data Index
+    candle_index = CandleDataSchema(
+        property_gain=0,
+        property_id=str(property_id),
+        candle_data=[{"timestamp": time.time(), "price": request["price"]}],
+    )
+    return (
+        jsonable_encoder(property_index),
+        constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA,
+        jsonable_encoder(commercial_index),
+        jsonable_encoder(candle_index),
+    )
+
+
+def farm_property_documents(request, user_id, property_id):
+    """
+    Property, farm details and candle documents for a new listing, as
+    passed to property_writes. `request` is the jsonable_encoder'd
+    FarmPropertyRequestSchema.
+    """
+    # Property Details Index
+    property_index = PropertySchema(
+        is_investment_property=request["is_investment_property"],
+        region_id=request["region_id"],
+        listed_by_user_id=user_id,
+        listing_type=request["listing_type"],
+        listed_by=request["listed_by"],
+        possession_type=request["possession_type"],
+        category="farm",
+        description=request["description"],
+        project_logo="",
+        project_title=request["project_title"],
+        price=request["price"],
+        area=request["plot_area"],
+        view_count=0,
+        video_url="",
+        address=request["address"],
+        location={
+            "type": "Point",
+            "coordinates": [
+                request["location"]["longitude"],
+                request["location"]["latitude"],
+            ],
+        },
+        verified=False,
+        property_details_id="",
+        candle_data_id="",
+        roi_percentage=request["roi_percentage"],
+    )
+
+    # Farm Property Index
+    farm_index = FarmPropertySchema(
+        property_id=str(property_id),
+        property_type=request["property_type"],
+        plot_area=request["plot_area"],
+        length=request["length"],
+        breadth=request["breadth"],
+        facing=request["facing"],
+    )
+
+    # Candle Data Index
+    candle_index = CandleDataSchema(
+        property_id=str(property_id),
+        property_gain=0,
+        candle_data=[{"timestamp": time.time(), "price": request["price"]}],
+    )
+    return (
+        jsonable_encoder(property_index),
+        constants.FARM_PROPERTY_DETAILS_SCHEMA,
+        jsonable_encoder(farm_index),
+        jsonable_encoder(candle_index),
+    )
+
+
 def add_residential_property(
     request: ResidentialPropertyRequestSchema,
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -294,90 +474,26 @@ def add_residential_property(
         decoded_token = token_decoder(token)
         user_id = decoded_token.get(constants.ID)
         request = jsonable_encoder(request)
-        residential_property_collection = db[
-            constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA
-        ]
-        # Property Details Index
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_index = PropertySchema(
-            is_investment_property=request["is_investment_property"],
-            listed_by_user_id=user_id,
-            listing_type=request["listing_type"],
-            listed_by=request["listed_by"],
-            possession_type=request["possession_type"],
-            category="residential",
-            description=request["description"],
-            project_logo="",
-            project_title=request["project_title"],
-            price=request["price"],
-            area=request["carpet_area"],
-            view_count=0,
-            video_url=request["video_url"],
-            address=request["address"],
-            location={
-                "type": "Point",
-                "coordinates": [
-                    request["location"]["longitude"],
-                    request["location"]["latitude"],
-                ],
-            },
-            region_id=request["region_id"],
-            verified=False,
-            property_details_id="",
-            candle_data_id="",
-            roi_percentage=request["roi_percentage"],
-        )
-        property_index = property_details_collection.insert_one(
-            jsonable_encoder(property_index)
-        )
-        # Residential Property Index
-        residential_index = ResidentialPropertySchema(
-            property_id=str(property_index.inserted_id),
-            property_type=request["property_type"],
-            bedrooms=request["bedrooms"],
-            bathrooms=request["bathrooms"],
-            furnishing=request["furnishing"],
-            built_up_area=request["built_up_area"],
-            carpet_area=request["carpet_area"],
-            maintenance=request["maintenance"],
-            floor_no=request["floor_no"],
-            car_parking=request["car_parking"],
-            facing=request["facing"],
-            balcony=request["balcony"],
-        )
-        residential_index = residential_property_collection.insert_one(
-            jsonable_encoder(residential_index)
-        )
-
-        # Candle Data Index
-        candle_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        candle_index = CandleDataSchema(
-            property_id=str(property_index.inserted_id),
-            property_gain=0,
-            candle_data=[{"timestamp": time.time(), "price": request["price"]}],
-        )
-        candle_index = candle_collection.insert_one(jsonable_encoder(candle_index))
-
-        # Update Property Details Index
-        property_details_collection.update_one(
-            {constants.INDEX_ID: property_index.inserted_id},
-            {
-                "$set": {
-                    "candle_data_id": str(candle_index.inserted_id),
-                    "property_details_id": str(residential_index.inserted_id),
-                }
-            },
+        # Ids are generated client-side so the inserts need no back-linking update
+        property_id = ObjectId()
+        property_writes.insert_property_documents(
+            property_id, *residential_property_documents(request, user_id, property_id)
         )
         logger.debug(
-            f"Residential Property Added Successfully at Index {residential_index.inserted_id}"
+            f"Residential Property Added Successfully at Index {property_id}"
         )
-        customer_management_service.add_notifications("property", "Residential Property", "Property Listed Successfully", str(property_index.inserted_id), token)
+        customer_management_service.add_notifications("property", "Residential Property", "Property Listed Successfully", str(property_id), token)
+
+        region_stats.record_property_added(request["region_id"], request["carpet_area"])
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
 
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
                 constants.MESSAGE: "Residential Property Added Successfully",
-                constants.ID: str(property_index.inserted_id),
+                constants.ID: str(property_id),
             },
             status_code=HTTPStatus.OK,
         )
@@ -475,6 +591,13 @@ def update_residential_property(
         logger.debug(
             f"Residential Property Updated Successfully at Index {property_id}"
         )
+        region_stats.refresh_region_stats(
+            [property_details.get(constants.REGION_ID_FIELD), request["region_id"]]
+        )
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
+        invalidate_property_detail_cache(property_id)
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={constants.MESSAGE: "Residential Property Updated Successfully"},
@@ -502,91 +625,30 @@ def add_commercial_property(
         token = token_decoder(token)
         user_id = token.get(constants.ID)
         request = jsonable_encoder(request)
-        commercial_property_collection = db[
-            constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA
-        ]
-        # Property Details Index
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_index = PropertySchema(
-            is_investment_property=request["is_investment_property"],
-            region_id=request["region_id"],
-            listed_by_user_id=user_id,
-            listing_type=request["listing_type"],
-            listed_by=request["listed_by"],
-            possession_type=request["possession_type"],
-            category="commercial",
-            description=request["description"],
-            project_logo="",
-            project_title=request["project_title"],
-            price=request["price"],
-            area=request["carpet_area"],
-            view_count=0,
-            video_url=request["video_url"],
-            address=request["address"],
-            location={
-                "type": "Point",
-                "coordinates": [
-                    request["location"]["longitude"],
-                    request["location"]["latitude"],
-                ],
-            },
-            verified=False,
-            property_details_id="",
-            candle_data_id="",
-            roi_percentage=request["roi_percentage"],
-        )
-        property_index = property_details_collection.insert_one(
-            jsonable_encoder(property_index)
+        # Ids are generated client-side so the inserts need no back-linking update
+        property_id = ObjectId()
+        property_writes.insert_property_documents(
+            property_id, *commercial_property_documents(request, user_id, property_id)
         )
 
-        # Commercial Property Index
-        commercial_index = CommercialPropertySchema(
-            property_id=str(property_index.inserted_id),
-            property_type=request["property_type"],
-            furnishing=request["furnishing"],
-            built_up_area=request["built_up_area"],
-            carpet_area=request["carpet_area"],
-            maintenance=request["maintenance"],
-            car_parking=request["car_parking"],
-            bathrooms=request["bathrooms"],
-        )
-        commercial_index = commercial_property_collection.insert_one(
-            jsonable_encoder(commercial_index)
+        logger.debug(
+            f"Commercial Property Added Successfully at Index {property_id}"
         )
 
-        # Candle Data Index
-        candle_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        candle_index = CandleDataSchema(
-            property_gain=0,
-            property_id=str(property_index.inserted_id),
-            candle_data=[{"timestamp": time.time(), "price": request["price"]}],
-        )
+        customer_management_service.add_notifications("property", "Commercial Property", "Property Listed Successfully", str(property_id), token)
 
-        candle_index = candle_collection.insert_one(jsonable_encoder(candle_index))
 
-        # Update Property Details Index
-        property_details_collection.update_one(
-            {constants.INDEX_ID: property_index.inserted_id},
-            {
-                "$set": {
-                    "candle_data_id": str(candle_index.inserted_id),
-                    "property_details_id": str(commercial_index.inserted_id),
-                }
-            },
-        )
-
-        logger.debug(
-            f"Commercial Property Added Successfully at Index {commercial_index.inserted_id}"
-        )
-
-        customer_management_service.add_notifications("property", "Commercial Property", "Property Listed Successfully", str(property_index.inserted_id), token)
+        region_stats.record_property_added(request["region_id"], request["carpet_area"])
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
 
 
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
                 constants.MESSAGE: "Commercial Property Added Successfully",
-                constants.ID: str(property_index.inserted_id),
+                constants.ID: str(property_id),
             },
             status_code=HTTPStatus.OK,
         )
@@ -680,6 +742,14 @@ def update_commercial_property(
 
         logger.debug(f"Commercial Property Updated Successfully at Index {property_id}")
 
+        region_stats.refresh_region_stats(
+            [property_details.get(constants.REGION_ID_FIELD), request["region_id"]]
+        )
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
+        invalidate_property_detail_cache(property_id)
+
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={constants.MESSAGE: "Commercial Property Updated Successfully"},
@@ -708,84 +778,28 @@ def add_farm_property(
         token = token_decoder(token)
         user_id = token.get(constants.ID)
         request = jsonable_encoder(request)
-        farm_property_collection = db[constants.FARM_PROPERTY_DETAILS_SCHEMA]
-        # Property Details Index
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_index = PropertySchema(
-            is_investment_property=request["is_investment_property"],
-            region_id=request["region_id"],
-            listed_by_user_id=user_id,
-            listing_type=request["listing_type"],
-            listed_by=request["listed_by"],
-            possession_type=request["possession_type"],
-            category="farm",
-            description=request["description"],
-            project_logo="",
-            project_title=request["project_title"],
-            price=request["price"],
-            area=request["plot_area"],
-            view_count=0,
-            video_url="",
-            address=request["address"],
-            location={
-                "type": "Point",
-                "coordinates": [
-                    request["location"]["longitude"],
-                    request["location"]["latitude"],
-                ],
-            },
-            verified=False,
-            property_details_id="",
-            candle_data_id="",
-            roi_percentage=request["roi_percentage"],
-        )
-        property_index = property_details_collection.insert_one(
-            jsonable_encoder(property_index)
-        )
-
-        # Farm Property Index
-        farm_index = FarmPropertySchema(
-            property_id=str(property_index.inserted_id),
-            property_type=request["property_type"],
-            plot_area=request["plot_area"],
-            length=request["length"],
-            breadth=request["breadth"],
-            facing=request["facing"],
-        )
-        farm_index = farm_property_collection.insert_one(jsonable_encoder(farm_index))
-
-        # Candle Data Index
-        candle_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        candle_index = CandleDataSchema(
-            property_id=str(property_index.inserted_id),
-            property_gain=0,
-            candle_data=[{"timestamp": time.time(), "price": request["price"]}],
-        )
-
-        candle_index = candle_collection.insert_one(jsonable_encoder(candle_index))
-
-        # Update Property Details Index
-        property_details_collection.update_one(
-            {constants.INDEX_ID: property_index.inserted_id},
-            {
-                "$set": {
-                    "candle_data_id": str(candle_index.inserted_id),
-                    "property_details_id": str(farm_index.inserted_id),
-                }
-            },
+        # Ids are generated client-side so the inserts need no back-linking update
+        property_id = ObjectId()
+        property_writes.insert_property_documents(
+            property_id, *farm_property_documents(request, user_id, property_id)
         )
 
         logger.debug(
-            f"Farm Property Added Successfully at Index {farm_index.inserted_id}"
+            f"Farm Property Added Successfully at Index {property_id}"
         )
 
-        customer_management_service.add_notifications("property", "Farm Property", "Property Listed Successfully", str(property_index.inserted_id), token)
+        customer_management_service.add_notifications("property", "Farm Property", "Property Listed Successfully", str(property_id), token)
+
+        region_stats.record_property_added(request["region_id"], request["plot_area"])
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
 
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
                 constants.MESSAGE: "Farm Property Added Successfully",
-                constants.ID: str(property_index.inserted_id),
+                constants.ID: str(property_id),
             },
             status_code=HTTPStatus.OK,
         )
@@ -877,6 +891,14 @@ def update_farm_property(
 
         logger.debug(f"Farm Property Updated Successfully at Index {property_id}")
 
+        region_stats.refresh_region_stats(
+            [property_details.get(constants.REGION_ID_FIELD), request["region_id"]]
+        )
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
+        invalidate_property_detail_cache(property_id)
+
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={constants.MESSAGE: "Farm Property Updated Successfully"},
@@ -895,24 +917,262 @@ def update_farm_property(
     return response
 
 
-def update_property_view_count(property_id):
-    logger.debug("Inside Update View Count Of Property Service")
+PROPERTY_IMPORT_CATEGORIES = {
+    Category.RESIDENTIAL.value: (ResidentialPropertyRequestSchema, residential_property_documents),
+    Category.COMMERCIAL.value: (CommercialPropertyRequestSchema, commercial_property_documents),
+    Category.FARM.value: (FarmPropertyRequestSchema, farm_property_documents),
+}
+
+
+def validation_errors(e):
+    if hasattr(e, "errors"):
+        return [
+            f"{'.'.join(str(part) for part in error.get('loc', ()))}: {error.get('msg')}"
+            for error in e.errors()
+        ]
+    return [str(e)]
+
+
+def import_property_row(row, user_id):
+    """Validate one upload row; returns (document set, None) or (None, errors)."""
+    category = row.pop(constants.CATEGORY_FIELD, None)
+    if category not in PROPERTY_IMPORT_CATEGORIES:
+        return None, [
+            f"category: must be one of {list(PROPERTY_IMPORT_CATEGORIES)}"
+        ]
+    request_schema, build_documents = PROPERTY_IMPORT_CATEGORIES[category]
     try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_details = property_details_collection.find_one(
-            {constants.INDEX_ID: ObjectId(property_id)}
-        )
-        if property_details is None:
+        request = jsonable_encoder(request_schema(**row))
+    except Exception as e:
+        return None, validation_errors(e)
+    property_id = ObjectId()
+    document_set = property_writes.property_document_set(
+        property_id, *build_documents(request, user_id, property_id)
+    )
+    return document_set, None
+
+
+def write_property_import_chunk(job_id, chunk, errors):
+    """
+    Bulk insert one chunk of validated rows and record it on the job.
+    Returns the (property_id, region_id) pairs that were written.
+    """
+    failed = property_writes.bulk_insert_property_documents(
+        [document_set for _, document_set in chunk]
+    )
+    imported = []
+    for row_number, document_set in chunk:
+        property_document = document_set[-1][1]
+        property_id = property_document[constants.INDEX_ID]
+        if property_id in failed:
+            errors.append({"row": row_number, "errors": [failed[property_id]]})
+            continue
+        imported.append((property_id, property_document.get(constants.REGION_ID_FIELD)))
+    property_import.update_import_job(
+        job_id, imported=len(imported), errors=errors,
+        status=PropertyImportStatus.RUNNING.value,
+    )
+    return imported
+
+
+def run_property_import(job_id, path, file_format, user_id, token):
+    """
+    Background task: stream the spooled upload, validate each row against
+    its category's request schema and write PROPERTY_IMPORT_CHUNK_SIZE
+    listings per bulk_write. Derived state (region stats, text index,
+    similarity queue) is refreshed once at the end instead of per row.
+    """
+    logger.debug(f"Inside Run Property Import for Job Id: {job_id}")
+    imported = []
+    try:
+        property_import.update_import_job(job_id, status=PropertyImportStatus.RUNNING.value)
+        chunk, errors = [], []
+        for row_number, row, error in property_import.iter_rows(path, file_format):
+            if error is None:
+                document_set, row_errors = import_property_row(row, user_id)
+            else:
+                document_set, row_errors = None, [error]
+            if row_errors:
+                errors.append({"row": row_number, "errors": row_errors})
+            else:
+                chunk.append((row_number, document_set))
+            # Error rows count too, so a file of bad rows does not build up
+            # an unbounded error list before the next write.
+            if len(chunk) + len(errors) >= constants.PROPERTY_IMPORT_CHUNK_SIZE:
+                imported.extend(write_property_import_chunk(job_id, chunk, errors))
+                chunk, errors = [], []
+        if chunk or errors:
+            imported.extend(write_property_import_chunk(job_id, chunk, errors))
+        status = PropertyImportStatus.COMPLETED.value
+    except Exception as e:
+        logger.error(f"Error in Run Property Import for Job Id {job_id}: {e}")
+        property_import.update_import_job(job_id, message=str(e))
+        status = PropertyImportStatus.FAILED.value
+    finally:
+        os.remove(path)
+
+    if imported:
+        # The listings are already written; a failure here must not leave
+        # the job stuck in RUNNING.
+        try:
+            region_stats.refresh_region_stats(region_id for _, region_id in imported)
+            invalidate_regions_cache()
+            property_text_index.rebuild_property_text_index()
+            similarity_engine.mark_properties_changed(property_id for property_id, _ in imported)
+            customer_management_service.add_notifications(
+                "property", "Property Import", f"{len(imported)} Properties Listed Successfully", job_id, token
+            )
+        except Exception as e:
+            logger.error(f"Error Refreshing Derived State for Property Import Job {job_id}: {e}")
+            property_import.update_import_job(
+                job_id, message=f"Properties imported but derived state refresh failed: {e}"
+            )
+    property_import.update_import_job(job_id, status=status)
+    logger.debug(f"Property Import Job {job_id} {status} with {len(imported)} properties")
+
+
+def import_properties(
+    file: UploadFile,
+    background_tasks: BackgroundTasks,
+    token: Annotated[str, Depends(oauth2_scheme)],
+):
+    logger.debug("Inside Import Properties Service")
+    try:
+        token_details = token_decoder(token)
+        user_id = token_details.get(constants.ID)
+        file_format = property_import.detect_format(file.filename, file.content_type)
+        if file_format is None:
             response = admin_property_management_schemas.ResponseMessage(
                 type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: f"Property doesn't Found!"},
+                data={constants.MESSAGE: "Upload must be a .ndjson or .csv file"},
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             return response
-        property_details_collection.update_one(
-            {constants.INDEX_ID: ObjectId(property_id)},
-            {"$inc": {"view_count": 1}},
+
+        # The upload is closed once the response is sent, so it is copied
+        # to a file the background task owns.
+        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_format}") as spooled:
+            shutil.copyfileobj(file.file, spooled)
+        job_id = property_import.create_import_job(user_id, file_format, file.filename)
+        background_tasks.add_task(
+            run_property_import, job_id, spooled.name, file_format, user_id, token
+        )
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data={constants.MESSAGE: "Property Import Started", "job_id": job_id},
+            status_code=HTTPStatus.ACCEPTED,
+        )
+    except Exception as e:
+        logger.error(f"Error in Import Properties Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Import Properties Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
         )
+    logger.debug("Returning From the Import Properties Service")
+    return response
+
+
+def get_property_import_job(
+    job_id: str,
+    token: Annotated[str, Depends(oauth2_scheme)],
+):
+    logger.debug("Inside Get Property Import Job Service")
+    try:
+        token_details = token_decoder(token)
+        user_id = token_details.get(constants.ID)
+        job = property_import.get_import_job(job_id, user_id)
+        if job is None:
+            response = admin_property_management_schemas.ResponseMessage(
+                type=constants.HTTP_RESPONSE_FAILURE,
+                data={constants.MESSAGE: "Import Job Not Found"},
+                status_code=HTTPStatus.NOT_FOUND,
+            )
+            return response
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data=job,
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Get Property Import Job Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Get Property Import Job Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Get Property Import Job Service")
+    return response
+
+
+def get_media_access(
+    http_response: Response,
+    token: Annotated[str, Depends(oauth2_scheme)],
+):
+    """
+    Hand out the CloudFront wildcard-policy grants for listing media. In
+    signed_cookie mode listing endpoints return unsigned media URLs and the
+    client loads them with these cookies, or appends a grant's `query` to
+    URLs under its prefix when it cannot keep cookies.
+    """
+    logger.debug("Inside Get Media Access Service")
+    try:
+        token_decoder(token)
+        if constants.CLOUDFRONT_MEDIA_DELIVERY_MODE != core_cloudfront.SIGNED_COOKIE_MODE:
+            response = admin_property_management_schemas.ResponseMessage(
+                type=constants.HTTP_RESPONSE_SUCCESS,
+                data={"mode": constants.CLOUDFRONT_MEDIA_DELIVERY_MODE, "grants": []},
+                status_code=HTTPStatus.OK,
+            )
+            return response
+        grants = core_cloudfront.get_media_grants()
+        for grant in grants:
+            for name, value in grant["cookies"].items():
+                http_response.set_cookie(
+                    key=name,
+                    value=value,
+                    expires=datetime.utcfromtimestamp(grant["expires_at"]).strftime(
+                        "%a, %d %b %Y %H:%M:%S GMT"
+                    ),
+                    path=grant["path"],
+                    domain=constants.CLOUDFRONT_COOKIE_DOMAIN,
+                    secure=True,
+                    httponly=True,
+                    samesite="none",
+                )
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data={
+                "mode": constants.CLOUDFRONT_MEDIA_DELIVERY_MODE,
+                "base_url": constants.CLOUDFRONT_URL,
+                "grants": [
+                    {
+                        "prefix": grant["prefix"],
+                        "expires_at": grant["expires_at"],
+                        "query": grant["query"],
+                    }
+                    for grant in grants
+                ],
+            },
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Get Media Access Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Get Media Access Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Get Media Access Service")
+    return response
+
+
+def update_property_view_count(property_id):
+    logger.debug("Inside Update View Count Of Property Service")
+    try:
+        # Buffered and applied by the view count flush cron; an id with no
+        # property behind it just matches nothing at flush time.
+        view_counter.record(property_id)
         logger.debug(
             f"View Count of Property Updated Successfully at Index {property_id}"
         )
@@ -934,11 +1194,17 @@ def update_property_view_count(property_id):
     return response
 
 
-def get_list_of_featured_properties(
-    latitude: float, longitude: float, per_page: int, page_number: int
+async def get_list_of_featured_properties(
+    latitude: float,
+    longitude: float,
+    per_page: int,
+    page_number: int,
+    cursor: str = None,
+    include_total: bool = True,
 ):
     logger.debug("Inside Get List Of Featured Properties Service")
     try:
+        page = KeysetPage([(constants.CREATED_AT_FIELD, -1)], page_number, per_page, cursor)
         location = {"latitude": latitude, "longitude": longitude}
         region_id = get_nearest_region_id(location)
         if region_id is None:
@@ -949,8 +1215,8 @@ def get_list_of_featured_properties(
             )
             return response
         region_id = region_id[0].get(constants.INDEX_ID)
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
-        region = region_collection.find_one({constants.INDEX_ID: region_id})
+        region_collection = async_db[constants.REGION_DETAILS_SCHEMA]
+        region = await region_collection.find_one({constants.INDEX_ID: region_id})
 
         if region is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -961,33 +1227,38 @@ def get_list_of_featured_properties(
             return response
 
         featured_properties = region.get(constants.FEATURED_PROPERTIES_FIELD)
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
 
         filter_by = [ObjectId(property_id) for property_id in featured_properties]
-        properties = list(
+        properties = await (
             property_details_collection.find(
-                {
-                    constants.INDEX_ID: {"$in": filter_by},
-                    constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
-                },
-                {
+                page.filter(
+                    {
+                        constants.INDEX_ID: {"$in": filter_by},
+                        constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
+                    }
+                ),
+                page.projection({
                     constants.INDEX_ID: 1,
                     constants.PROJECT_TITLE_FIELD: 1,
                     constants.PRICE_FIELD: 1,
                     constants.IMAGES_FIELD: 1,
                     constants.ADDRESS_FIELD: 1,
                     constants.LOCATION_FIELD: 1,
-                },
+                }),
             )
-            .sort(constants.CREATED_AT_FIELD, -1)
-            .skip((page_number - 1) * per_page)
+            .sort(page.sort_spec)
+            .skip(page.skip)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
+        document_count = await count_documents_cached(
+            property_details_collection,
             {
                 constants.INDEX_ID: {"$in": filter_by},
                 constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
-            }
+            },
+            include_total,
         )
         response_list = []
         for property in properties:
@@ -1014,6 +1285,7 @@ def get_list_of_featured_properties(
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(properties),
             },
             status_code=HTTPStatus.OK,
         )
@@ -1030,8 +1302,12 @@ def get_list_of_featured_properties(
     return response
 
 
-def get_list_of_recommended_properties(
-    latitude: float, longitude: float, per_page: int, page_number: int
+async def get_list_of_recommended_properties(
+    latitude: float,
+    longitude: float,
+    per_page: int,
+    page_number: int,
+    include_total: bool = True,
 ):
     logger.debug("Inside Get List Of Recommended Properties Service")
     try:
@@ -1045,8 +1321,8 @@ def get_list_of_recommended_properties(
             )
             return response
         region_id = region_id[0].get(constants.INDEX_ID)
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
-        region = region_collection.find_one({constants.INDEX_ID: region_id})
+        region_collection = async_db[constants.REGION_DETAILS_SCHEMA]
+        region = await region_collection.find_one({constants.INDEX_ID: region_id})
 
         if region is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -1055,9 +1331,9 @@ def get_list_of_recommended_properties(
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             return response
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
+        region_collection = async_db[constants.REGION_DETAILS_SCHEMA]
 
-        region = region_collection.find_one({constants.INDEX_ID: ObjectId(region_id)})
+        region = await region_collection.find_one({constants.INDEX_ID: ObjectId(region_id)})
 
         if region is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -1068,10 +1344,10 @@ def get_list_of_recommended_properties(
             return response
 
         recommended_properties = region.get(constants.RECOMMENDED_PROPERTIES_FIELD)
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
 
         filter_by = [ObjectId(property_id) for property_id in recommended_properties]
-        properties = list(
+        properties = await (
             property_details_collection.find(
                 {
                     constants.INDEX_ID: {"$in": filter_by},
@@ -1091,12 +1367,15 @@ def get_list_of_recommended_properties(
             .sort(constants.CREATED_AT_FIELD, -1)
             .skip((page_number - 1) * per_page)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
+        document_count = await count_documents_cached(
+            property_details_collection,
             {
                 constants.INDEX_ID: {"$in": filter_by},
                 constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
-            }
+            },
+            include_total,
         )
         response_list = []
         for property in properties:
@@ -1141,11 +1420,104 @@ def get_list_of_recommended_properties(
     return response
 
 
-def get_list_of_most_viewed_properties(per_page: int, page_number: int):
+async def get_my_recommendations(
+    latitude: float,
+    longitude: float,
+    per_page: int,
+    page_number: int,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    include_total: bool = True,
+):
+    logger.debug("Inside Get My Recommendations Service")
+    try:
+        token = token_decoder(token)
+        user_id = token.get(constants.ID)
+        recommended = await recommendations.recommend_for_user(user_id)
+
+        property_loader = BatchLoader(
+            constants.PROPERTY_DETAILS_SCHEMA,
+            {
+                constants.PROJECT_TITLE_FIELD: 1,
+                constants.PRICE_FIELD: 1,
+                constants.IMAGES_FIELD: {"$slice": 4},
+                constants.ADDRESS_FIELD: 1,
+                constants.LISTED_BY_FIELD: 1,
+                constants.CREATED_AT_FIELD: 1,
+                constants.LOCATION_FIELD: 1,
+                constants.STATUS_FIELD: 1,
+            },
+        )
+        property_loader.add_many(property_id for property_id, _ in recommended)
+        await property_loader.load_async()
+        active_properties = []
+        for property_id, score in recommended:
+            property = property_loader.get(property_id)
+            if property and property.get(constants.STATUS_FIELD) == PropertyStatus.ACTIVE.value:
+                active_properties.append((property, score))
+
+        if not active_properties:
+            # Cold start: nothing to go on yet, serve the region's curated list.
+            logger.debug(f"No personalised recommendations for User Id: {user_id}")
+            response = await get_list_of_recommended_properties(
+                latitude=latitude,
+                longitude=longitude,
+                per_page=per_page,
+                page_number=page_number,
+                include_total=include_total,
+            )
+            if response.type == constants.HTTP_RESPONSE_SUCCESS:
+                response.data["source"] = "region"
+            return response
+
+        response_list = []
+        for property, score in active_properties[
+            (page_number - 1) * per_page : page_number * per_page
+        ]:
+            response_list.append(
+                {
+                    constants.ID: str(property[constants.INDEX_ID]),
+                    constants.PROJECT_TITLE_FIELD: property[constants.PROJECT_TITLE_FIELD],
+                    constants.ADDRESS_FIELD: property[constants.ADDRESS_FIELD],
+                    constants.PRICE_FIELD: property[constants.PRICE_FIELD],
+                    constants.IMAGES_FIELD: [
+                        core_cloudfront.cloudfront_sign(image_key)
+                        for image_key in property.get(constants.IMAGES_FIELD) or []
+                    ],
+                    constants.LISTED_BY_FIELD: property[constants.LISTED_BY_FIELD],
+                    constants.CREATED_AT_FIELD: property[constants.CREATED_AT_FIELD],
+                    constants.LOCATION_FIELD: property[constants.LOCATION_FIELD],
+                    "score": round(score, 4),
+                }
+            )
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data={
+                "properties": response_list,
+                "document_count": len(active_properties),
+                "page_number": page_number,
+                "per_page": per_page,
+                "source": "personalized",
+            },
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Get My Recommendations Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Get My Recommendations Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Get My Recommendations Service")
+    return response
+
+
+async def get_list_of_most_viewed_properties(
+    per_page: int, page_number: int, include_total: bool = True
+):
     logger.debug("Inside Get List Of Most Viewed Properties Service")
     try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        properties = list(
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        properties = await (
             property_details_collection.find(
                 {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value},
                 {
@@ -1163,9 +1535,12 @@ def get_list_of_most_viewed_properties(per_page: int, page_number: int):
             .sort(constants.VIEW_COUNT_FIELD, -1)
             .skip((page_number - 1) * per_page)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
-            {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value}
+        document_count = await count_documents_cached(
+            property_details_collection,
+            {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value},
+            include_total,
         )
         response_list = []
         for property in properties:
@@ -1211,8 +1586,12 @@ def get_list_of_most_viewed_properties(per_page: int, page_number: int):
     return response
 
 
-def get_list_of_top_properties(
-    latitude: float, longitude: float, per_page: int, page_number: int
+async def get_list_of_top_properties(
+    latitude: float,
+    longitude: float,
+    per_page: int,
+    page_number: int,
+    include_total: bool = True,
 ):
     logger.debug("Inside Get List Of Top Properties Service")
     try:
@@ -1226,8 +1605,8 @@ def get_list_of_top_properties(
             )
             return response
         region_id = region_id[0].get(constants.INDEX_ID)
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
-        region = region_collection.find_one({constants.INDEX_ID: region_id})
+        region_collection = async_db[constants.REGION_DETAILS_SCHEMA]
+        region = await region_collection.find_one({constants.INDEX_ID: region_id})
 
         if region is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -1236,9 +1615,9 @@ def get_list_of_top_properties(
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             return response
-        region_collection = db[constants.REGION_DETAILS_SCHEMA]
+        region_collection = async_db[constants.REGION_DETAILS_SCHEMA]
 
-        region = region_collection.find_one({constants.INDEX_ID: ObjectId(region_id)})
+        region = await region_collection.find_one({constants.INDEX_ID: ObjectId(region_id)})
 
         if region is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -1249,9 +1628,9 @@ def get_list_of_top_properties(
             return response
 
         top_properties = region.get(constants.TOP_PROPERTIES_FIELD)
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
         filter_by = [ObjectId(property_id) for property_id in top_properties]
-        properties = list(
+        properties = await (
             property_details_collection.find(
                 {
                     constants.INDEX_ID: {"$in": filter_by},
@@ -1269,12 +1648,15 @@ def get_list_of_top_properties(
             .sort(constants.CREATED_AT_FIELD, -1)
             .skip((page_number - 1) * per_page)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
+        document_count = await count_documents_cached(
+            property_details_collection,
             {
                 constants.INDEX_ID: {"$in": filter_by},
                 constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
-            }
+            },
+            include_total,
         )
         response_list = []
         for property in properties:
@@ -1317,41 +1699,58 @@ def get_list_of_top_properties(
     return response
 
 
-def get_nearby_properties(
-    latitude: float, longitude: float, per_page: int, page_number: int
+async def get_nearby_properties(
+    latitude: float,
+    longitude: float,
+    per_page: int,
+    page_number: int,
+    include_total: bool = True,
+    max_distance: float = None,
 ):
     logger.debug("Inside Get List Of Nearby Properties Service")
     try:
-        location = {"latitude": latitude, "longitude": longitude}
-
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        location_filter = {
-            constants.LOCATION_FIELD: SON(
-                [
-                    (
-                        "$nearSphere",
-                        [location.get("longitude"), location.get("latitude")],
-                    ),
-                ]
-            ),
-            constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        geo_near_stage = {
+            "near": {"type": "Point", "coordinates": [longitude, latitude]},
+            "distanceField": constants.DISTANCE_FIELD,
+            "spherical": True,
+            "query": {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value},
         }
-        properties = list(
-            property_details_collection.find(
-                location_filter,
+        if max_distance is not None:
+            # Metres, since `near` is a GeoJSON point on a 2dsphere index.
+            geo_near_stage["maxDistance"] = max_distance
+
+        # Page and total come back from one $geoNear pass; the count branch
+        # is left out entirely for include_total=False.
+        facet_stage = {
+            "properties": [
+                {"$skip": (page_number - 1) * per_page},
+                {"$limit": per_page},
                 {
-                    constants.INDEX_ID: 1,
-                    constants.IMAGES_FIELD: 1,
-                    constants.PRICE_FIELD: 1,
-                    constants.ADDRESS_FIELD: 1,
-                    constants.LOCATION_FIELD: 1,
+                    "$project": {
+                        constants.INDEX_ID: 1,
+                        constants.IMAGES_FIELD: 1,
+                        constants.PRICE_FIELD: 1,
+                        constants.ADDRESS_FIELD: 1,
+                        constants.LOCATION_FIELD: 1,
+                        constants.DISTANCE_FIELD: 1,
+                    }
                 },
-            )
-            .skip((page_number - 1) * per_page)
-            .limit(per_page)
-        )
+            ],
+        }
+        if include_total:
+            facet_stage["document_count"] = [{"$count": "count"}]
+
+        nearby_result = await property_details_collection.aggregate(
+            [{"$geoNear": geo_near_stage}, {"$facet": facet_stage}]
+        ).to_list(length=1)
+        nearby_result = nearby_result[0] if nearby_result else {}
+        properties = nearby_result.get("properties", [])
+        document_count = None
+        if include_total:
+            count_result = nearby_result.get("document_count", [])
+            document_count = count_result[0]["count"] if count_result else 0
 
-        document_count = len(list(property_details_collection.find(location_filter)))
         response_list = []
         for property in properties:
             response_list.append(
@@ -1364,6 +1763,7 @@ def get_nearby_properties(
                     constants.ADDRESS_FIELD: property[constants.ADDRESS_FIELD],
                     constants.PRICE_FIELD: property[constants.PRICE_FIELD],
                     constants.LOCATION_FIELD: property[constants.LOCATION_FIELD],
+                    constants.DISTANCE_FIELD: round(property[constants.DISTANCE_FIELD], 2),
                 }
             )
 
@@ -1374,19 +1774,20 @@ def get_nearby_properties(
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "max_distance": max_distance,
             },
             status_code=HTTPStatus.OK,
         )
     except Exception as e:
-        logger.error(f"Error in Get List Of Recommended Properties Service: {e}")
+        logger.error(f"Error in Get Nearby Properties Service: {e}")
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_FAILURE,
             data={
-                constants.MESSAGE: f"Error in Get List Of Recommended Properties Service: {e}"
+                constants.MESSAGE: f"Error in Get Nearby Properties Service: {e}"
             },
             status_code=e.status_code if hasattr(e, "status_code") else 500,
         )
-    logger.debug("Returning From the Get List Of Recommended Properties Service")
+    logger.debug("Returning From the Get Nearby Properties Service")
     return response
 
 
@@ -1437,6 +1838,7 @@ def add_property_images(
             {constants.INDEX_ID: ObjectId(property_id)},
             {"$set": {constants.IMAGES_FIELD: images_list}},
         )
+        invalidate_property_detail_cache(property_id)
         logger.debug(f"Images Added Successfully to Property at Index {property_id}")
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
@@ -1540,6 +1942,7 @@ def update_property_images(
             {constants.INDEX_ID: ObjectId(property_id)},
             {"$set": {constants.IMAGES_FIELD: images_list}},
         )
+        invalidate_property_detail_cache(property_id)
         logger.debug(f"Images Added Successfully to Property at Index {property_id}")
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
@@ -1570,11 +1973,10 @@ def add_seed_property(
         else:
             user_id = str(parnter_user_details.get(constants.INDEX_ID))
         request = jsonable_encoder(request)
-        residential_property_collection = db[
-            constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA
-        ]
+        # Ids are generated client-side so the inserts need no back-linking update
+        property_id = ObjectId()
+
         # Property Details Index
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
         property_index = PropertySchema(
             is_investment_property=request["is_investment_property"],
             listed_by_user_id=user_id,
@@ -1602,12 +2004,9 @@ def add_seed_property(
             candle_data_id="",
             roi_percentage=request["roi_percentage"],
         )
-        property_index = property_details_collection.insert_one(
-            jsonable_encoder(property_index)
-        )
         # Residential Property Index
         residential_index = ResidentialPropertySchema(
-            property_id=str(property_index.inserted_id),
+            property_id=str(property_id),
             property_type=request["property_type"],
             bedrooms=request["bedrooms"],
             bathrooms=request["bathrooms"],
@@ -1620,32 +2019,26 @@ def add_seed_property(
             facing=request["facing"],
             balcony=request["balcony"],
         )
-        residential_index = residential_property_collection.insert_one(
-            jsonable_encoder(residential_index)
-        )
 
         # Candle Data Index
-        candle_collection = db[constants.CANDLE_DETAILS_SCHEMA]
         candle_index = CandleDataSchema(
-            property_id=str(property_index.inserted_id),
+            property_id=str(property_id),
             property_gain=0,
             candle_data=[{"timestamp": time.time(), "price": request["price"]}],
         )
-        candle_index = candle_collection.insert_one(jsonable_encoder(candle_index))
-
-        # Update Property Details Index
-        property_details_collection.update_one(
-            {constants.INDEX_ID: property_index.inserted_id},
-            {
-                "$set": {
-                    "candle_data_id": str(candle_index.inserted_id),
-                    "property_details_id": str(residential_index.inserted_id),
-                }
-            },
+        property_writes.insert_property_documents(
+            property_id,
+            jsonable_encoder(property_index),
+            constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+            jsonable_encoder(residential_index),
+            jsonable_encoder(candle_index),
         )
         logger.debug(
-            f"Residential Property Added Successfully at Index {residential_index.inserted_id}"
+            f"Residential Property Added Successfully at Index {property_id}"
         )
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={constants.MESSAGE: "Residential Property Added Successfully"},
@@ -1706,6 +2099,7 @@ def add_project_logo(
             {constants.INDEX_ID: ObjectId(property_id)},
             {"$set": {constants.PROJECT_LOGO_FIELD: upload_response["data"]["key"]}},
         )
+        invalidate_property_detail_cache(property_id)
 
         logger.debug(
             f"Project Logo Added Successfully to Property at Index {property_id}"
@@ -1726,13 +2120,156 @@ def add_project_logo(
     return response
 
 
+PROPERTY_INFO_SCHEMAS = {
+    "residential": constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+    "commercial": constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA,
+    "farm": constants.FARM_PROPERTY_DETAILS_SCHEMA,
+}
+
+# Signed URLs in a cached detail must outlive the entry, so the TTL is capped
+# well inside the CloudFront signature lifetime.
+property_detail_cache = TimedCache(
+    min(
+        constants.PROPERTY_DETAIL_CACHE_TTL_SECONDS,
+        constants.CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS // 2,
+    )
+)
+
+
+def invalidate_property_detail_cache(property_id):
+    property_detail_cache.invalidate(str(property_id))
+
+
+def lookup_by_string_id(from_collection, local_field, as_field, category=None):
+    # Detail and candle ids are stored as strings on the property document.
+    conditions = [{"$eq": [f"${constants.INDEX_ID}", "$$lookup_id"]}]
+    if category is not None:
+        conditions.append({"$eq": ["$$category", category]})
+    return {
+        "$lookup": {
+            "from": from_collection,
+            "let": {
+                "lookup_id": {
+                    "$convert": {
+                        "input": f"${local_field}",
+                        "to": "objectId",
+                        "onError": None,
+                        "onNull": None,
+                    }
+                },
+                "category": f"${constants.CATEGORY_FIELD}",
+            },
+            "pipeline": [
+                {"$match": {"$expr": {"$and": conditions}}},
+                {"$project": {constants.INDEX_ID: 0}},
+                {"$limit": 1},
+            ],
+            "as": as_field,
+        }
+    }
+
+
+def build_property_detail_pipeline(match_filter):
+    pipeline = [{"$match": match_filter}]
+    for category, collection_name in PROPERTY_INFO_SCHEMAS.items():
+        pipeline.append(
+            lookup_by_string_id(
+                collection_name,
+                constants.PROPERTY_DETAILS_ID_FIELD,
+                f"{category}_info",
+                category,
+            )
+        )
+    pipeline.append(
+        lookup_by_string_id(
+            constants.CANDLE_DETAILS_SCHEMA, constants.CANDLE_DATA_ID_FIELD, "candle_details"
+        )
+    )
+    return pipeline
+
+
+def property_media_keys(property_details):
+    media_keys = list(property_details.get(constants.IMAGES_FIELD) or [])
+    if property_details.get(constants.PROJECT_LOGO_FIELD):
+        media_keys.append(property_details[constants.PROJECT_LOGO_FIELD])
+    if property_details.get(constants.DOCUMENT_TITLE_FIELD):
+        media_keys.append(property_details[constants.PROPERTY_DOCUMENT_FIELD])
+    if property_details.get(constants.BROCHURE_TITLE_FIELD):
+        media_keys.append(property_details[constants.PROPERTY_BROCHURE_FIELD])
+    return media_keys
+
+
+def sign_media_keys(media_keys):
+    # Each distinct S3 key is signed once, however many documents share it.
+    return core_cloudfront.sign_many(media_keys)
+
+
+def assemble_property_detail(property_details, signed_urls):
+    """
+    Shape one document from build_property_detail_pipeline into the detail
+    response. Returns (property_details, None), or (None, error_message)
+    when the category details or the candle data are missing.
+    """
+    property_info = {
+        category: property_details.pop(f"{category}_info")
+        for category in PROPERTY_INFO_SCHEMAS
+    }
+    candle_details = property_details.pop("candle_details")
+
+    property_details[constants.IMAGES_FIELD] = [
+        signed_urls[image_key]
+        for image_key in property_details.get(constants.IMAGES_FIELD) or []
+    ]
+
+    if property_details.get(constants.PROJECT_LOGO_FIELD):
+        property_details[constants.PROJECT_LOGO_FIELD] = signed_urls[
+            property_details[constants.PROJECT_LOGO_FIELD]
+        ]
+
+    category = property_details.get(constants.CATEGORY_FIELD)
+    if category in PROPERTY_INFO_SCHEMAS:
+        if not property_info[category]:
+            return None, "Property doesn't Found!"
+        property_details["property_info"] = property_info[category][0]
+    else:
+        property_details["property_info"] = {}
+
+    if not candle_details:
+        return None, "Candle data doesn't Found!"
+    property_details["candle_data"] = candle_details[0]["candle_data"]
+
+    if property_details.get(constants.DOCUMENT_TITLE_FIELD):
+        property_details[constants.PROPERTY_DOCUMENT_FIELD] = signed_urls[
+            property_details[constants.PROPERTY_DOCUMENT_FIELD]
+        ]
+
+    if property_details.get(constants.BROCHURE_TITLE_FIELD):
+        property_details[constants.PROPERTY_BROCHURE_FIELD] = signed_urls[
+            property_details[constants.PROPERTY_BROCHURE_FIELD]
+        ]
+
+    property_details[constants.ID] = str(property_details[constants.INDEX_ID])
+    del property_details[constants.INDEX_ID]
+    return property_details, None
+
+
 def get_property_by_id(property_id: str):
     logger.debug("Inside Get Property By Id Service")
     try:
+        cached_property_details = property_detail_cache.get(property_id)
+        if cached_property_details is not None:
+            return admin_property_management_schemas.ResponseMessage(
+                type=constants.HTTP_RESPONSE_SUCCESS,
+                data=cached_property_details,
+                status_code=HTTPStatus.OK,
+            )
+
         property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        candle_details_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        property_details = property_details_collection.find_one(
-            {constants.INDEX_ID: ObjectId(property_id)}
+        property_details = next(
+            property_details_collection.aggregate(
+                build_property_detail_pipeline({constants.INDEX_ID: ObjectId(property_id)})
+            ),
+            None,
         )
         if property_details is None:
             response = admin_property_management_schemas.ResponseMessage(
@@ -1742,142 +2279,194 @@ def get_property_by_id(property_id: str):
             )
             return response
 
-        property_details[constants.IMAGES_FIELD] = [
-            core_cloudfront.cloudfront_sign(image_key)
-            for image_key in property_details[constants.IMAGES_FIELD]
-        ]
-
-        if property_details.get(constants.PROJECT_LOGO_FIELD):
-            property_details[
-                constants.PROJECT_LOGO_FIELD
-            ] = core_cloudfront.cloudfront_sign(
-                property_details[constants.PROJECT_LOGO_FIELD]
-            )
-
-        if property_details.get(constants.CATEGORY_FIELD) == "residential":
-            residential_property_collection = db[
-                constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA
-            ]
-            residential_property_details = residential_property_collection.find_one(
-                {
-                    constants.INDEX_ID: ObjectId(
-                        property_details[constants.PROPERTY_DETAILS_ID_FIELD]
-                    )
-                },
-                {"_id": 0},
-            )
-            if residential_property_details is None:
-                response = admin_property_management_schemas.ResponseMessage(
-                    type=constants.HTTP_RESPONSE_FAILURE,
-                    data={constants.MESSAGE: f"Property doesn't Found!"},
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-                return response
-            property_details["property_info"] = residential_property_details
-        elif property_details.get(constants.CATEGORY_FIELD) == "commercial":
-            commercial_property_collection = db[
-                constants.COMMERCIAL_PROPERTY_DETAILS_SCHEMA
-            ]
-            commercial_property_details = commercial_property_collection.find_one(
-                {
-                    constants.INDEX_ID: ObjectId(
-                        property_details[constants.PROPERTY_DETAILS_ID_FIELD]
-                    )
-                },
-                {"_id": 0},
-            )
-            if commercial_property_details is None:
-                response = admin_property_management_schemas.ResponseMessage(
-                    type=constants.HTTP_RESPONSE_FAILURE,
-                    data={constants.MESSAGE: f"Property doesn't Found!"},
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-                return response
-            property_details["property_info"] = commercial_property_details
-        elif property_details.get(constants.CATEGORY_FIELD) == "farm":
-            farm_property_collection = db[constants.FARM_PROPERTY_DETAILS_SCHEMA]
-            farm_property_details = farm_property_collection.find_one(
-                {
-                    constants.INDEX_ID: ObjectId(
-                        property_details[constants.PROPERTY_DETAILS_ID_FIELD]
-                    )
-                },
-                {"_id": 0},
-            )
-            if farm_property_details is None:
-                response = admin_property_management_schemas.ResponseMessage(
-                    type=constants.HTTP_RESPONSE_FAILURE,
-                    data={constants.MESSAGE: f"Property doesn't Found!"},
-                    status_code=HTTPStatus.BAD_REQUEST,
-                )
-                return response
-
-            property_details["property_info"] = farm_property_details
-        else:
-            property_details["property_info"] = {}
-
-        candle_data = candle_details_collection.find_one(
-            {
-                constants.INDEX_ID: ObjectId(
-                    property_details[constants.CANDLE_DATA_ID_FIELD]
-                )
-            }
+        property_details, error_message = assemble_property_detail(
+            property_details, sign_media_keys(property_media_keys(property_details))
         )
-        if candle_data is None:
+        if property_details is None:
             response = admin_property_management_schemas.ResponseMessage(
                 type=constants.HTTP_RESPONSE_FAILURE,
-                data={constants.MESSAGE: f"Candle data doesn't Found!"},
+                data={constants.MESSAGE: error_message},
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             return response
 
-        property_details["candle_data"] = candle_data["candle_data"]
+        property_detail_cache.set(property_id, property_details)
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data=property_details,
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Get Property By Id Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Get Property By Id Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Get Property By Id Service")
+    return response
+
 
-        if property_details.get(constants.DOCUMENT_TITLE_FIELD):
-            property_details[
-                constants.PROPERTY_DOCUMENT_FIELD
-            ] = core_cloudfront.cloudfront_sign(
-                property_details[constants.PROPERTY_DOCUMENT_FIELD]
+PROPERTY_CARD_PROJECTION = {
+    constants.INDEX_ID: 1,
+    constants.PROJECT_TITLE_FIELD: 1,
+    constants.PROJECT_LOGO_FIELD: 1,
+    constants.PRICE_FIELD: 1,
+    constants.IMAGES_FIELD: {"$slice": 1},
+    constants.ADDRESS_FIELD: 1,
+    constants.LOCATION_FIELD: 1,
+    constants.REGION_ID_FIELD: 1,
+    constants.CATEGORY_FIELD: 1,
+    constants.LISTING_TYPE_FIELD: 1,
+    constants.LISTED_BY_FIELD: 1,
+    constants.POSSESSOION_TYPE_FIELD: 1,
+    constants.ROI_PERCENTAGE: 1,
+    constants.STATUS_FIELD: 1,
+    constants.VIEW_COUNT_FIELD: 1,
+    constants.CREATED_AT_FIELD: 1,
+}
+
+
+def select_fields(document, fields):
+    if not fields:
+        return document
+    return {
+        field: value
+        for field, value in document.items()
+        if field == constants.ID or field in fields
+    }
+
+
+def get_properties_batch(request: BatchPropertyRequestSchema):
+    logger.debug("Inside Get Properties Batch Service")
+    try:
+        requested_ids = list(dict.fromkeys(request.property_ids))
+        object_ids = [
+            ObjectId(property_id)
+            for property_id in requested_ids
+            if ObjectId.is_valid(property_id)
+        ]
+        properties_by_id = {}
+
+        if request.representation == PropertyRepresentation.CARD.value:
+            projection = PROPERTY_CARD_PROJECTION
+            if request.fields:
+                unknown_fields = set(request.fields) - set(PROPERTY_CARD_PROJECTION) - {constants.ID}
+                if unknown_fields:
+                    response = admin_property_management_schemas.ResponseMessage(
+                        type=constants.HTTP_RESPONSE_FAILURE,
+                        data={
+                            constants.MESSAGE: f"Invalid fields for card: {sorted(unknown_fields)}"
+                        },
+                        status_code=HTTPStatus.BAD_REQUEST,
+                    )
+                    return response
+                projection = {
+                    field: PROPERTY_CARD_PROJECTION[field]
+                    for field in request.fields
+                    if field != constants.ID
+                }
+            property_cards = list(
+                db[constants.PROPERTY_DETAILS_SCHEMA].find(
+                    {constants.INDEX_ID: {"$in": object_ids}}, projection
+                )
             )
-
-        if property_details.get(constants.BROCHURE_TITLE_FIELD):
-            property_details[
-                constants.PROPERTY_BROCHURE_FIELD
-            ] = core_cloudfront.cloudfront_sign(
-                property_details[constants.PROPERTY_BROCHURE_FIELD]
+            signed_urls = sign_media_keys(
+                media_key
+                for property_card in property_cards
+                for media_key in property_media_keys(property_card)
             )
-
-        property_details[constants.ID] = str(property_details[constants.INDEX_ID])
-        del property_details[constants.INDEX_ID]
+            for property_card in property_cards:
+                if constants.IMAGES_FIELD in property_card:
+                    property_card[constants.IMAGES_FIELD] = [
+                        signed_urls[image_key]
+                        for image_key in property_card[constants.IMAGES_FIELD] or []
+                    ]
+                if property_card.get(constants.PROJECT_LOGO_FIELD):
+                    property_card[constants.PROJECT_LOGO_FIELD] = signed_urls[
+                        property_card[constants.PROJECT_LOGO_FIELD]
+                    ]
+                property_card[constants.ID] = str(property_card.pop(constants.INDEX_ID))
+                properties_by_id[property_card[constants.ID]] = property_card
+        else:
+            uncached_ids = []
+            for object_id in object_ids:
+                cached_property_details = property_detail_cache.get(str(object_id))
+                if cached_property_details is not None:
+                    properties_by_id[str(object_id)] = cached_property_details
+                else:
+                    uncached_ids.append(object_id)
+            if uncached_ids:
+                property_details_list = list(
+                    db[constants.PROPERTY_DETAILS_SCHEMA].aggregate(
+                        build_property_detail_pipeline(
+                            {constants.INDEX_ID: {"$in": uncached_ids}}
+                        )
+                    )
+                )
+                signed_urls = sign_media_keys(
+                    media_key
+                    for property_details in property_details_list
+                    for media_key in property_media_keys(property_details)
+                )
+                for property_details in property_details_list:
+                    property_details, _ = assemble_property_detail(
+                        property_details, signed_urls
+                    )
+                    if property_details is None:
+                        continue
+                    property_detail_cache.set(property_details[constants.ID], property_details)
+                    properties_by_id[property_details[constants.ID]] = property_details
+
+        response_data = [
+            select_fields(properties_by_id[property_id], request.fields)
+            for property_id in requested_ids
+            if property_id in properties_by_id
+        ]
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
-            data=property_details,
+            data={
+                "properties": response_data,
+                "missing_ids": [
+                    property_id
+                    for property_id in requested_ids
+                    if property_id not in properties_by_id
+                ],
+            },
             status_code=HTTPStatus.OK,
         )
     except Exception as e:
-        logger.error(f"Error in Get Property By Id Service: {e}")
+        logger.error(f"Error in Get Properties Batch Service: {e}")
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_FAILURE,
-            data={constants.MESSAGE: f"Error in Get Property By Id Service: {e}"},
+            data={constants.MESSAGE: f"Error in Get Properties Batch Service: {e}"},
             status_code=e.status_code if hasattr(e, "status_code") else 500,
         )
-    logger.debug("Returning From the Get Property By Id Service")
+    logger.debug("Returning From the Get Properties Batch Service")
     return response
 
 
-def get_property_list(
+async def get_property_list(
     page_number: int,
     per_page: int,
     filter_dict: dict,
     sort_dict: dict,
+    cursor: str = None,
+    include_total: bool = True,
 ):
     logger.debug("Inside Get Property List Service")
     try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        properties = list(
+        page = KeysetPage(
+            list(sort_dict.items()) if sort_dict else [(constants.CREATED_AT_FIELD, -1)],
+            page_number,
+            per_page,
+            cursor,
+        )
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        properties = await (
             property_details_collection.find(
-                filter_dict,
-                {
+                page.filter(filter_dict),
+                page.projection({
                     constants.INDEX_ID: 1,
                     constants.PROJECT_TITLE_FIELD: 1,
                     constants.ADDRESS_FIELD: 1,
@@ -1887,17 +2476,16 @@ def get_property_list(
                     constants.CREATED_AT_FIELD: 1,
                     constants.LOCATION_FIELD: 1,
                     constants.STATUS_FIELD: 1,
-                },
-            )
-            .sort(
-                [(key, value) for key, value in sort_dict.items()]
-                if sort_dict
-                else [(constants.CREATED_AT_FIELD, -1)]
+                }),
             )
-            .skip((page_number - 1) * per_page)
+            .sort(page.sort_spec)
+            .skip(page.skip)
             .limit(per_page)
+            .to_list(length=per_page)
+        )
+        document_count = await count_documents_cached(
+            property_details_collection, filter_dict, include_total
         )
-        document_count = property_details_collection.count_documents({})
         response_list = []
         for property in properties:
             response_list.append(
@@ -1926,6 +2514,7 @@ def get_property_list(
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(properties),
             },
             status_code=HTTPStatus.OK,
         )
@@ -1940,13 +2529,20 @@ def get_property_list(
     return response
 
 
-def get_property_list_by_region_id(page_number: int, per_page: int, region_id: str):
+async def get_property_list_by_region_id(
+    page_number: int,
+    per_page: int,
+    region_id: str,
+    cursor: str = None,
+    include_total: bool = True,
+):
     logger.debug("Inside Get Property List Service")
     try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        properties = list(
+        page = KeysetPage([(constants.CREATED_AT_FIELD, -1)], page_number, per_page, cursor)
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        properties = await (
             property_details_collection.find(
-                {constants.REGION_ID_FIELD: region_id},
+                page.filter({constants.REGION_ID_FIELD: region_id}),
                 {
                     constants.INDEX_ID: 1,
                     constants.PROJECT_TITLE_FIELD: 1,
@@ -1958,12 +2554,15 @@ def get_property_list_by_region_id(page_number: int, per_page: int, region_id: s
                     constants.LOCATION_FIELD: 1,
                 },
             )
-            .sort(constants.CREATED_AT_FIELD, -1)
-            .skip((page_number - 1) * per_page)
+            .sort(page.sort_spec)
+            .skip(page.skip)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
-            {constants.REGION_ID_FIELD: region_id}
+        document_count = await count_documents_cached(
+            property_details_collection,
+            {constants.REGION_ID_FIELD: region_id},
+            include_total,
         )
         response_list = []
         for property in properties:
@@ -1992,6 +2591,7 @@ def get_property_list_by_region_id(page_number: int, per_page: int, region_id: s
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(properties),
             },
             status_code=HTTPStatus.OK,
         )
@@ -2079,6 +2679,7 @@ def upload_brochure_or_project_document(
                 status_code=HTTPStatus.BAD_REQUEST,
             )
             return response
+        invalidate_property_detail_cache(property_id)
 
         logger.debug(
             f"Project Logo Added Successfully to Property at Index {property_id}"
@@ -2101,71 +2702,46 @@ def upload_brochure_or_project_document(
     return response
 
 
-def get_top_gainers():
-    logger.debug("Inside Get Top Gainers Service")
-    try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        candle_details_collection = db[constants.CANDLE_DETAILS_SCHEMA]
-        region_details_collection = db[constants.REGION_DETAILS_SCHEMA]
-
-        region_ids = region_details_collection.find(
-            {constants.IS_ACTIVE_FIELD: True},
-            {constants.INDEX_ID: 1, constants.TITLE_FIELD: 1},
-        )
-        region_id_list = [
-            (region_id[constants.INDEX_ID], region_id[constants.TITLE_FIELD])
-            for region_id in region_ids
-        ]
-
-        top_gainers_by_region_dict = {}
-        for region in region_id_list:
-            property_ids = list(
-                map(
-                    lambda x: str(x.get(constants.INDEX_ID)),
-                    list(
-                        property_details_collection.find(
-                            {
-                                constants.REGION_ID_FIELD: str(region[0]),
-                            },
-                            {constants.INDEX_ID: 1},
-                        )
-                    ),
-                )
-            )
-            candle_data = list(
-                candle_details_collection.aggregate(
-                    [
-                        {"$match": {"property_id": {"$in": property_ids}}},
-                        {"$sort": {"property_gain": -1}},
-                        {"$limit": 5},
-                    ]
-                )
-            )
-            formated_candle_data = []
-            for data in candle_data:
-                property_details = property_details_collection.find_one(
-                    {constants.INDEX_ID: ObjectId(data.get("property_id"))}
+top_gainers_cache = TimedCache(
+    min(
+        constants.TOP_GAINERS_CACHE_TTL_SECONDS,
+        constants.CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS // 2,
+    )
+)
+TOP_GAINERS_CACHE_KEY = "top_gainers"
+
+
+def build_top_gainers_response():
+    top_gainers_by_region_dict = {}
+    for leaderboard in top_gainers.get_leaderboards():
+        formated_candle_data = []
+        for gainer in leaderboard.get("gainers", []):
+            property_details_dict = dict(gainer["property_details"])
+            if property_details_dict.get(constants.PROJECT_LOGO_FIELD):
+                property_details_dict[
+                    constants.PROJECT_LOGO_FIELD
+                ] = core_cloudfront.cloudfront_sign(
+                    property_details_dict[constants.PROJECT_LOGO_FIELD]
                 )
-                property_details_dict = {
-                    constants.ID: str(property_details.get(constants.INDEX_ID)),
-                    constants.PROJECT_TITLE_FIELD: property_details.get(
-                        constants.PROJECT_TITLE_FIELD
-                    ),
-                    constants.PROJECT_LOGO_FIELD: core_cloudfront.cloudfront_sign(
-                        property_details.get(constants.PROJECT_LOGO_FIELD)
-                    ),
-                    constants.PRICE_FIELD: property_details.get(constants.PRICE_FIELD),
-                }
-                response_data = {
-                    constants.ID: str(data.get(constants.INDEX_ID)),
-                    "region_name": region[1],
-                    "candle_data": data.get("candle_data"),
-                    "property_gain": data.get("property_gain"),
+            formated_candle_data.append(
+                {
+                    constants.ID: gainer[constants.ID],
+                    "region_name": leaderboard.get("region_name"),
+                    "candle_data": gainer.get(constants.CANDLE_DATA_FIELD),
+                    "property_gain": gainer.get(constants.PROPERTY_GAIN_FIELD),
                     "property_details": property_details_dict,
                 }
-                formated_candle_data.append(response_data)
-            top_gainers_by_region_dict[str(region[0])] = formated_candle_data
+            )
+        top_gainers_by_region_dict[leaderboard[constants.INDEX_ID]] = formated_candle_data
+    return top_gainers_by_region_dict
 
+
+def get_top_gainers():
+    logger.debug("Inside Get Top Gainers Service")
+    try:
+        top_gainers_by_region_dict = top_gainers_cache.get_or_load(
+            TOP_GAINERS_CACHE_KEY, build_top_gainers_response
+        )
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -2184,51 +2760,106 @@ def get_top_gainers():
     return response
 
 
-def get_similar_properties(region_id: str, page_number: int, per_page: int):
+SIMILAR_PROPERTY_PROJECTION = {
+    constants.INDEX_ID: 1,
+    constants.PROJECT_TITLE_FIELD: 1,
+    constants.ADDRESS_FIELD: 1,
+    constants.PRICE_FIELD: 1,
+    constants.IMAGES_FIELD: 1,
+    constants.LISTED_BY_FIELD: 1,
+    constants.CREATED_AT_FIELD: 1,
+    constants.LOCATION_FIELD: 1,
+    constants.DESCRIPTION_FIELD: 1,
+}
+
+
+def similar_property_card(property):
+    return {
+        constants.ID: str(property[constants.INDEX_ID]),
+        constants.PROJECT_TITLE_FIELD: property[constants.PROJECT_TITLE_FIELD],
+        constants.DESCRIPTION_FIELD: property[constants.DESCRIPTION_FIELD],
+        constants.ADDRESS_FIELD: property[constants.ADDRESS_FIELD],
+        constants.PRICE_FIELD: property[constants.PRICE_FIELD],
+        constants.IMAGES_FIELD: [
+            core_cloudfront.cloudfront_sign(image_key)
+            for image_key in property[constants.IMAGES_FIELD][:1]
+        ],
+        constants.LISTED_BY_FIELD: property[constants.LISTED_BY_FIELD],
+        constants.CREATED_AT_FIELD: property[constants.CREATED_AT_FIELD],
+        constants.LOCATION_FIELD: property[constants.LOCATION_FIELD],
+    }
+
+
+async def get_similar_properties(
+    region_id: str,
+    page_number: int,
+    per_page: int,
+    cursor: str = None,
+    include_total: bool = True,
+    property_id: str = None,
+):
     logger.debug("Inside Get Similar Properties Service")
     try:
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_details = (
-            property_details_collection.find(
-                {constants.REGION_ID_FIELD: region_id},
-                {
-                    constants.INDEX_ID: 1,
-                    constants.PROJECT_TITLE_FIELD: 1,
-                    constants.ADDRESS_FIELD: 1,
-                    constants.PRICE_FIELD: 1,
-                    constants.IMAGES_FIELD: 1,
-                    constants.LISTED_BY_FIELD: 1,
-                    constants.CREATED_AT_FIELD: 1,
-                    constants.LOCATION_FIELD: 1,
-                    constants.DESCRIPTION_FIELD: 1,
+        # Precomputed nearest neighbours by features; listings that have not
+        # been through the similarity job yet fall back to the region listing.
+        similar_properties = (
+            await similarity_engine.get_similar_property_ids_async(property_id) if property_id else None
+        )
+        if similar_properties is not None:
+            page_slice = similar_properties[
+                (page_number - 1) * per_page : page_number * per_page
+            ]
+            property_loader = BatchLoader(
+                constants.PROPERTY_DETAILS_SCHEMA,
+                {**SIMILAR_PROPERTY_PROJECTION, constants.IMAGES_FIELD: {"$slice": 1}},
+            )
+            property_loader.add_many(similar_id for similar_id, _ in page_slice)
+            await property_loader.load_async()
+            response_list = []
+            for similar_id, distance in page_slice:
+                property = property_loader.get(similar_id)
+                if property is None:
+                    continue
+                response_list.append({**similar_property_card(property), "distance": distance})
+            response = admin_property_management_schemas.ResponseMessage(
+                type=constants.HTTP_RESPONSE_SUCCESS,
+                data={
+                    "properties": response_list,
+                    "document_count": len(similar_properties),
+                    "page_number": page_number,
+                    "per_page": per_page,
+                    "next_cursor": None,
                 },
+                status_code=HTTPStatus.OK,
             )
-            .skip((page_number - 1) * per_page)
+            return response
+
+        if region_id is None:
+            response = admin_property_management_schemas.ResponseMessage(
+                type=constants.HTTP_RESPONSE_FAILURE,
+                data={constants.MESSAGE: "region_id or property_id is required"},
+                status_code=HTTPStatus.BAD_REQUEST,
+            )
+            return response
+
+        page = KeysetPage([(constants.CREATED_AT_FIELD, -1)], page_number, per_page, cursor)
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        property_details = await (
+            property_details_collection.find(
+                page.filter({constants.REGION_ID_FIELD: region_id}),
+                SIMILAR_PROPERTY_PROJECTION,
+            )
+            .sort(page.sort_spec)
+            .skip(page.skip)
             .limit(per_page)
+            .to_list(length=per_page)
         )
-        document_count = property_details_collection.count_documents(
-            {constants.REGION_ID_FIELD: region_id}
+        document_count = await count_documents_cached(
+            property_details_collection,
+            {constants.REGION_ID_FIELD: region_id},
+            include_total,
         )
-        response_list = []
-        for property in property_details:
-            response_list.append(
-                {
-                    constants.ID: str(property[constants.INDEX_ID]),
-                    constants.PROJECT_TITLE_FIELD: property[
-                        constants.PROJECT_TITLE_FIELD
-                    ],
-                    constants.DESCRIPTION_FIELD: property[constants.DESCRIPTION_FIELD],
-                    constants.ADDRESS_FIELD: property[constants.ADDRESS_FIELD],
-                    constants.PRICE_FIELD: property[constants.PRICE_FIELD],
-                    constants.IMAGES_FIELD: [
-                        core_cloudfront.cloudfront_sign(image_key)
-                        for image_key in property[constants.IMAGES_FIELD][:1]
-                    ],
-                    constants.LISTED_BY_FIELD: property[constants.LISTED_BY_FIELD],
-                    constants.CREATED_AT_FIELD: property[constants.CREATED_AT_FIELD],
-                    constants.LOCATION_FIELD: property[constants.LOCATION_FIELD],
-                }
-            )
+        response_list = [similar_property_card(property) for property in property_details]
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -2236,6 +2867,7 @@ def get_similar_properties(region_id: str, page_number: int, per_page: int):
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(property_details),
             },
             status_code=HTTPStatus.OK,
         )
@@ -2296,6 +2928,15 @@ def change_property_status(
             {"$set": {constants.STATUS_FIELD: status}},
         )
 
+        region_stats.record_property_status_changed(
+            property_details.get(constants.REGION_ID_FIELD),
+            property_details.get(constants.STATUS_FIELD),
+            status,
+        )
+        invalidate_regions_cache()
+        property_text_index.refresh_property(property_id)
+        similarity_engine.mark_property_changed(property_id)
+        invalidate_property_detail_cache(property_id)
         logger.debug(f"Property Status Changed Successfully at Index {property_id}")
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
@@ -2313,73 +2954,210 @@ def change_property_status(
     return response
 
 
+def iter_batches(cursor, batch_size):
+    batch = []
+    for document in cursor:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def previous_view_counts(
+    customer_daily_property_analytics_collection, property_ids, formatted_date
+):
+    """
+    Latest cumulative view count per property from snapshots before today.
+    Only the given properties and the last ANALYTICS_PREVIOUS_COUNT_WINDOW_DAYS
+    are read, in (property_id, data) index order, so the cost does not grow
+    with the history. Properties with no snapshot in the window fall back to
+    the total kept on their latest monthly rollup bucket.
+    """
+    if not property_ids:
+        return {}
+    window_start = (
+        datetime.strptime(formatted_date, "%Y-%m-%d")
+        - timedelta(days=constants.ANALYTICS_PREVIOUS_COUNT_WINDOW_DAYS)
+    ).strftime("%Y-%m-%d")
+    return {
+        previous_count[constants.INDEX_ID]: previous_count[constants.VIEW_COUNT_FIELD]
+        for previous_count in customer_daily_property_analytics_collection.aggregate(
+            [
+                {
+                    "$match": {
+                        constants.PROPERTY_ID_FIELD: {constants.IN_OPERATOR: property_ids},
+                        "data": {"$gte": window_start, "$lt": formatted_date},
+                    }
+                },
+                {"$sort": {constants.PROPERTY_ID_FIELD: 1, "data": 1}},
+                {
+                    "$group": {
+                        constants.INDEX_ID: f"${constants.PROPERTY_ID_FIELD}",
+                        constants.VIEW_COUNT_FIELD: {
+                            "$last": f"${constants.VIEW_COUNT_FIELD}"
+                        },
+                    }
+                },
+            ]
+        )
+    }
+
+
+def rollup_view_counts(property_view_rollup_collection, property_ids, formatted_date):
+    """Cumulative totals for properties missing from the snapshot window."""
+    if not property_ids:
+        return {}
+    return {
+        previous_count[constants.INDEX_ID]: previous_count["total_views"]
+        for previous_count in property_view_rollup_collection.aggregate(
+            [
+                {
+                    "$match": {
+                        constants.PROPERTY_ID_FIELD: {constants.IN_OPERATOR: property_ids},
+                        "granularity": AnalyticsGranularity.MONTHLY.value,
+                        "last_date": {"$lt": formatted_date},
+                    }
+                },
+                {"$sort": {constants.PROPERTY_ID_FIELD: 1, "granularity": 1, "period": 1}},
+                {
+                    "$group": {
+                        constants.INDEX_ID: f"${constants.PROPERTY_ID_FIELD}",
+                        "total_views": {"$last": "$total_views"},
+                    }
+                },
+            ]
+        )
+    }
+
+
 def add_todays_property_count():
     logger.debug("Inside Add Todays Property Count Service")
     try:
+        # Apply buffered views first so the snapshot sees today's full totals.
+        view_counter.flush()
+        started_at = time.perf_counter()
         customer_property_analytics_collection = db[
             constants.CUSTOMER_PROPERTY_ANALYTICS_SCHEMA
         ]
         customer_daily_property_analytics_collection = db[
             constants.CUSTOMER_DAILY_PROPERTY_ANALYTICS_SCHEMA
         ]
+        property_view_rollup_collection = db[constants.PROPERTY_VIEW_ROLLUP_SCHEMA]
         property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        property_list = list(
-            property_details_collection.find(
-                {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value},
-                {
-                    constants.INDEX_ID: 1,
-                    constants.VIEW_COUNT_FIELD: 1,
-                    constants.LISTED_BY_USER_ID_FIELD: 1,
-                },
-            )
-        )
-        for property in property_list:
-            datetime_obj = datetime.utcfromtimestamp(time.time())
 
-            formatted_date = datetime_obj.strftime("%Y-%m-%d")
-            customer_daily_property_analytics_collection.insert_one(
-                jsonable_encoder(
-                    PropertyDailyViewCountSchema(
-                        user_id=str(property.get(constants.LISTED_BY_USER_ID_FIELD)),
-                        property_id=str(property.get(constants.INDEX_ID)),
-                        view_count=property.get(constants.VIEW_COUNT_FIELD),
-                        timestamp=time.time(),
-                        data=formatted_date,
-                    )
+        timestamp = time.time()
+        formatted_date = view_rollups.utc_date(timestamp).isoformat()
+        # Rows are keyed by (property_id, date), so re-running the job for the
+        # same day overwrites that day's rows instead of adding new ones.
+        metrics = {"properties": 0, "upserted": 0, "modified": 0, "batches": 0}
+        daily_operations, analytics_operations, rollup_operations = [], [], []
+
+        def write_batch():
+            for collection, operations in (
+                (customer_daily_property_analytics_collection, daily_operations),
+                (customer_property_analytics_collection, analytics_operations),
+                (property_view_rollup_collection, rollup_operations),
+            ):
+                if not operations:
+                    continue
+                result = collection.bulk_write(operations, ordered=False)
+                metrics["upserted"] += result.upserted_count
+                metrics["modified"] += result.modified_count
+                operations.clear()
+            metrics["batches"] += 1
+
+        property_cursor = property_details_collection.find(
+            {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value},
+            {
+                constants.INDEX_ID: 1,
+                constants.VIEW_COUNT_FIELD: 1,
+                constants.LISTED_BY_USER_ID_FIELD: 1,
+            },
+            batch_size=constants.ANALYTICS_BULK_WRITE_BATCH_SIZE,
+        )
+        for properties in iter_batches(property_cursor, constants.ANALYTICS_BULK_WRITE_BATCH_SIZE):
+            property_ids = [str(property[constants.INDEX_ID]) for property in properties]
+            previous_counts = previous_view_counts(
+                customer_daily_property_analytics_collection, property_ids, formatted_date
+            )
+            previous_counts.update(
+                rollup_view_counts(
+                    property_view_rollup_collection,
+                    [
+                        property_id
+                        for property_id in property_ids
+                        if property_id not in previous_counts
+                    ],
+                    formatted_date,
                 )
             )
+            for property in properties:
+                property_id = str(property.get(constants.INDEX_ID))
+                user_id = str(property.get(constants.LISTED_BY_USER_ID_FIELD))
+                view_count = property.get(constants.VIEW_COUNT_FIELD) or 0
+                previous_count = previous_counts.get(property_id)
+                todays_count = (
+                    view_count if previous_count is None else view_count - previous_count
+                )
+                row_key = {constants.PROPERTY_ID_FIELD: property_id, "data": formatted_date}
 
-            previouse_count = customer_property_analytics_collection.find_one(
-                {
-                    constants.PROPERTY_ID_FIELD: str(property.get(constants.INDEX_ID)),
-                }
-            )
-            print(previouse_count)
-            if previouse_count is None:
-                analytics_index = PropertyAnalyticsSchema(
-                    user_id=str(property.get(constants.LISTED_BY_USER_ID_FIELD)),
-                    property_id=str(property.get(constants.INDEX_ID)),
-                    view_count=property.get(constants.VIEW_COUNT_FIELD),
-                    timestamp=time.time(),
+                daily_operations.append(
+                    UpdateOne(
+                        row_key,
+                        {
+                            "$set": jsonable_encoder(
+                                PropertyDailyViewCountSchema(
+                                    user_id=user_id,
+                                    property_id=property_id,
+                                    view_count=view_count,
+                                    timestamp=timestamp,
+                                    data=formatted_date,
+                                )
+                            )
+                        },
+                        upsert=True,
+                    )
                 )
-            else:
-                previous_count = previouse_count.get(constants.VIEW_COUNT_FIELD)
-                todays_count = property.get(constants.VIEW_COUNT_FIELD) - previous_count
-                analytics_index = PropertyAnalyticsSchema(
-                    user_id=str(property.get(constants.LISTED_BY_USER_ID_FIELD)),
-                    property_id=str(property.get(constants.INDEX_ID)),
-                    view_count=todays_count,
-                    timestamp=time.time(),
+                analytics_operations.append(
+                    UpdateOne(
+                        row_key,
+                        {
+                            "$set": jsonable_encoder(
+                                PropertyAnalyticsSchema(
+                                    user_id=user_id,
+                                    property_id=property_id,
+                                    view_count=todays_count,
+                                    timestamp=timestamp,
+                                    data=formatted_date,
+                                )
+                            )
+                        },
+                        upsert=True,
+                    )
                 )
-            customer_property_analytics_collection.insert_one(
-                jsonable_encoder(analytics_index)
-            )
+                rollup_operations.extend(
+                    view_rollups.rollup_operations(
+                        property_id, user_id, formatted_date, todays_count, view_count
+                    )
+                )
+                metrics["properties"] += 1
+            write_batch()
 
-        logger.debug(f"Todays Property Count Added Successfully")
+        elapsed_seconds = time.perf_counter() - started_at
+        metrics["elapsed_seconds"] = round(elapsed_seconds, 3)
+        metrics["properties_per_second"] = (
+            round(metrics["properties"] / elapsed_seconds, 1) if elapsed_seconds else 0
+        )
+        logger.debug(f"Todays Property Count Added Successfully: {metrics}")
 
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
-            data={constants.MESSAGE: "Todays Property Count Added Successfully"},
+            data={
+                constants.MESSAGE: "Todays Property Count Added Successfully",
+                "metrics": metrics,
+            },
             status_code=HTTPStatus.OK,
         )
 
@@ -2396,7 +3174,7 @@ def add_todays_property_count():
     return response
 
 
-def get_filtered_properties(
+async def get_filtered_properties(
     listing_type,
     listed_by,
     category,
@@ -2407,10 +3185,12 @@ def get_filtered_properties(
     roi_percentage_max,
     page_number,
     per_page,
+    cursor=None,
+    include_total: bool = True,
 ):
     try:
-        skip = (page_number - 1) * per_page
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
+        page = KeysetPage([(constants.CREATED_AT_FIELD, -1)], page_number, per_page, cursor)
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
         filter_query = {
             key: value
             for key, value in {
@@ -2433,8 +3213,12 @@ def get_filtered_properties(
             filter_query["roi_percentage"] = {"$lte": roi_percentage_max}
 
         # Query the MongoDB collection with the filter query and apply pagination
-        filtered_properties = list(
-            property_details_collection.find(filter_query).skip(skip).limit(per_page)
+        filtered_properties = await (
+            property_details_collection.find(page.filter(filter_query))
+            .sort(page.sort_spec)
+            .skip(page.skip)
+            .limit(per_page)
+            .to_list(length=per_page)
         )
 
         response_data = []
@@ -2459,7 +3243,9 @@ def get_filtered_properties(
                 ],
             }
             response_data.append(response_dict)
-        document_count = property_details_collection.count_documents(filter_query)
+        document_count = await count_documents_cached(
+            property_details_collection, filter_query, include_total
+        )
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -2468,6 +3254,7 @@ def get_filtered_properties(
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(filtered_properties),
             },
             status_code=HTTPStatus.OK,
         )
@@ -2483,6 +3270,173 @@ def get_filtered_properties(
     return response
 
 
+
+async def search_properties(
+    listing_type,
+    listed_by,
+    category,
+    possession_type,
+    price_max,
+    area_max,
+    region_id,
+    roi_percentage_max,
+    page_number,
+    per_page,
+    include_total: bool = True,
+):
+    logger.debug("Inside Search Properties Service")
+    try:
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        search_filter = property_search.build_search_filter(
+            listing_type=listing_type,
+            listed_by=listed_by,
+            category=category,
+            possession_type=possession_type,
+            region_id=region_id,
+            price_max=price_max,
+            area_max=area_max,
+            roi_percentage_max=roi_percentage_max,
+        )
+        search_result = await property_details_collection.aggregate(
+            property_search.build_search_pipeline(
+                search_filter, page_number, per_page, include_total
+            )
+        ).to_list(length=1)
+        properties, document_count, facets, histograms = property_search.parse_search_result(
+            search_result[0] if search_result else None, include_total
+        )
+
+        response_data = []
+        for data in properties:
+            response_data.append(
+                {
+                    constants.ID: str(data[constants.INDEX_ID]),
+                    constants.PROJECT_TITLE_FIELD: data[constants.PROJECT_TITLE_FIELD],
+                    constants.PRICE_FIELD: data[constants.PRICE_FIELD],
+                    constants.IMAGES_FIELD: [
+                        core_cloudfront.cloudfront_sign(image_key)
+                        for image_key in data.get(constants.IMAGES_FIELD) or []
+                    ],
+                    constants.CREATED_AT_FIELD: data[constants.CREATED_AT_FIELD],
+                    constants.LOCATION_FIELD: data[constants.LOCATION_FIELD],
+                    constants.LISTED_BY_FIELD: data[constants.LISTED_BY_FIELD],
+                    constants.CATEGORY_FIELD: data[constants.CATEGORY_FIELD],
+                    constants.ROI_PERCENTAGE: data[constants.ROI_PERCENTAGE],
+                    constants.LISTING_TYPE_FIELD: data[constants.LISTING_TYPE_FIELD],
+                    constants.POSSESSOION_TYPE_FIELD: data[
+                        constants.POSSESSOION_TYPE_FIELD
+                    ],
+                }
+            )
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data={
+                "response_data": response_data,
+                "facets": facets,
+                "histograms": histograms,
+                "document_count": document_count,
+                "page_number": page_number,
+                "per_page": per_page,
+            },
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Search Properties Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Search Properties Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Search Properties Service")
+    return response
+
+
+async def text_search_properties(query: str, page_number: int, per_page: int):
+    logger.debug("Inside Text Search Properties Service")
+    try:
+        ranked_properties, document_count = property_text_index.get_property_text_index().search(
+            query, page_number, per_page
+        )
+        property_loader = BatchLoader(
+            constants.PROPERTY_DETAILS_SCHEMA,
+            {
+                **property_search.SEARCH_RESULT_PROJECTION,
+                constants.IMAGES_FIELD: {"$slice": 1},
+                constants.ADDRESS_FIELD: 1,
+            },
+        )
+        property_loader.add_many(property_id for property_id, _ in ranked_properties)
+        await property_loader.load_async()
+
+        response_data = []
+        for property_id, score in ranked_properties:
+            data = property_loader.get(property_id)
+            if data is None:
+                continue
+            response_data.append(
+                {
+                    constants.ID: property_id,
+                    "score": score,
+                    constants.PROJECT_TITLE_FIELD: data[constants.PROJECT_TITLE_FIELD],
+                    constants.ADDRESS_FIELD: data.get(constants.ADDRESS_FIELD),
+                    constants.PRICE_FIELD: data[constants.PRICE_FIELD],
+                    constants.IMAGES_FIELD: [
+                        core_cloudfront.cloudfront_sign(image_key)
+                        for image_key in data.get(constants.IMAGES_FIELD) or []
+                    ],
+                    constants.CREATED_AT_FIELD: data[constants.CREATED_AT_FIELD],
+                    constants.LOCATION_FIELD: data[constants.LOCATION_FIELD],
+                    constants.LISTED_BY_FIELD: data[constants.LISTED_BY_FIELD],
+                    constants.CATEGORY_FIELD: data[constants.CATEGORY_FIELD],
+                    constants.ROI_PERCENTAGE: data[constants.ROI_PERCENTAGE],
+                    constants.LISTING_TYPE_FIELD: data[constants.LISTING_TYPE_FIELD],
+                    constants.POSSESSOION_TYPE_FIELD: data[
+                        constants.POSSESSOION_TYPE_FIELD
+                    ],
+                    constants.REGION_ID_FIELD: data[constants.REGION_ID_FIELD],
+                }
+            )
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data={
+                "response_data": response_data,
+                "document_count": document_count,
+                "page_number": page_number,
+                "per_page": per_page,
+            },
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Text Search Properties Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Text Search Properties Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Text Search Properties Service")
+    return response
+
+
+def get_search_suggestions(query: str, limit: int):
+    logger.debug("Inside Get Search Suggestions Service")
+    try:
+        suggestions = property_text_index.get_property_text_index().suggest(query, limit)
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_SUCCESS,
+            data=suggestions,
+            status_code=HTTPStatus.OK,
+        )
+    except Exception as e:
+        logger.error(f"Error in Get Search Suggestions Service: {e}")
+        response = admin_property_management_schemas.ResponseMessage(
+            type=constants.HTTP_RESPONSE_FAILURE,
+            data={constants.MESSAGE: f"Error in Get Search Suggestions Service: {e}"},
+            status_code=e.status_code if hasattr(e, "status_code") else 500,
+        )
+    logger.debug("Returning From the Get Search Suggestions Service")
+    return response
+
+
 def add_customer_favorite_property(
     property_id: str,
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -2616,20 +3570,22 @@ def remove_customer_favorite_property(
     logger.debug("Returning From the Remove Customer Favorite Property Service")
     return response
 
-def get_customer_bookmarks(
+async def get_customer_bookmarks(
     page_number,
     per_page,
     token: Annotated[str, Depends(oauth2_scheme)],
+    cursor=None,
+    include_total: bool = True,
 ):
     try:
-        skip = (page_number - 1) * per_page
-        property_details_collection = db[constants.PROPERTY_DETAILS_SCHEMA]
-        customer_favorite_property_collection = db[
+        page = KeysetPage([(constants.INDEX_ID, 1)], page_number, per_page, cursor)
+        property_details_collection = async_db[constants.PROPERTY_DETAILS_SCHEMA]
+        customer_favorite_property_collection = async_db[
             constants.CUSTOMER_FAVORITE_PROPERTY_SCHEMA
         ]
         token = token_decoder(token)
         user_id = token.get(constants.ID)
-        customer_favorite_property = customer_favorite_property_collection.find_one(
+        customer_favorite_property = await customer_favorite_property_collection.find_one(
             {constants.USER_ID_FIELD: user_id}
         )
         if not customer_favorite_property:
@@ -2648,12 +3604,14 @@ def get_customer_bookmarks(
             )
             return response
         property_ids = list(map(lambda x: ObjectId(x), property_ids))
-        properties = list(
+        properties = await (
             property_details_collection.find(
-                {constants.INDEX_ID: {"$in": property_ids}}
+                page.filter({constants.INDEX_ID: {"$in": property_ids}})
             )
-            .skip(skip)
+            .sort(page.sort_spec)
+            .skip(page.skip)
             .limit(per_page)
+            .to_list(length=per_page)
         )
         response_data = []
 
@@ -2677,7 +3635,11 @@ def get_customer_bookmarks(
                 ],
             }
             response_data.append(response_dict)
-        document_count = property_details_collection.count_documents({constants.INDEX_ID: {"$in": property_ids}})
+        document_count = await count_documents_cached(
+            property_details_collection,
+            {constants.INDEX_ID: {"$in": property_ids}},
+            include_total,
+        )
         response = admin_property_management_schemas.ResponseMessage(
             type=constants.HTTP_RESPONSE_SUCCESS,
             data={
@@ -2685,6 +3647,7 @@ def get_customer_bookmarks(
                 "document_count": document_count,
                 "page_number": page_number,
                 "per_page": per_page,
+                "next_cursor": page.next_cursor(properties),
             },
             status_code=HTTPStatus.OK,
         )
@@ -0,0 +1,92 @@
+"""
+CloudFront URL signing throughput, before and after the cached signer.
+
+Compares three ways of producing a signed URL:
+
+- per call: parse the PEM and build a CloudFrontSigner every time (the
+  previous cloudfront_sign)
+- cached signer: key parsed once, signer reused, every URL still signed
+- memoized: core_cloudfront.cloudfront_sign, which also reuses signed URLs
+  per S3 key, fed a listing-page like stream where keys repeat
+
+A throwaway RSA key is generated unless AWS_CLOUDFRONT_PRIVATE_KEY is set,
+so no real credentials are needed. Run from the repository root with the
+app environment loaded:
+
+    python -m benchmarks.cloudfront_sign_benchmark --seconds 5
+"""
+import argparse
+import datetime
+import random
+import time
+import rsa
+from botocore.signers import CloudFrontSigner
+from common_layer import constants
+from core_layer.aws_cloudfront import core_cloudfront
+
+
+def per_call_sign(private_key_pem, url):
+    # The signing path before the cache, kept here for comparison.
+    def rsa_signer(message):
+        return rsa.sign(message, rsa.PrivateKey.load_pkcs1(private_key_pem.encode("utf-8")), "SHA-1")
+
+    date = datetime.datetime.fromtimestamp(
+        time.time() + constants.CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS
+    )
+    return CloudFrontSigner(core_cloudfront.AWS_CLOUDFRONT_KEY_ID, rsa_signer).generate_presigned_url(
+        url, date_less_than=date
+    )
+
+
+def rate(function, keys, seconds):
+    calls, started = 0, time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        function(keys[calls % len(keys)])
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--distinct-keys", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--key-bits", type=int, default=2048)
+    arguments = parser.parse_args()
+
+    if not core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY:
+        _, private_key = rsa.newkeys(arguments.key_bits)
+        core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY = private_key.save_pkcs1().decode("utf-8")
+    core_cloudfront.AWS_CLOUDFRONT_KEY_ID = core_cloudfront.AWS_CLOUDFRONT_KEY_ID or "BENCHMARK"
+    constants.CLOUDFRONT_URL = constants.CLOUDFRONT_URL or "https://benchmark.cloudfront.net/"
+    private_key_pem = core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY
+
+    keys = [f"property_images/{index}.jpeg" for index in range(arguments.distinct_keys)]
+    # Listing pages keep showing the same popular properties.
+    stream = random.choices(
+        keys, weights=[1 / (rank + 1) for rank in range(len(keys))], k=arguments.requests
+    )
+
+    print(f"{'variant':<18}{'signatures/s':>14}")
+    per_call = rate(
+        lambda key: per_call_sign(private_key_pem, f"{constants.CLOUDFRONT_URL}{key}"),
+        keys,
+        arguments.seconds,
+    )
+    print(f"{'per call':<18}{per_call:>14.0f}")
+    cached_signer = rate(core_cloudfront.sign_url, keys, arguments.seconds)
+    print(f"{'cached signer':<18}{cached_signer:>14.0f}")
+
+    core_cloudfront.signed_url_cache.invalidate()
+    started = time.perf_counter()
+    for key in stream:
+        core_cloudfront.cloudfront_sign(key)
+    memoized = len(stream) / (time.perf_counter() - started)
+    print(
+        f"{'memoized':<18}{memoized:>14.0f}"
+        f"  ({arguments.requests} requests over {arguments.distinct_keys} keys)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+CloudFront batch signing: RSA backend and the sign_many process pool.
+
+First compares raw signature throughput of the pure-Python `rsa` package
+(the previous signer) with the OpenSSL-backed `cryptography` signer now
+used by core_cloudfront. Then signs cold batches of growing size with
+core_cloudfront.sign_many, inline and across the process pool, taking the
+median of several runs, and prints the smallest batch from which the pool
+wins at every larger size too. That batch size is what
+CLOUDFRONT_SIGN_POOL_MIN_BATCH should be set to on the target hardware; it
+depends on core count, so rerun it there.
+
+A throwaway RSA key is generated unless AWS_CLOUDFRONT_PRIVATE_KEY is set,
+so no real credentials are needed. Run from the repository root with the
+app environment loaded:
+
+    python -m benchmarks.cloudfront_sign_many_benchmark --workers 4
+"""
+import argparse
+import os
+import statistics
+import time
+import rsa
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa as rsa_keys
+from common_layer import constants
+from core_layer.aws_cloudfront import core_cloudfront
+
+
+def rate(function, seconds):
+    calls, started = 0, time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        function(b"policy %d" % calls)
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def batch_seconds(keys, repeats):
+    timings = []
+    for _ in range(repeats):
+        core_cloudfront.signed_url_cache.invalidate()
+        started = time.perf_counter()
+        core_cloudfront.sign_many(keys)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--batches", default="16,32,64,128,256,512,1024,4096")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--key-bits", type=int, default=2048)
+    arguments = parser.parse_args()
+
+    if not core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY:
+        private_key = rsa_keys.generate_private_key(public_exponent=65537, key_size=arguments.key_bits)
+        core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ).decode("utf-8")
+    core_cloudfront.AWS_CLOUDFRONT_KEY_ID = core_cloudfront.AWS_CLOUDFRONT_KEY_ID or "BENCHMARK"
+    constants.CLOUDFRONT_URL = constants.CLOUDFRONT_URL or "https://benchmark.cloudfront.net/"
+    constants.CLOUDFRONT_MEDIA_DELIVERY_MODE = core_cloudfront.SIGNED_URL_MODE
+
+    # The previous signer, kept here for comparison.
+    pure_python_key = rsa.PrivateKey.load_pkcs1(core_cloudfront.AWS_CLOUDFRONT_PRIVATE_KEY.encode("utf-8"))
+    print(f"{'backend':<14}{'signatures/s':>14}")
+    pure_python = rate(lambda message: rsa.sign(message, pure_python_key, "SHA-1"), arguments.seconds)
+    print(f"{'rsa':<14}{pure_python:>14.0f}")
+    openssl = rate(core_cloudfront.rsa_signer, arguments.seconds)
+    print(f"{'cryptography':<14}{openssl:>14.0f}  ({openssl / pure_python:.1f}x)")
+
+    # The pool is started once per process; keep that out of the timings.
+    constants.CLOUDFRONT_SIGN_POOL_WORKERS = arguments.workers
+    constants.CLOUDFRONT_SIGN_POOL_MIN_BATCH = 1
+    core_cloudfront.get_sign_pool().map(core_cloudfront.sign_urls, [["warmup"]] * arguments.workers)
+
+    print(f"\n{'batch':>6}{'inline ms':>12}{'pool ms':>12}  ({arguments.workers} workers)")
+    results = []
+    for batch in sorted(int(size) for size in arguments.batches.split(",")):
+        keys = [f"property_images/{index}.jpeg" for index in range(batch)]
+        constants.CLOUDFRONT_SIGN_POOL_WORKERS = 0
+        inline = batch_seconds(keys, arguments.repeats)
+        constants.CLOUDFRONT_SIGN_POOL_WORKERS = arguments.workers
+        pooled = batch_seconds(keys, arguments.repeats)
+        results.append((batch, pooled < inline))
+        print(f"{batch:>6}{inline * 1000:>12.1f}{pooled * 1000:>12.1f}")
+
+    # A single win in the middle of the range is noise, not a threshold.
+    crossover = None
+    for batch, pool_wins in reversed(results):
+        if not pool_wins:
+            break
+        crossover = batch
+
+    if crossover is None:
+        print("\nThe pool never beat inline signing; leave CLOUDFRONT_SIGN_POOL_WORKERS=0.")
+    else:
+        print(f"\nPool pays off from {crossover} keys: CLOUDFRONT_SIGN_POOL_MIN_BATCH={crossover}")
+    core_cloudfront.shutdown_sign_pool()
+
+
+if __name__ == "__main__":
+    main()
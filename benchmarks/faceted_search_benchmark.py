@@ -0,0 +1,164 @@
+"""
+Faceted property search against a synthetic property_details collection.
+
+Compares the single `$match` + `$facet` aggregation behind
+/search-properties with the separate queries a client needs without it
+(page, count, one breakdown per facet field, one histogram per numeric
+field).
+
+Run from the repository root with the app environment loaded, against a
+throwaway database:
+
+    python -m benchmarks.faceted_search_benchmark \
+        --mongodb-url mongodb://localhost:27017/metachecker_benchmark
+"""
+import argparse
+import random
+import statistics
+import time
+from pymongo import MongoClient
+from common_layer import constants
+from common_layer.common_schemas.property_schema import (
+    ListingType,
+    ListedBy,
+    Category,
+    PossessionType,
+    PropertyStatus,
+)
+from common_layer.common_services import property_search
+from common_layer.common_services.index_registry import INDEX_REGISTRY
+
+
+def synthetic_property(region_ids, created_at):
+    return {
+        constants.PROJECT_TITLE_FIELD: f"Project {random.randint(1, 10**6)}",
+        constants.LISTING_TYPE_FIELD: random.choice(list(ListingType)).value,
+        constants.LISTED_BY_FIELD: random.choice(list(ListedBy)).value,
+        constants.CATEGORY_FIELD: random.choice(list(Category)).value,
+        constants.POSSESSOION_TYPE_FIELD: random.choice(list(PossessionType)).value,
+        constants.REGION_ID_FIELD: random.choice(region_ids),
+        constants.STATUS_FIELD: random.choices(
+            [status.value for status in PropertyStatus], weights=[8, 1, 1]
+        )[0],
+        constants.PRICE_FIELD: round(random.lognormvariate(15, 0.8), 2),
+        "area": random.randint(300, 20000),
+        constants.ROI_PERCENTAGE: round(random.uniform(0, 25), 2),
+        constants.IMAGES_FIELD: [f"property_images/{random.randint(1, 10**6)}.jpeg"],
+        constants.CREATED_AT_FIELD: created_at,
+        constants.LOCATION_FIELD: {
+            "type": "Point",
+            "coordinates": [random.uniform(68, 97), random.uniform(8, 37)],
+        },
+    }
+
+
+def seed(collection, documents, batch_size=5000):
+    region_ids = [f"region_{index}" for index in range(40)]
+    collection.drop()
+    now = time.time()
+    for start in range(0, documents, batch_size):
+        collection.insert_many(
+            [
+                synthetic_property(region_ids, now - index)
+                for index in range(start, min(start + batch_size, documents))
+            ],
+            ordered=False,
+        )
+    collection.create_indexes(INDEX_REGISTRY[constants.PROPERTY_DETAILS_SCHEMA])
+    return region_ids
+
+
+def separate_queries(collection, search_filter, page_number, per_page):
+    list(
+        collection.find(search_filter, property_search.SEARCH_RESULT_PROJECTION)
+        .sort([(constants.CREATED_AT_FIELD, -1), (constants.INDEX_ID, -1)])
+        .skip((page_number - 1) * per_page)
+        .limit(per_page)
+    )
+    collection.count_documents(search_filter)
+    for field in property_search.SEARCH_FACET_FIELDS:
+        list(collection.aggregate([{"$match": search_filter}, {"$sortByCount": f"${field}"}]))
+    for field in property_search.SEARCH_HISTOGRAM_FIELDS.values():
+        list(
+            collection.aggregate(
+                [
+                    {"$match": search_filter},
+                    {
+                        "$bucketAuto": {
+                            "groupBy": f"${field}",
+                            "buckets": constants.SEARCH_HISTOGRAM_BUCKETS,
+                        }
+                    },
+                ]
+            )
+        )
+
+
+def single_facet(collection, search_filter, page_number, per_page):
+    list(
+        collection.aggregate(
+            property_search.build_search_pipeline(search_filter, page_number, per_page)
+        )
+    )
+
+
+def time_it(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017/metachecker_benchmark")
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument("--skip-seed", action="store_true")
+    arguments = parser.parse_args()
+
+    client = MongoClient(arguments.mongodb_url)
+    collection = client.get_default_database()[constants.PROPERTY_DETAILS_SCHEMA]
+    if arguments.skip_seed:
+        region_ids = collection.distinct(constants.REGION_ID_FIELD)
+    else:
+        started = time.perf_counter()
+        region_ids = seed(collection, arguments.documents)
+        print(f"seeded {arguments.documents} properties in {time.perf_counter() - started:.1f}s")
+
+    scenarios = {
+        "no filter": property_search.build_search_filter(),
+        "category + listing_type": property_search.build_search_filter(
+            category=Category.RESIDENTIAL.value, listing_type=ListingType.SELL.value
+        ),
+        "region + price_max": property_search.build_search_filter(
+            region_id=region_ids[0], price_max=5_000_000
+        ),
+        "listed_by + possession": property_search.build_search_filter(
+            listed_by=ListedBy.OWNER.value,
+            possession_type=PossessionType.READY_TO_MOVE.value,
+        ),
+    }
+    print(f"{'scenario':<26}{'separate p50/p95 ms':>22}{'$facet p50/p95 ms':>22}")
+    for name, search_filter in scenarios.items():
+        separate = time_it(
+            lambda: separate_queries(collection, search_filter, 1, arguments.per_page),
+            arguments.repeat,
+        )
+        faceted = time_it(
+            lambda: single_facet(collection, search_filter, 1, arguments.per_page),
+            arguments.repeat,
+        )
+        print(
+            f"{name:<26}{separate[0]:>12.1f}/{separate[1]:<9.1f}"
+            f"{faceted[0]:>12.1f}/{faceted[1]:<9.1f}"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Write latency of creating a listing against a throwaway database.
+
+Compares the previous sequence (insert property, insert details, insert
+candle, then update_one to back-link the ids) with
+property_writes.insert_property_documents, which generates the ids
+client-side and issues the three inserts only, inside a transaction when
+the server is a replica set.
+
+Run from the repository root with the app environment loaded:
+
+    python -m benchmarks.property_create_benchmark \
+        --mongodb-url mongodb://localhost:27017/metachecker_benchmark
+"""
+import argparse
+import statistics
+import time
+from bson import ObjectId
+from pymongo import MongoClient
+from common_layer import constants
+from common_layer.common_services import property_writes
+
+
+def property_document():
+    return {
+        constants.PROJECT_TITLE_FIELD: "Benchmark Project",
+        constants.CATEGORY_FIELD: "residential",
+        constants.PRICE_FIELD: 4500000.0,
+        constants.STATUS_FIELD: "active",
+        constants.CREATED_AT_FIELD: time.time(),
+        "property_details_id": "",
+        "candle_data_id": "",
+    }
+
+
+def details_document():
+    return {"property_type": "apartment", "bedrooms": 2, "bathrooms": 2}
+
+
+def candle_document():
+    return {
+        constants.PROPERTY_GAIN_FIELD: 0,
+        constants.CANDLE_DATA_FIELD: [{"timestamp": time.time(), "price": 4500000.0}],
+    }
+
+
+def sequential_writes(database):
+    property_index = database[constants.PROPERTY_DETAILS_SCHEMA].insert_one(property_document())
+    details_index = database[constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA].insert_one(
+        {**details_document(), constants.PROPERTY_ID_FIELD: str(property_index.inserted_id)}
+    )
+    candle_index = database[constants.CANDLE_DETAILS_SCHEMA].insert_one(
+        {**candle_document(), constants.PROPERTY_ID_FIELD: str(property_index.inserted_id)}
+    )
+    database[constants.PROPERTY_DETAILS_SCHEMA].update_one(
+        {constants.INDEX_ID: property_index.inserted_id},
+        {
+            "$set": {
+                "candle_data_id": str(candle_index.inserted_id),
+                "property_details_id": str(details_index.inserted_id),
+            }
+        },
+    )
+
+
+def client_side_ids(database, client):
+    property_writes.insert_property_documents(
+        ObjectId(),
+        property_document(),
+        constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+        details_document(),
+        candle_document(),
+        database=database,
+        mongo_client=client,
+    )
+
+
+def time_it(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017/metachecker_benchmark")
+    parser.add_argument("--repeat", type=int, default=500)
+    arguments = parser.parse_args()
+
+    client = MongoClient(arguments.mongodb_url)
+    database = client.get_default_database()
+    for collection_name in (
+        constants.PROPERTY_DETAILS_SCHEMA,
+        constants.RESIDENTIAL_PROPERTY_DETAILS_SCHEMA,
+        constants.CANDLE_DETAILS_SCHEMA,
+    ):
+        database[collection_name].drop()
+        # Create up front: collections cannot be created implicitly inside
+        # a transaction on older servers.
+        database.create_collection(collection_name)
+
+    transactions = property_writes.transactions_supported(client)
+    print(f"transactions {'enabled' if transactions else 'unavailable (standalone server)'}")
+    print(f"{'variant':<30}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, function in (
+        ("3 inserts + back-link update", lambda: sequential_writes(database)),
+        ("3 inserts, client-side ids", lambda: client_side_ids(database, client)),
+    ):
+        p50, p95 = time_it(function, arguments.repeat)
+        print(f"{name:<30}{p50:>10.2f}{p95:>10.2f}")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Similar-property engine on a synthetic in-memory catalogue.
+
+Times the pieces of the nightly similarity job (featurisation and the
+blocked all-pairs kNN) and one incremental refresh, and compares the
+vectorised kNN with a per-property Python scan on a sample of rows,
+extrapolated to the full catalogue. No database is touched.
+
+Run from the repository root with the app environment loaded:
+
+    python -m benchmarks.similarity_benchmark --documents 100000
+"""
+import argparse
+import heapq
+import math
+import random
+import time
+import numpy as np
+from common_layer import constants
+from common_layer.common_services import similarity_engine
+from benchmarks.faceted_search_benchmark import synthetic_property
+
+
+def python_neighbours(matrix, row, k):
+    vector = matrix[row].tolist()
+    distances = (
+        (math.fsum((a - b) ** 2 for a, b in zip(vector, other)), index)
+        for index, other in enumerate(matrix.tolist())
+        if index != row
+    )
+    return [index for _, index in heapq.nsmallest(k, distances)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=100000)
+    parser.add_argument("--k", type=int, default=constants.SIMILAR_PROPERTIES_K)
+    parser.add_argument("--baseline-sample", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+    region_ids = [f"region_{index}" for index in range(40)]
+    now = time.time()
+    documents = [
+        synthetic_property(region_ids, now - index) for index in range(arguments.documents)
+    ]
+
+    started = time.perf_counter()
+    matrix, stats = similarity_engine.build_feature_matrix(documents)
+    featurise_seconds = time.perf_counter() - started
+    print(
+        f"featurised {len(documents)} properties into {matrix.shape[1]} columns "
+        f"in {featurise_seconds:.2f}s"
+    )
+
+    started = time.perf_counter()
+    indices, _ = similarity_engine.nearest_neighbours(matrix, arguments.k)
+    knn_seconds = time.perf_counter() - started
+    print(f"vectorised kNN (k={arguments.k}) for all rows in {knn_seconds:.2f}s")
+
+    sample = random.sample(range(len(documents)), min(arguments.baseline_sample, len(documents)))
+    started = time.perf_counter()
+    agreement = 0
+    for row in sample:
+        expected = python_neighbours(matrix, row, arguments.k)
+        agreement += len(set(expected) & set(indices[row].tolist()))
+    per_row_seconds = (time.perf_counter() - started) / max(len(sample), 1)
+    print(
+        f"python scan: {per_row_seconds * 1000:.1f} ms per property, "
+        f"~{per_row_seconds * len(documents) / 60:.0f} min extrapolated; "
+        f"neighbour agreement {agreement / max(len(sample) * arguments.k, 1):.1%}"
+    )
+
+    norms = np.einsum("ij,ij->i", matrix, matrix)
+    vector, _ = similarity_engine.build_feature_matrix([documents[0]], stats)
+    started = time.perf_counter()
+    distances = similarity_engine.squared_distances(vector, matrix, norms)[0]
+    nearest = np.argpartition(distances, arguments.k)[: arguments.k + 1]
+    nearest = nearest[np.argsort(distances[nearest])]
+    print(
+        f"incremental refresh of one property: "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -115,6 +115,7 @@ class PropertyAnalyticsSchema(BaseModel):
     property_id: str
     view_count: int
     timestamp: float = time.time()
+    data: Optional[str] = None
 
 
 class PropertyDailyViewCountSchema(BaseModel):
@@ -546,3 +547,49 @@ class FavoritePropertySchema(BaseModel):
     property_ids: list
     created_at: float = time.time()
     updated_at: float = time.time()
+
+
+MAX_BATCH_PROPERTY_IDS = 300
+
+
+class PropertyRepresentation(str, Enum):
+    CARD = "card"
+    DETAIL = "detail"
+
+
+class BatchPropertyRequestSchema(BaseModel):
+    property_ids: list[str]
+    fields: Optional[list[str]] = None
+    representation: str = PropertyRepresentation.CARD.value
+
+    @validator("property_ids")
+    def validate_property_ids(cls, value):
+        if not 1 <= len(value) <= MAX_BATCH_PROPERTY_IDS:
+            raise ValueError(
+                f"property_ids must contain between 1 and {MAX_BATCH_PROPERTY_IDS} ids"
+            )
+        return value
+
+    @validator("representation")
+    def validate_representation(cls, value):
+        if value not in [representation.value for representation in PropertyRepresentation]:
+            raise ValueError("Invalid Representation. Must be one of card, detail")
+        return value
+
+
+class AnalyticsGranularity(str, Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class PropertyImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class PropertyImportStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
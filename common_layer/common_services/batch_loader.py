@@ -0,0 +1,103 @@
+from bson import ObjectId
+from database import db, async_db
+from common_layer import constants
+
+
+class BatchLoader:
+    """
+    Collects ids while a service walks a page of rows and resolves them with
+    a single `$in` query per collection, instead of one find_one per row.
+
+    Create one loader per collection inside the service call so the cache
+    lives exactly as long as the request that built it:
+
+        property_loader = BatchLoader(constants.PROPERTY_DETAILS_SCHEMA, {...})
+        property_loader.add_many(row.get("property_id") for row in rows)
+        await property_loader.load_async()
+        property_loader.get(row.get("property_id"))
+
+    Ids are matched on `key_field` (`_id` by default, in which case string
+    ids are converted to ObjectId and invalid ones are skipped). Documents
+    are cached under the string form of their key; when several documents
+    share a key the first one returned wins, mirroring find_one.
+    """
+
+    def __init__(self, collection_name, projection=None, key_field=constants.INDEX_ID):
+        self.collection_name = collection_name
+        self.projection = projection
+        self.key_field = key_field
+        self._pending = set()
+        self._documents = {}
+
+    def add(self, key):
+        if key is None:
+            return
+        key = str(key)
+        if key not in self._documents:
+            self._pending.add(key)
+
+    def add_many(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def _pending_filter(self):
+        if self.key_field == constants.INDEX_ID:
+            keys = [ObjectId(key) for key in self._pending if ObjectId.is_valid(key)]
+        else:
+            keys = list(self._pending)
+        self._pending = set()
+        if not keys:
+            return None
+        return {self.key_field: {constants.IN_OPERATOR: keys}}
+
+    def _returns_key(self):
+        """Whether Mongo returns `key_field` under the projection as given."""
+        if self.projection is None:
+            return True
+        if self.key_field in self.projection:
+            return bool(self.projection[self.key_field])
+        if self.key_field == constants.INDEX_ID:
+            return True
+        # An inclusion projection leaves out every field it does not name.
+        return not any(
+            value for field, value in self.projection.items() if field != constants.INDEX_ID
+        )
+
+    def _projection(self):
+        if self._returns_key():
+            return self.projection
+        # The key is needed to map documents back to ids; it is stripped
+        # again in get() so callers see the projection they asked for.
+        return {**self.projection, self.key_field: 1}
+
+    def _store(self, document):
+        self._documents.setdefault(str(document.get(self.key_field)), document)
+
+    def load(self, database=db):
+        query_filter = self._pending_filter()
+        if query_filter is None:
+            return self
+        for document in database[self.collection_name].find(query_filter, self._projection()):
+            self._store(document)
+        return self
+
+    async def load_async(self, database=async_db):
+        query_filter = self._pending_filter()
+        if query_filter is None:
+            return self
+        async for document in database[self.collection_name].find(
+            query_filter, self._projection()
+        ):
+            self._store(document)
+        return self
+
+    def get(self, key, default=None):
+        if key is None:
+            return default
+        document = self._documents.get(str(key))
+        if document is None:
+            return default
+        document = dict(document)
+        if not self._returns_key():
+            document.pop(self.key_field, None)
+        return document
@@ -0,0 +1,35 @@
+from bson import json_util
+from common_layer import constants
+from common_layer.common_services.timed_cache import TimedCache
+
+
+# Keys include per-user and admin-supplied filters, so the cache is bounded.
+count_cache = TimedCache(
+    constants.COUNT_CACHE_TTL_SECONDS, max_entries=constants.COUNT_CACHE_SIZE
+)
+
+
+def count_cache_key(collection_name, query_filter):
+    # json_util keeps ObjectIds and other BSON types distinct in the key;
+    # sort_keys makes {"a": 1, "b": 2} and {"b": 2, "a": 1} share an entry.
+    return f"{collection_name}:{json_util.dumps(query_filter or {}, sort_keys=True)}"
+
+
+async def count_documents_cached(collection, query_filter=None, include_total=True):
+    """
+    Total for a paginated response. Returns None when the client opted out
+    with include_total=False (infinite scroll), serves recent totals from a
+    short-TTL cache, and uses the collection metadata count when there is no
+    filter instead of scanning.
+    """
+    if not include_total:
+        return None
+    cache_key = count_cache_key(collection.name, query_filter)
+    document_count = count_cache.get(cache_key)
+    if document_count is not None:
+        return document_count
+    if query_filter:
+        document_count = await collection.count_documents(query_filter)
+    else:
+        document_count = await collection.estimated_document_count()
+    return count_cache.set(cache_key, document_count)
@@ -0,0 +1,344 @@
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, IndexModel
+from database import db
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+# Every index the services rely on, keyed by collection name. Index names are
+# left to pymongo so they are derived from the key spec ("user_id_1", ...).
+INDEX_REGISTRY = {
+    constants.USER_DETAILS_SCHEMA: [
+        IndexModel([(constants.MOBILE_NUMBER_FIELD, ASCENDING)]),
+        IndexModel([(constants.EMAIL_ID_FIELD, ASCENDING)]),
+        IndexModel(
+            [(constants.USER_TYPE_FIELD, ASCENDING), (constants.IS_ACTIVE_FIELD, ASCENDING)]
+        ),
+    ],
+    constants.USER_WALLET_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING)]),
+    ],
+    constants.PORTFOLIO_ANALYSIS_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING)]),
+    ],
+    constants.CUSTOMER_TRANSACTION_SCHEMA: [
+        IndexModel(
+            [
+                (constants.USER_ID_FIELD, ASCENDING),
+                (constants.PROPERTY_ID_FIELD, ASCENDING),
+                ("transaction_date", DESCENDING),
+            ]
+        ),
+        IndexModel([("transaction_id", ASCENDING)]),
+    ],
+    constants.CUSTOMER_FIAT_TRANSACTIONS_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING), ("transaction_date", DESCENDING)]),
+        IndexModel([("transaction_id", ASCENDING)]),
+    ],
+    constants.NOTIFICATION_DETAILS_SCHEMA: [
+        IndexModel(
+            [(constants.USER_ID_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING), (constants.IS_READ, ASCENDING)]),
+    ],
+    constants.REGION_DETAILS_SCHEMA: [
+        IndexModel([(constants.LOCATION_FIELD, GEOSPHERE)]),
+        IndexModel(
+            [(constants.IS_ACTIVE_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+    ],
+    constants.REGION_STATS_SCHEMA: [
+        IndexModel(
+            [(constants.IS_ACTIVE_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+    ],
+    constants.PROPERTY_DETAILS_SCHEMA: [
+        IndexModel([(constants.LOCATION_FIELD, GEOSPHERE)]),
+        IndexModel(
+            [
+                (constants.REGION_ID_FIELD, ASCENDING),
+                (constants.STATUS_FIELD, ASCENDING),
+                (constants.CREATED_AT_FIELD, DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [(constants.REGION_ID_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+        IndexModel(
+            [(constants.STATUS_FIELD, ASCENDING), (constants.VIEW_COUNT_FIELD, DESCENDING)]
+        ),
+        IndexModel(
+            [(constants.STATUS_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+        IndexModel(
+            [(constants.LISTED_BY_USER_ID_FIELD, ASCENDING), (constants.STATUS_FIELD, ASCENDING)]
+        ),
+        # Faceted search: equality filters first, then the created_at sort.
+        IndexModel(
+            [
+                (constants.STATUS_FIELD, ASCENDING),
+                (constants.CATEGORY_FIELD, ASCENDING),
+                (constants.LISTING_TYPE_FIELD, ASCENDING),
+                (constants.CREATED_AT_FIELD, DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                (constants.STATUS_FIELD, ASCENDING),
+                (constants.LISTING_TYPE_FIELD, ASCENDING),
+                (constants.CREATED_AT_FIELD, DESCENDING),
+            ]
+        ),
+        IndexModel(
+            [
+                (constants.STATUS_FIELD, ASCENDING),
+                (constants.LISTED_BY_FIELD, ASCENDING),
+                (constants.POSSESSOION_TYPE_FIELD, ASCENDING),
+                (constants.CREATED_AT_FIELD, DESCENDING),
+            ]
+        ),
+    ],
+    constants.CANDLE_DETAILS_SCHEMA: [
+        IndexModel([(constants.PROPERTY_ID_FIELD, ASCENDING)]),
+        IndexModel(
+            [(constants.PROPERTY_ID_FIELD, ASCENDING), (constants.PROPERTY_GAIN_FIELD, DESCENDING)]
+        ),
+    ],
+    constants.TOP_GAINERS_SCHEMA: [
+        IndexModel([(constants.CREATED_AT_FIELD, DESCENDING)]),
+    ],
+    constants.PROPERTY_SIMILARITY_SCHEMA: [
+        IndexModel([(f"similar.{constants.PROPERTY_ID_FIELD}", ASCENDING)]),
+        IndexModel([(constants.UPDATED_AT_FIELD, ASCENDING)]),
+    ],
+    constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA: [
+        IndexModel([("claimed_by", ASCENDING)]),
+        IndexModel([("claimed_at", ASCENDING)]),
+    ],
+    constants.PROPERTY_COOCCURRENCE_SCHEMA: [
+        IndexModel([(constants.UPDATED_AT_FIELD, ASCENDING)]),
+    ],
+    constants.PROPERTY_IMPORT_JOB_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]),
+    ],
+    constants.CUSTOMER_CONVERSATION_SCHEMA: [
+        IndexModel(
+            [(constants.SENDER_ID_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+        IndexModel(
+            [(constants.RECIEVER_ID_FIELD, ASCENDING), (constants.CREATED_AT_FIELD, DESCENDING)]
+        ),
+    ],
+    constants.CUSTOMER_LEADS_SCHEMA: [
+        IndexModel([(constants.LISTED_BY_USER_ID_FIELD, ASCENDING)]),
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING)]),
+        IndexModel(
+            [
+                (constants.PROPERTY_ID_FIELD, ASCENDING),
+                (constants.USER_ID_FIELD, ASCENDING),
+                (constants.STATUS_FIELD, ASCENDING),
+            ]
+        ),
+    ],
+    constants.CUSTOMER_FAVORITE_PROPERTY_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING)]),
+    ],
+    # Nightly rows are upserted on (property_id, data); the unique index keeps
+    # concurrent runs from inserting the same day twice.
+    constants.CUSTOMER_PROPERTY_ANALYTICS_SCHEMA: [
+        IndexModel([(constants.PROPERTY_ID_FIELD, ASCENDING), ("timestamp", DESCENDING)]),
+        IndexModel([(constants.PROPERTY_ID_FIELD, ASCENDING), ("data", ASCENDING)], unique=True),
+    ],
+    constants.CUSTOMER_DAILY_PROPERTY_ANALYTICS_SCHEMA: [
+        IndexModel([(constants.USER_ID_FIELD, ASCENDING), ("data", ASCENDING)]),
+        IndexModel([(constants.PROPERTY_ID_FIELD, ASCENDING), ("data", ASCENDING)], unique=True),
+    ],
+    constants.PROPERTY_VIEW_ROLLUP_SCHEMA: [
+        IndexModel(
+            [
+                (constants.PROPERTY_ID_FIELD, ASCENDING),
+                ("granularity", ASCENDING),
+                ("period", ASCENDING),
+            ],
+            unique=True,
+        ),
+        IndexModel(
+            [
+                (constants.USER_ID_FIELD, ASCENDING),
+                ("granularity", ASCENDING),
+                ("period", ASCENDING),
+            ]
+        ),
+    ],
+}
+
+
+def normalize_index_key(key):
+    return tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction)
+        for field, direction in key
+    )
+
+
+def remove_duplicate_keys(collection, fields):
+    """
+    Keep only the newest document (highest _id) for each value of `fields`,
+    so a unique index can be built over data written before it existed.
+    """
+    duplicate_ids = []
+    for group in collection.aggregate(
+        [
+            {
+                "$group": {
+                    constants.INDEX_ID: {
+                        field.replace(".", "_"): f"${field}" for field in fields
+                    },
+                    "ids": {"$push": f"${constants.INDEX_ID}"},
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$match": {"count": {"$gt": 1}}},
+        ],
+        allowDiskUse=True,
+    ):
+        duplicate_ids.extend(sorted(group["ids"])[:-1])
+    for start in range(0, len(duplicate_ids), constants.ANALYTICS_BULK_WRITE_BATCH_SIZE):
+        collection.delete_many(
+            {
+                constants.INDEX_ID: {
+                    constants.IN_OPERATOR: duplicate_ids[
+                        start:start + constants.ANALYTICS_BULK_WRITE_BATCH_SIZE
+                    ]
+                }
+            }
+        )
+    if duplicate_ids:
+        logger.debug(f"Removed {len(duplicate_ids)} duplicate rows from {collection.name}")
+    return len(duplicate_ids)
+
+
+def ensure_indexes(database=db):
+    """
+    Create or reconcile every index in INDEX_REGISTRY. Safe to run on each
+    startup: indexes that already match are left alone, an index whose name
+    is taken by a different key spec or uniqueness is dropped and rebuilt,
+    and indexes not in the registry are never touched. Duplicates are
+    removed before a unique index is built.
+    """
+    logger.debug("Inside Ensure Indexes")
+    created, rebuilt, unchanged = [], [], 0
+    for collection_name, index_models in INDEX_REGISTRY.items():
+        collection = database[collection_name]
+        existing_indexes = collection.index_information()
+        existing_specs = {
+            (normalize_index_key(index_info["key"]), bool(index_info.get("unique")))
+            for index_info in existing_indexes.values()
+        }
+        missing_indexes = []
+        for index_model in index_models:
+            index_name = index_model.document["name"]
+            index_key = normalize_index_key(index_model.document["key"].items())
+            unique = bool(index_model.document.get("unique"))
+            if (index_key, unique) in existing_specs:
+                unchanged += 1
+                continue
+            if unique:
+                remove_duplicate_keys(collection, [field for field, _ in index_key])
+            if index_name in existing_indexes:
+                logger.debug(f"Rebuilding index {collection_name}.{index_name}")
+                collection.drop_index(index_name)
+                rebuilt.append(f"{collection_name}.{index_name}")
+            else:
+                created.append(f"{collection_name}.{index_name}")
+            missing_indexes.append(index_model)
+        if missing_indexes:
+            collection.create_indexes(missing_indexes)
+    logger.debug(
+        f"Indexes reconciled: created={created} rebuilt={rebuilt} unchanged={unchanged}"
+    )
+    return {"created": created, "rebuilt": rebuilt, "unchanged": unchanged}
+
+
+def plan_has_collection_scan(plan):
+    if not isinstance(plan, dict):
+        return False
+    if plan.get("stage") == "COLLSCAN":
+        return True
+    children = [plan.get("inputStage"), plan.get("queryPlan")] + plan.get(
+        "inputStages", []
+    )
+    return any(plan_has_collection_scan(child) for child in children)
+
+
+# Driver and session fields a recorded command carries that explain rejects.
+EXPLAIN_IGNORED_KEYS = {
+    "lsid",
+    "$db",
+    "$clusterTime",
+    "$readPreference",
+    "txnNumber",
+    "autocommit",
+    "startTransaction",
+    "readConcern",
+    "writeConcern",
+}
+# Where each command keeps its filter; commands not listed are not explained.
+COMMAND_FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+WRITE_STATEMENT_FIELDS = {"update": "updates", "delete": "deletes"}
+
+
+def explainable_commands(command_name, command):
+    """
+    Split a command recorded by a CommandListener into the commands to
+    explain. Commands without a filter (or aggregations that do not start
+    with $match or $geoNear) read the whole collection on purpose and are
+    skipped; bulk update/delete commands are explained per statement.
+    """
+    command = {key: value for key, value in command.items() if key not in EXPLAIN_IGNORED_KEYS}
+    if command_name in COMMAND_FILTER_FIELDS:
+        return [command] if command.get(COMMAND_FILTER_FIELDS[command_name]) else []
+    if command_name == "aggregate":
+        pipeline = command.get("pipeline") or [{}]
+        if pipeline[0].get("$match") or "$geoNear" in pipeline[0]:
+            return [command]
+        return []
+    if command_name in WRITE_STATEMENT_FIELDS:
+        field = WRITE_STATEMENT_FIELDS[command_name]
+        return [
+            {**command, field: [statement]}
+            for statement in command.get(field, [])
+            if statement.get("q")
+        ]
+    return []
+
+
+def winning_plans(explain):
+    """Every winningPlan in an explain result, including per-stage cursors."""
+    if isinstance(explain, dict):
+        for key, value in explain.items():
+            if key == "winningPlan":
+                yield value
+            else:
+                yield from winning_plans(value)
+    elif isinstance(explain, list):
+        for item in explain:
+            yield from winning_plans(item)
+
+
+def find_collection_scans(recorded_commands, database=db):
+    """
+    Explain the commands a CommandListener recorded while the services ran,
+    as (command_name, command) pairs, and return the ones whose winning
+    plan contains a COLLSCAN stage.
+    """
+    collection_scans = []
+    for command_name, recorded_command in recorded_commands:
+        for command in explainable_commands(command_name, recorded_command):
+            explain = database.command("explain", command, verbosity="queryPlanner")
+            if any(plan_has_collection_scan(plan) for plan in winning_plans(explain)):
+                collection_scans.append(command)
+    return collection_scans
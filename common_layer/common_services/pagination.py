@@ -0,0 +1,129 @@
+import base64
+from http import HTTPStatus
+from bson import ObjectId, json_util
+from fastapi import HTTPException
+from common_layer import constants
+
+
+# Cursors are only offered on keys every listing has and that are indexed;
+# a missing or null value would seek past the rest of the listing.
+KEYSET_SORT_FIELDS = (constants.CREATED_AT_FIELD, constants.INDEX_ID)
+SORT_DIRECTIONS = {1: 1, -1: -1, "1": 1, "-1": -1, "asc": 1, "desc": -1}
+
+
+class KeysetPage:
+    """
+    Keyset (seek) pagination over a `(sort_key..., _id)` order.
+
+    With no cursor it falls back to the classic skip/limit on `page_number`,
+    so existing clients keep working. With a cursor it seeks past the last
+    row of the previous page, which costs the same on page 1 and page 1000
+    and does not repeat or drop rows when listings are inserted meanwhile.
+
+    `_id` is always appended as the final sort key (in the direction of the
+    last user key) so the order is total and the cursor is unambiguous.
+    Sorts on fields outside KEYSET_SORT_FIELDS still page by skip/limit but
+    get no cursor, and a cursor sent for one is rejected with a 400.
+    """
+
+    def __init__(self, sort_spec, page_number=1, per_page=10, cursor=None):
+        sort_spec = [(field, sort_direction(direction)) for field, direction in sort_spec]
+        if not sort_spec or sort_spec[-1][0] != constants.INDEX_ID:
+            tie_direction = sort_spec[-1][1] if sort_spec else 1
+            sort_spec.append((constants.INDEX_ID, tie_direction))
+        self.sort_spec = sort_spec
+        self.page_number = page_number
+        self.per_page = per_page
+        if cursor and not self.supports_cursor:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=f"Cursor paging only supports sorting by {list(KEYSET_SORT_FIELDS)}",
+            )
+        self.cursor_values = decode_cursor(cursor, self.sort_fields) if cursor else None
+
+    @property
+    def sort_fields(self):
+        return [field for field, _ in self.sort_spec]
+
+    @property
+    def supports_cursor(self):
+        return all(field in KEYSET_SORT_FIELDS for field in self.sort_fields)
+
+    @property
+    def skip(self):
+        if self.cursor_values is not None:
+            return 0
+        return (self.page_number - 1) * self.per_page
+
+    def filter(self, query_filter):
+        if self.cursor_values is None:
+            return query_filter
+        seek_filter = keyset_seek_filter(self.sort_spec, self.cursor_values)
+        if not query_filter:
+            return seek_filter
+        return {"$and": [query_filter, seek_filter]}
+
+    def projection(self, projection):
+        """Make sure every sort key is returned so the next cursor can be built."""
+        if projection is None:
+            return None
+        return {**projection, **{field: 1 for field in self.sort_fields}}
+
+    def next_cursor(self, documents):
+        if not self.supports_cursor or not documents or len(documents) < self.per_page:
+            return None
+        last_document = documents[-1]
+        return encode_cursor(
+            self.sort_fields, [last_document.get(field) for field in self.sort_fields]
+        )
+
+
+def sort_direction(direction):
+    if isinstance(direction, str):
+        direction = direction.strip().lower()
+    try:
+        if not isinstance(direction, bool):
+            return SORT_DIRECTIONS[direction]
+    except (KeyError, TypeError):
+        pass
+    raise HTTPException(
+        status_code=HTTPStatus.BAD_REQUEST,
+        detail=f"Sort direction must be one of {list(SORT_DIRECTIONS)}",
+    )
+
+
+def keyset_seek_filter(sort_spec, values):
+    # (a, b, _id) > (va, vb, vid) expands to
+    # a > va  OR  (a == va AND b > vb)  OR  (a == va AND b == vb AND _id > vid)
+    # with > flipped to < for descending keys.
+    branches = []
+    for position, (field, direction) in enumerate(sort_spec):
+        branch = {
+            previous_field: values[index]
+            for index, (previous_field, _) in enumerate(sort_spec[:position])
+        }
+        branch[field] = {"$gt" if direction > 0 else "$lt": values[position]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+def encode_cursor(sort_fields, values):
+    payload = json_util.dumps({"k": sort_fields, "v": values})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, sort_fields):
+    try:
+        payload = json_util.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        )
+        values = payload["v"]
+        valid = payload["k"] == sort_fields and len(values) == len(sort_fields)
+    except (ValueError, KeyError, TypeError):
+        valid = False
+    if not valid or not isinstance(values[-1], ObjectId):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Invalid cursor for this listing",
+        )
+    return values
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+import os
+import time
+from bson import ObjectId
+from database import db
+from common_layer import constants
+from common_layer.common_schemas.property_schema import (
+    PropertyImportFormat,
+    PropertyImportStatus,
+)
+
+
+# Bulk listing import: the upload is spooled to a temporary file, rows are
+# streamed from it one at a time and progress is recorded on a job document
+# that the client polls. Validation and document building stay with the
+# property service; this module only deals with files and job state.
+
+
+def detect_format(filename, content_type=None):
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension in (".ndjson", ".jsonl") or content_type in (
+        "application/x-ndjson",
+        "application/jsonl",
+    ):
+        return PropertyImportFormat.NDJSON.value
+    if extension == ".csv" or content_type == "text/csv":
+        return PropertyImportFormat.CSV.value
+    return None
+
+
+def unflatten(row):
+    """
+    CSV columns use dotted names for nested fields (`location.latitude`).
+    Empty cells are dropped so schema defaults apply.
+    """
+    document = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue
+        target = document
+        *parents, field = key.strip().split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[field] = value
+    return document
+
+
+def iter_rows(path, file_format):
+    """Yield (row_number, row, error) for every non-blank row of the file."""
+    with io.open(path, "r", encoding="utf-8-sig", newline="") as file:
+        if file_format == PropertyImportFormat.CSV.value:
+            # Row 1 is the header line.
+            for row_number, row in enumerate(csv.DictReader(file), start=2):
+                yield row_number, unflatten(row), None
+            return
+        for row_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield row_number, None, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(row, dict):
+                yield row_number, None, "Each line must be a JSON object"
+                continue
+            yield row_number, row, None
+
+
+def create_import_job(user_id, file_format, filename, database=db):
+    job = {
+        constants.USER_ID_FIELD: user_id,
+        "format": file_format,
+        "filename": filename,
+        constants.STATUS_FIELD: PropertyImportStatus.QUEUED.value,
+        "processed": 0,
+        "imported": 0,
+        "failed": 0,
+        "errors": [],
+        constants.MESSAGE: None,
+        constants.CREATED_AT_FIELD: time.time(),
+        constants.UPDATED_AT_FIELD: time.time(),
+    }
+    return str(database[constants.PROPERTY_IMPORT_JOB_SCHEMA].insert_one(job).inserted_id)
+
+
+def update_import_job(job_id, imported=0, errors=(), status=None, message=None, database=db):
+    """
+    Add one chunk's results to the job. Only the first
+    PROPERTY_IMPORT_MAX_ERRORS row errors are kept; `failed` still counts
+    every one.
+    """
+    update = {
+        "$inc": {
+            "processed": imported + len(errors),
+            "imported": imported,
+            "failed": len(errors),
+        },
+        "$set": {constants.UPDATED_AT_FIELD: time.time()},
+    }
+    if status is not None:
+        update["$set"][constants.STATUS_FIELD] = status
+    if message is not None:
+        update["$set"][constants.MESSAGE] = message
+    if errors:
+        update["$push"] = {
+            "errors": {"$each": list(errors), "$slice": constants.PROPERTY_IMPORT_MAX_ERRORS}
+        }
+    database[constants.PROPERTY_IMPORT_JOB_SCHEMA].update_one(
+        {constants.INDEX_ID: ObjectId(job_id)}, update
+    )
+
+
+def get_import_job(job_id, user_id, database=db):
+    if not ObjectId.is_valid(job_id):
+        return None
+    job = database[constants.PROPERTY_IMPORT_JOB_SCHEMA].find_one(
+        {constants.INDEX_ID: ObjectId(job_id), constants.USER_ID_FIELD: user_id}
+    )
+    if job is not None:
+        job[constants.ID] = str(job.pop(constants.INDEX_ID))
+    return job
@@ -0,0 +1,128 @@
+from common_layer import constants
+from common_layer.common_schemas.property_schema import PropertyStatus
+
+
+# Fields that get a value -> count breakdown next to the results.
+SEARCH_FACET_FIELDS = [
+    constants.LISTING_TYPE_FIELD,
+    constants.LISTED_BY_FIELD,
+    constants.CATEGORY_FIELD,
+    constants.POSSESSOION_TYPE_FIELD,
+    constants.REGION_ID_FIELD,
+]
+
+# Numeric fields that get a bucketed distribution next to the results.
+SEARCH_HISTOGRAM_FIELDS = {
+    "price": constants.PRICE_FIELD,
+    "area": "area",
+    "roi": constants.ROI_PERCENTAGE,
+}
+
+SEARCH_RESULT_PROJECTION = {
+    constants.INDEX_ID: 1,
+    constants.PROJECT_TITLE_FIELD: 1,
+    constants.PRICE_FIELD: 1,
+    constants.IMAGES_FIELD: {"$slice": [f"${constants.IMAGES_FIELD}", 1]},
+    constants.CREATED_AT_FIELD: 1,
+    constants.LOCATION_FIELD: 1,
+    constants.LISTED_BY_FIELD: 1,
+    constants.CATEGORY_FIELD: 1,
+    constants.ROI_PERCENTAGE: 1,
+    constants.LISTING_TYPE_FIELD: 1,
+    constants.POSSESSOION_TYPE_FIELD: 1,
+    constants.REGION_ID_FIELD: 1,
+}
+
+
+def build_search_filter(
+    listing_type=None,
+    listed_by=None,
+    category=None,
+    possession_type=None,
+    region_id=None,
+    price_max=None,
+    area_max=None,
+    roi_percentage_max=None,
+):
+    search_filter = {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value}
+    search_filter.update(
+        {
+            key: value
+            for key, value in {
+                constants.LISTING_TYPE_FIELD: listing_type,
+                constants.LISTED_BY_FIELD: listed_by,
+                constants.CATEGORY_FIELD: category,
+                constants.POSSESSOION_TYPE_FIELD: possession_type,
+                constants.REGION_ID_FIELD: region_id,
+            }.items()
+            if value is not None
+        }
+    )
+    for field, maximum in (
+        (constants.PRICE_FIELD, price_max),
+        ("area", area_max),
+        (constants.ROI_PERCENTAGE, roi_percentage_max),
+    ):
+        if maximum is not None:
+            search_filter[field] = {"$lte": maximum}
+    return search_filter
+
+
+def build_search_pipeline(search_filter, page_number, per_page, include_total=True):
+    """
+    One aggregation for the whole filter screen: $match narrows with the
+    compound indexes, then a single $facet returns the page, the total, the
+    per-value counts and the numeric histograms for that same match.
+    """
+    facets = {
+        "properties": [
+            {"$sort": {constants.CREATED_AT_FIELD: -1, constants.INDEX_ID: -1}},
+            {"$skip": (page_number - 1) * per_page},
+            {"$limit": per_page},
+            {"$project": SEARCH_RESULT_PROJECTION},
+        ],
+    }
+    if include_total:
+        facets["document_count"] = [{"$count": "count"}]
+    for field in SEARCH_FACET_FIELDS:
+        facets[field] = [{"$sortByCount": f"${field}"}]
+    for name, field in SEARCH_HISTOGRAM_FIELDS.items():
+        facets[f"{name}_histogram"] = [
+            {"$match": {field: {"$type": "number"}}},
+            {
+                "$bucketAuto": {
+                    "groupBy": f"${field}",
+                    "buckets": constants.SEARCH_HISTOGRAM_BUCKETS,
+                }
+            },
+        ]
+    return [{"$match": search_filter}, {"$facet": facets}]
+
+
+def parse_search_result(search_result, include_total=True):
+    """Reshape the single $facet document into properties, counts and histograms."""
+    search_result = search_result or {}
+    document_count = None
+    if include_total:
+        count_result = search_result.get("document_count", [])
+        document_count = count_result[0]["count"] if count_result else 0
+    facets = {
+        field: [
+            {"value": bucket[constants.INDEX_ID], "count": bucket["count"]}
+            for bucket in search_result.get(field, [])
+            if bucket[constants.INDEX_ID] is not None
+        ]
+        for field in SEARCH_FACET_FIELDS
+    }
+    histograms = {
+        name: [
+            {
+                "min": bucket[constants.INDEX_ID]["min"],
+                "max": bucket[constants.INDEX_ID]["max"],
+                "count": bucket["count"],
+            }
+            for bucket in search_result.get(f"{name}_histogram", [])
+        ]
+        for name in SEARCH_HISTOGRAM_FIELDS
+    }
+    return search_result.get("properties", []), document_count, facets, histograms
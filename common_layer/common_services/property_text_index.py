@@ -0,0 +1,378 @@
+import heapq
+import math
+import re
+import threading
+from http import HTTPStatus
+from bson import ObjectId
+from fastapi import HTTPException
+from database import db
+from common_layer import constants
+from common_layer.common_schemas.property_schema import PropertyStatus
+from prospect_app.logging_module import logger
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Relevance weight of a token by the field it came from.
+SEARCH_FIELD_WEIGHTS = {
+    constants.PROJECT_TITLE_FIELD: 3.0,
+    constants.REGION_TITLE_FIELD: 2.0,
+    constants.ADDRESS_FIELD: 1.0,
+}
+
+TEXT_INDEX_PROJECTION = {
+    constants.INDEX_ID: 1,
+    constants.PROJECT_TITLE_FIELD: 1,
+    constants.ADDRESS_FIELD: 1,
+    constants.REGION_ID_FIELD: 1,
+    constants.CREATED_AT_FIELD: 1,
+}
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text or "").lower())
+
+
+class TrieNode:
+    __slots__ = ("children", "is_term", "top_terms")
+
+    def __init__(self):
+        self.children = {}
+        self.is_term = False
+        # Up to SEARCH_PREFIX_EXPANSIONS most frequent terms under this node,
+        # so completing a short prefix does not walk its whole subtree.
+        self.top_terms = []
+
+
+class PropertyTextIndex:
+    """
+    In-memory inverted index over the searchable text of active properties
+    (project title, address and the title of their region), with a prefix
+    trie over the vocabulary for search-as-you-type.
+
+    Postings map token -> {property_id: weight}, where the weight is the sum
+    of SEARCH_FIELD_WEIGHTS for every field the token appears in. Queries are
+    AND over tokens, the last token is matched as a prefix, and results are
+    ranked by weight * idf with newer listings first on ties.
+
+    Each trie node keeps its most frequent terms. They are computed in one
+    pass by build_top_terms after a bulk load and then kept up to date as
+    single properties are added; terms that lose their place to a removal
+    come back with the next periodic rebuild.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.trie = TrieNode()
+        self.documents = {}
+        self.region_titles = {}
+        self.top_terms_built = False
+        self.lock = threading.RLock()
+
+    @property
+    def size(self):
+        return len(self.documents)
+
+    def set_region_titles(self, region_titles):
+        with self.lock:
+            self.region_titles = dict(region_titles)
+
+    def add(self, property_details):
+        property_id = str(property_details[constants.INDEX_ID])
+        region_title = self.region_titles.get(
+            str(property_details.get(constants.REGION_ID_FIELD)), ""
+        )
+        field_values = {
+            constants.PROJECT_TITLE_FIELD: property_details.get(constants.PROJECT_TITLE_FIELD),
+            constants.REGION_TITLE_FIELD: region_title,
+            constants.ADDRESS_FIELD: property_details.get(constants.ADDRESS_FIELD),
+        }
+        token_weights = {}
+        for field, value in field_values.items():
+            for token in set(tokenize(value)):
+                token_weights[token] = token_weights.get(token, 0) + SEARCH_FIELD_WEIGHTS[field]
+        with self.lock:
+            self._remove(property_id)
+            for token, weight in token_weights.items():
+                postings = self.postings.get(token)
+                if postings is None:
+                    postings = self.postings[token] = {}
+                    self._trie_insert(token)
+                postings[property_id] = weight
+                if self.top_terms_built:
+                    self._trie_offer(token)
+            self.documents[property_id] = {
+                "tokens": tuple(token_weights),
+                constants.PROJECT_TITLE_FIELD: property_details.get(constants.PROJECT_TITLE_FIELD),
+                constants.REGION_ID_FIELD: property_details.get(constants.REGION_ID_FIELD),
+                constants.REGION_TITLE_FIELD: region_title,
+                constants.CREATED_AT_FIELD: property_details.get(constants.CREATED_AT_FIELD) or 0,
+            }
+
+    def remove(self, property_id):
+        with self.lock:
+            self._remove(str(property_id))
+
+    def _remove(self, property_id):
+        document = self.documents.pop(property_id, None)
+        if document is None:
+            return
+        for token in document["tokens"]:
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(property_id, None)
+            if not postings:
+                del self.postings[token]
+                self._trie_remove(token)
+
+    def _trie_insert(self, token):
+        node = self.trie
+        for character in token:
+            node = node.children.setdefault(character, TrieNode())
+        node.is_term = True
+
+    def _trie_remove(self, token):
+        path = [self.trie]
+        for character in token:
+            node = path[-1].children.get(character)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].is_term = False
+        for node in path:
+            if token in node.top_terms:
+                node.top_terms.remove(token)
+        # Prune the branch back up to the first node still in use.
+        for depth in range(len(token), 0, -1):
+            node = path[depth]
+            if node.is_term or node.children:
+                break
+            del path[depth - 1].children[token[depth - 1]]
+
+    def _term_frequency(self, term):
+        return len(self.postings[term])
+
+    def _trie_offer(self, token):
+        """Let a token whose frequency grew into the top terms of its prefixes."""
+        frequency = self._term_frequency(token)
+        path = [self.trie]
+        for character in token:
+            path.append(path[-1].children[character])
+        for node in path:
+            top_terms = node.top_terms
+            if token in top_terms:
+                continue
+            if len(top_terms) < constants.SEARCH_PREFIX_EXPANSIONS:
+                top_terms.append(token)
+                continue
+            weakest = min(
+                range(len(top_terms)), key=lambda index: self._term_frequency(top_terms[index])
+            )
+            if frequency > self._term_frequency(top_terms[weakest]):
+                top_terms[weakest] = token
+
+    def build_top_terms(self):
+        """Fill every trie node's top terms bottom-up after a bulk load."""
+        with self.lock:
+            nodes, stack = [], [(self.trie, "")]
+            while stack:
+                node, term = stack.pop()
+                nodes.append((node, term))
+                stack.extend(
+                    (child, term + character) for character, child in node.children.items()
+                )
+            # Reversed pre-order visits every child before its parent.
+            for node, term in reversed(nodes):
+                candidates = [term] if node.is_term else []
+                for child in node.children.values():
+                    candidates.extend(child.top_terms)
+                node.top_terms = heapq.nlargest(
+                    constants.SEARCH_PREFIX_EXPANSIONS, candidates, key=self._term_frequency
+                )
+            self.top_terms_built = True
+
+    def complete(self, prefix, limit=None):
+        """
+        Most frequent vocabulary terms starting with prefix, at most
+        SEARCH_PREFIX_EXPANSIONS of them.
+        """
+        with self.lock:
+            if not self.top_terms_built:
+                self.build_top_terms()
+            node = self.trie
+            for character in prefix:
+                node = node.children.get(character)
+                if node is None:
+                    return []
+            terms = sorted(node.top_terms, key=self._term_frequency, reverse=True)
+            return terms if limit is None else terms[:limit]
+
+    def _idf(self, document_frequency):
+        return math.log(1 + len(self.documents) / document_frequency)
+
+    def _score(self, query):
+        tokens = tokenize(query)
+        if not tokens:
+            return {}
+        *terms, prefix = tokens
+        with self.lock:
+            postings_lists = []
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    return {}
+                postings_lists.append([(postings, self._idf(len(postings)))])
+            prefix_postings = [
+                (self.postings[term], self._idf(len(self.postings[term])))
+                for term in self.complete(prefix, constants.SEARCH_PREFIX_EXPANSIONS)
+            ]
+            if not prefix_postings:
+                return {}
+            postings_lists.append(prefix_postings)
+
+            # Intersect starting from the rarest token to keep candidate sets small.
+            postings_lists.sort(key=lambda group: sum(len(postings) for postings, _ in group))
+            scores = None
+            for group in postings_lists:
+                group_scores = {}
+                for postings, idf in group:
+                    for property_id, weight in postings.items():
+                        if scores is not None and property_id not in scores:
+                            continue
+                        score = weight * idf
+                        if score > group_scores.get(property_id, 0):
+                            group_scores[property_id] = score
+                if scores is None:
+                    scores = group_scores
+                else:
+                    scores = {
+                        property_id: scores[property_id] + score
+                        for property_id, score in group_scores.items()
+                    }
+                if not scores:
+                    return {}
+            return scores
+
+    def _rank_key(self, scores):
+        documents = self.documents
+        return lambda property_id: (
+            scores[property_id],
+            documents[property_id][constants.CREATED_AT_FIELD],
+        )
+
+    def search(self, query, page_number=1, per_page=10):
+        """Return (ranked [(property_id, score)] for the page, total matches)."""
+        scores = self._score(query)
+        with self.lock:
+            scores = {
+                property_id: score
+                for property_id, score in scores.items()
+                if property_id in self.documents
+            }
+            ranked = heapq.nlargest(
+                page_number * per_page, scores, key=self._rank_key(scores)
+            )
+        page = ranked[(page_number - 1) * per_page:]
+        return [(property_id, round(scores[property_id], 4)) for property_id in page], len(scores)
+
+    def suggest(self, query, limit=8):
+        """Top titles and regions for a partially typed query."""
+        scores = self._score(query)
+        with self.lock:
+            top_ids = heapq.nlargest(
+                limit,
+                (property_id for property_id in scores if property_id in self.documents),
+                key=self._rank_key(scores),
+            )
+            properties = [
+                {
+                    constants.ID: property_id,
+                    constants.PROJECT_TITLE_FIELD: self.documents[property_id][
+                        constants.PROJECT_TITLE_FIELD
+                    ],
+                    constants.REGION_TITLE_FIELD: self.documents[property_id][
+                        constants.REGION_TITLE_FIELD
+                    ],
+                }
+                for property_id in top_ids
+            ]
+            query_tokens = tokenize(query)
+            regions = []
+            for region_id, title in self.region_titles.items():
+                title_tokens = tokenize(title)
+                if query_tokens and all(
+                    any(title_token.startswith(query_token) for title_token in title_tokens)
+                    for query_token in query_tokens
+                ):
+                    regions.append({constants.ID: region_id, constants.TITLE_FIELD: title})
+                    if len(regions) == limit:
+                        break
+        return {"properties": properties, "regions": regions}
+
+
+_text_index = None
+_text_index_lock = threading.Lock()
+
+
+def load_region_titles(database=db):
+    return {
+        str(region[constants.INDEX_ID]): region.get(constants.TITLE_FIELD, "").title()
+        for region in database[constants.REGION_DETAILS_SCHEMA].find(
+            {}, {constants.INDEX_ID: 1, constants.TITLE_FIELD: 1}
+        )
+    }
+
+
+def rebuild_property_text_index(database=db):
+    text_index = PropertyTextIndex()
+    text_index.set_region_titles(load_region_titles(database))
+    for property_details in database[constants.PROPERTY_DETAILS_SCHEMA].find(
+        {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value}, TEXT_INDEX_PROJECTION
+    ):
+        text_index.add(property_details)
+    text_index.build_top_terms()
+    global _text_index
+    with _text_index_lock:
+        _text_index = text_index
+    logger.debug(f"Property Text Index rebuilt with {text_index.size} properties")
+    return text_index
+
+
+def get_property_text_index():
+    """
+    The index is built by the startup rebuild cron, never on a request;
+    until that has finished, search answers 503.
+    """
+    text_index = _text_index
+    if text_index is None:
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail="Search index is still being built, retry shortly",
+        )
+    return text_index
+
+
+def refresh_property(property_id, database=db):
+    """
+    Re-index one property after a write in this process: active listings are
+    (re)added with their current text, anything else is dropped. Writes made
+    by other processes are picked up by the periodic rebuild.
+    """
+    text_index = _text_index
+    if text_index is None:
+        return
+    property_details = database[constants.PROPERTY_DETAILS_SCHEMA].find_one(
+        {constants.INDEX_ID: ObjectId(property_id)},
+        {**TEXT_INDEX_PROJECTION, constants.STATUS_FIELD: 1},
+    )
+    if (
+        property_details is None
+        or property_details.get(constants.STATUS_FIELD) != PropertyStatus.ACTIVE.value
+    ):
+        text_index.remove(property_id)
+        return
+    region_id = str(property_details.get(constants.REGION_ID_FIELD))
+    if region_id not in text_index.region_titles:
+        text_index.set_region_titles(load_region_titles(database))
+    text_index.add(property_details)
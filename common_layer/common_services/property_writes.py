@@ -0,0 +1,171 @@
+from collections import defaultdict
+from bson import ObjectId
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+from database import db, client
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+_transactions_supported = {}
+
+
+def transactions_supported(mongo_client=client):
+    """
+    Multi-document transactions need a replica set or a sharded cluster; a
+    standalone mongod (local development) rejects them. Checked once per
+    client with `hello` and remembered.
+    """
+    key = id(mongo_client)
+    if key not in _transactions_supported:
+        try:
+            hello = mongo_client.admin.command("hello")
+            _transactions_supported[key] = bool(
+                hello.get("setName") or hello.get("msg") == "isdbgrid"
+            )
+        except Exception as e:
+            logger.error(f"Could not detect MongoDB topology: {e}")
+            _transactions_supported[key] = False
+    return _transactions_supported[key]
+
+
+def _insert_all(database, documents, session=None):
+    for collection_name, document in documents:
+        database[collection_name].insert_one(document, session=session)
+
+
+def property_document_set(
+    property_id,
+    property_document,
+    details_collection_name,
+    details_document,
+    candle_document,
+):
+    """
+    The (collection, document) inserts for one new listing with every id
+    generated here, so the property document carries its
+    property_details_id and candle_data_id from the start. The property
+    document comes last.
+    """
+    details_id, candle_id = ObjectId(), ObjectId()
+    return [
+        (
+            details_collection_name,
+            {**details_document, constants.INDEX_ID: details_id, constants.PROPERTY_ID_FIELD: str(property_id)},
+        ),
+        (
+            constants.CANDLE_DETAILS_SCHEMA,
+            {**candle_document, constants.INDEX_ID: candle_id, constants.PROPERTY_ID_FIELD: str(property_id)},
+        ),
+        (
+            constants.PROPERTY_DETAILS_SCHEMA,
+            {
+                **property_document,
+                constants.INDEX_ID: property_id,
+                "property_details_id": str(details_id),
+                "candle_data_id": str(candle_id),
+            },
+        ),
+    ]
+
+
+def insert_property_documents(
+    property_id,
+    property_document,
+    details_collection_name,
+    details_document,
+    candle_document,
+    database=db,
+    mongo_client=client,
+):
+    """
+    Write a new listing as three inserts with no follow-up update (see
+    property_document_set). On a replica set the inserts run in one
+    transaction. On a standalone server the property document is written
+    last, so readers never see a listing without its details, and earlier
+    inserts are removed again if a later one fails.
+    """
+    documents = property_document_set(
+        property_id,
+        property_document,
+        details_collection_name,
+        details_document,
+        candle_document,
+    )
+
+    if transactions_supported(mongo_client):
+        with mongo_client.start_session() as session:
+            session.with_transaction(
+                lambda session: _insert_all(database, documents, session)
+            )
+        return property_id
+
+    inserted = []
+    try:
+        for collection_name, document in documents:
+            database[collection_name].insert_one(document)
+            inserted.append((collection_name, document[constants.INDEX_ID]))
+    except Exception:
+        for collection_name, document_id in inserted:
+            database[collection_name].delete_one({constants.INDEX_ID: document_id})
+        raise
+    return property_id
+
+
+def _bulk_insert(collection, documents):
+    """Unordered insert; returns {index: error message} for failed documents."""
+    if not documents:
+        return {}
+    try:
+        collection.bulk_write([InsertOne(document) for document in documents], ordered=False)
+    except BulkWriteError as e:
+        return {
+            error["index"]: error.get("errmsg", "write failed")
+            for error in e.details.get("writeErrors", [])
+        }
+    return {}
+
+
+def bulk_insert_property_documents(document_sets, database=db):
+    """
+    Chunk-sized counterpart of insert_property_documents for imports: one
+    unordered bulk_write per collection instead of three inserts per
+    listing. Details and candles go first; only listings whose both
+    succeeded get their property document, and the details and candles of
+    listings that failed at any step are removed again.
+
+    Returns {property_id: error message} for the listings not written.
+    """
+    failed = {}
+    by_collection = defaultdict(list)
+    for documents in document_sets:
+        property_id = documents[-1][1][constants.INDEX_ID]
+        for collection_name, document in documents[:-1]:
+            by_collection[collection_name].append((property_id, document))
+
+    for collection_name, entries in by_collection.items():
+        errors = _bulk_insert(database[collection_name], [document for _, document in entries])
+        for index, message in errors.items():
+            failed.setdefault(entries[index][0], message)
+
+    properties = [
+        documents[-1][1]
+        for documents in document_sets
+        if documents[-1][1][constants.INDEX_ID] not in failed
+    ]
+    errors = _bulk_insert(database[constants.PROPERTY_DETAILS_SCHEMA], properties)
+    for index, message in errors.items():
+        failed[properties[index][constants.INDEX_ID]] = message
+
+    if failed:
+        for collection_name, entries in by_collection.items():
+            document_ids = [
+                document[constants.INDEX_ID]
+                for property_id, document in entries
+                if property_id in failed
+            ]
+            if document_ids:
+                database[collection_name].delete_many(
+                    {constants.INDEX_ID: {constants.IN_OPERATOR: document_ids}}
+                )
+    return failed
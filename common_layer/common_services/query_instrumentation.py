@@ -0,0 +1,152 @@
+import json
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from pymongo import monitoring
+from starlette.datastructures import MutableHeaders
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+# Command document keys that carry driver/session bookkeeping or payloads
+# rather than the shape of the query itself.
+IGNORED_COMMAND_KEYS = {
+    "lsid",
+    "$db",
+    "$clusterTime",
+    "$readPreference",
+    "txnNumber",
+    "autocommit",
+    "startTransaction",
+    "readConcern",
+    "writeConcern",
+    "documents",
+    "cursor",
+    "batchSize",
+}
+IGNORED_COMMANDS = {
+    "hello",
+    "ismaster",
+    "isMaster",
+    "ping",
+    "endSessions",
+    "saslStart",
+    "saslContinue",
+    "buildinfo",
+    "buildInfo",
+}
+
+
+class RequestQueryStats:
+    def __init__(self):
+        self.command_count = 0
+        self.total_duration_ms = 0.0
+        self.shapes = Counter()
+        self._lock = threading.Lock()
+
+    def record_command(self, shape):
+        with self._lock:
+            self.command_count += 1
+            self.shapes[shape] += 1
+
+    def record_duration(self, duration_micros):
+        with self._lock:
+            self.total_duration_ms += duration_micros / 1000
+
+    def repeated_shapes(self, threshold):
+        return {shape: count for shape, count in self.shapes.items() if count > threshold}
+
+
+current_query_stats: ContextVar = ContextVar("current_query_stats", default=None)
+
+
+def query_shape(value):
+    if isinstance(value, dict):
+        return {
+            key: query_shape(item)
+            for key, item in value.items()
+            if key not in IGNORED_COMMAND_KEYS
+        }
+    if isinstance(value, (list, tuple)):
+        return [query_shape(value[0])] if value else []
+    return "?"
+
+
+def command_shape(command_name, command):
+    collection = command.get(command_name)
+    shape = query_shape(
+        {key: item for key, item in command.items() if key != command_name}
+    )
+    return f"{command_name} {collection} {json.dumps(shape, sort_keys=True)}"
+
+
+class QueryCommandListener(monitoring.CommandListener):
+    """
+    Attributes every Mongo command to the request it was issued from, via
+    `current_query_stats`. Commands run outside a request (cron jobs,
+    startup) are ignored.
+    """
+
+    def started(self, event):
+        stats = current_query_stats.get()
+        if stats is None or event.command_name in IGNORED_COMMANDS:
+            return
+        stats.record_command(command_shape(event.command_name, event.command))
+
+    def succeeded(self, event):
+        stats = current_query_stats.get()
+        if stats is None or event.command_name in IGNORED_COMMANDS:
+            return
+        stats.record_duration(event.duration_micros)
+
+    def failed(self, event):
+        stats = current_query_stats.get()
+        if stats is None or event.command_name in IGNORED_COMMANDS:
+            return
+        stats.record_duration(event.duration_micros)
+
+
+command_listener = QueryCommandListener()
+
+
+class QueryInstrumentationMiddleware:
+    """
+    ASGI middleware that opens a RequestQueryStats per HTTP request, adds
+    the totals as X-DB-* response headers, logs them, and warns when the
+    same query shape runs more than `repeat_threshold` times (N+1).
+    """
+
+    def __init__(self, app, repeat_threshold=constants.QUERY_REPEAT_WARNING_THRESHOLD):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_query_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Command-Count"] = str(stats.command_count)
+                headers["X-DB-Time-Ms"] = f"{stats.total_duration_ms:.2f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_query_headers)
+        finally:
+            current_query_stats.reset(token)
+            self.report(scope, stats)
+
+    def report(self, scope, stats):
+        path = f"{scope.get('method')} {scope.get('path')}"
+        logger.debug(
+            f"DB usage | {path} | commands={stats.command_count} "
+            f"db_time_ms={stats.total_duration_ms:.2f} "
+            f"distinct_shapes={len(stats.shapes)}"
+        )
+        for shape, count in stats.repeated_shapes(self.repeat_threshold).items():
+            logger.warning(f"Repeated query shape | {path} | {count}x | {shape}")
@@ -0,0 +1,184 @@
+import heapq
+import math
+import time
+from collections import defaultdict
+from bson import ObjectId
+from pymongo import ReplaceOne
+from database import db, async_db
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+# Implicit feedback per source; a property a user both holds and bookmarked
+# counts with the strongest signal only.
+INTERACTION_WEIGHTS = {
+    "holding": 3.0,
+    "lead": 2.0,
+    "favorite": 1.0,
+}
+
+
+def _record(interactions, property_id, source):
+    property_id = str(property_id)
+    weight = INTERACTION_WEIGHTS[source]
+    if weight > interactions.get(property_id, 0):
+        interactions[property_id] = weight
+
+
+def wallet_holdings(user_wallet):
+    # Holdings live on the wallet document itself, keyed by property id.
+    return [
+        key
+        for key, value in (user_wallet or {}).items()
+        if ObjectId.is_valid(key) and isinstance(value, dict) and (value.get("quantity") or 0) > 0
+    ]
+
+
+def user_interactions(favorite=None, user_wallet=None, leads=()):
+    """Merge one user's favorites, holdings and leads into {property_id: weight}."""
+    interactions = {}
+    for property_id in (favorite or {}).get("property_ids") or []:
+        _record(interactions, property_id, "favorite")
+    for lead in leads:
+        if lead.get(constants.PROPERTY_ID_FIELD):
+            _record(interactions, lead[constants.PROPERTY_ID_FIELD], "lead")
+    for property_id in wallet_holdings(user_wallet):
+        _record(interactions, property_id, "holding")
+    return interactions
+
+
+def load_all_interactions(database=db):
+    favorites = {
+        favorite[constants.USER_ID_FIELD]: favorite
+        for favorite in database[constants.CUSTOMER_FAVORITE_PROPERTY_SCHEMA].find(
+            {}, {constants.INDEX_ID: 0, constants.USER_ID_FIELD: 1, "property_ids": 1}
+        )
+    }
+    wallets = {
+        user_wallet[constants.USER_ID_FIELD]: user_wallet
+        for user_wallet in database[constants.USER_WALLET_SCHEMA].find({}, {constants.INDEX_ID: 0})
+    }
+    leads = defaultdict(list)
+    for lead in database[constants.CUSTOMER_LEADS_SCHEMA].find(
+        {}, {constants.INDEX_ID: 0, constants.USER_ID_FIELD: 1, constants.PROPERTY_ID_FIELD: 1}
+    ):
+        leads[lead.get(constants.USER_ID_FIELD)].append(lead)
+
+    interactions_by_user = {}
+    for user_id in set(favorites) | set(wallets) | set(leads):
+        interactions = user_interactions(favorites.get(user_id), wallets.get(user_id), leads[user_id])
+        if interactions:
+            interactions_by_user[user_id] = interactions
+    return interactions_by_user
+
+
+def build_cooccurrence(interactions_by_user):
+    """
+    Sparse item-item cosine similarity over weighted user interactions:
+
+        sim(i, j) = sum_u w(u,i) w(u,j) / sqrt(sum_u w(u,i)^2 * sum_u w(u,j)^2)
+
+    Only pairs that actually co-occur are stored, and each user contributes
+    at most RECOMMENDATION_MAX_ITEMS_PER_USER items so one heavy account
+    cannot make the pair count quadratic. Returns {property_id: [(other_id,
+    score)]} keeping the top RECOMMENDATION_NEIGHBOURS per property.
+    """
+    pair_weights = defaultdict(lambda: defaultdict(float))
+    norms = defaultdict(float)
+    for interactions in interactions_by_user.values():
+        items = heapq.nlargest(
+            constants.RECOMMENDATION_MAX_ITEMS_PER_USER,
+            interactions.items(),
+            key=lambda item: item[1],
+        )
+        for position, (property_id, weight) in enumerate(items):
+            norms[property_id] += weight * weight
+            for other_id, other_weight in items[position + 1:]:
+                pair_weights[property_id][other_id] += weight * other_weight
+                pair_weights[other_id][property_id] += weight * other_weight
+
+    cooccurrence = {}
+    for property_id, related in pair_weights.items():
+        scores = (
+            (other_id, weight / math.sqrt(norms[property_id] * norms[other_id]))
+            for other_id, weight in related.items()
+        )
+        cooccurrence[property_id] = heapq.nlargest(
+            constants.RECOMMENDATION_NEIGHBOURS, scores, key=lambda score: score[1]
+        )
+    return cooccurrence
+
+
+def rebuild_cooccurrences(database=db):
+    """Batch job: recompute and store every property's co-occurring neighbours."""
+    started_at = time.perf_counter()
+    interactions_by_user = load_all_interactions(database)
+    cooccurrence = build_cooccurrence(interactions_by_user)
+
+    cooccurrence_collection = database[constants.PROPERTY_COOCCURRENCE_SCHEMA]
+    updated_at = time.time()
+    operations = []
+    for property_id, related in cooccurrence.items():
+        operations.append(
+            ReplaceOne(
+                {constants.INDEX_ID: property_id},
+                {
+                    constants.INDEX_ID: property_id,
+                    "related": [
+                        {constants.PROPERTY_ID_FIELD: other_id, "score": round(score, 6)}
+                        for other_id, score in related
+                    ],
+                    constants.UPDATED_AT_FIELD: updated_at,
+                },
+                upsert=True,
+            )
+        )
+        if len(operations) >= constants.ANALYTICS_BULK_WRITE_BATCH_SIZE:
+            cooccurrence_collection.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        cooccurrence_collection.bulk_write(operations, ordered=False)
+    cooccurrence_collection.delete_many({constants.UPDATED_AT_FIELD: {"$lt": updated_at}})
+    logger.debug(
+        f"Co-occurrences rebuilt from {len(interactions_by_user)} users for "
+        f"{len(cooccurrence)} properties in {time.perf_counter() - started_at:.2f}s"
+    )
+    return len(cooccurrence)
+
+
+async def load_user_interactions(user_id, database=async_db):
+    favorite = await database[constants.CUSTOMER_FAVORITE_PROPERTY_SCHEMA].find_one(
+        {constants.USER_ID_FIELD: user_id}, {"property_ids": 1}
+    )
+    user_wallet = await database[constants.USER_WALLET_SCHEMA].find_one(
+        {constants.USER_ID_FIELD: user_id}, {constants.INDEX_ID: 0}
+    )
+    leads = await database[constants.CUSTOMER_LEADS_SCHEMA].find(
+        {constants.USER_ID_FIELD: user_id}, {constants.PROPERTY_ID_FIELD: 1}
+    ).to_list(length=None)
+    return user_interactions(favorite, user_wallet, leads)
+
+
+async def recommend_for_user(user_id, database=async_db):
+    """
+    Score candidates as sum(w(u,i) * sim(i, j)) over the user's current
+    interactions, read live so a fresh bookmark counts immediately; only the
+    neighbour lists come from the batch job. Properties the user already
+    interacted with are excluded. Returns ranked [(property_id, score)],
+    empty for cold-start users.
+    """
+    interactions = await load_user_interactions(user_id, database)
+    if not interactions:
+        return []
+    scores = defaultdict(float)
+    async for document in database[constants.PROPERTY_COOCCURRENCE_SCHEMA].find(
+        {constants.INDEX_ID: {"$in": list(interactions)}}
+    ):
+        weight = interactions[document[constants.INDEX_ID]]
+        for related in document.get("related", []):
+            other_id = related[constants.PROPERTY_ID_FIELD]
+            if other_id not in interactions:
+                scores[other_id] += weight * related["score"]
+    return heapq.nlargest(
+        constants.RECOMMENDATIONS_LIMIT, scores.items(), key=lambda score: score[1]
+    )
@@ -0,0 +1,138 @@
+import math
+import threading
+from bson import ObjectId
+from database import db
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+EARTH_RADIUS_METRES = 6371008.8
+
+
+def unit_vector(longitude, latitude):
+    """
+    Project a lng/lat pair onto the unit sphere. Straight-line (chord)
+    distance between these vectors grows monotonically with great-circle
+    distance, so a plain 3-d KD-tree gives exact haversine nearest neighbours.
+    """
+    longitude, latitude = math.radians(longitude), math.radians(latitude)
+    return (
+        math.cos(latitude) * math.cos(longitude),
+        math.cos(latitude) * math.sin(longitude),
+        math.sin(latitude),
+    )
+
+
+def chord_to_metres(squared_chord):
+    return 2 * EARTH_RADIUS_METRES * math.asin(min(1.0, math.sqrt(squared_chord) / 2))
+
+
+class KDNode:
+    __slots__ = ("point", "region_id", "axis", "left", "right")
+
+    def __init__(self, point, region_id, axis, left, right):
+        self.point = point
+        self.region_id = region_id
+        self.axis = axis
+        self.left = left
+        self.right = right
+
+
+class RegionSpatialIndex:
+    """Immutable KD-tree over region locations; rebuild to pick up changes."""
+
+    def __init__(self, regions):
+        # regions: iterable of (region_id, longitude, latitude)
+        points = [
+            (unit_vector(longitude, latitude), region_id)
+            for region_id, longitude, latitude in regions
+        ]
+        self.size = len(points)
+        self.root = self._build(points, 0)
+
+    def _build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 3
+        points.sort(key=lambda item: item[0][axis])
+        median = len(points) // 2
+        point, region_id = points[median]
+        return KDNode(
+            point,
+            region_id,
+            axis,
+            self._build(points[:median], depth + 1),
+            self._build(points[median + 1:], depth + 1),
+        )
+
+    def nearest(self, longitude, latitude):
+        """Return (region_id, distance_in_metres), or None for an empty index."""
+        if self.root is None:
+            return None
+        target = unit_vector(longitude, latitude)
+        best = [None, float("inf")]
+
+        def search(node):
+            if node is None:
+                return
+            squared_distance = sum(
+                (node.point[axis] - target[axis]) ** 2 for axis in range(3)
+            )
+            if squared_distance < best[1]:
+                best[0], best[1] = node.region_id, squared_distance
+            difference = target[node.axis] - node.point[node.axis]
+            near, far = (node.left, node.right) if difference < 0 else (node.right, node.left)
+            search(near)
+            if difference * difference < best[1]:
+                search(far)
+
+        search(self.root)
+        return best[0], chord_to_metres(best[1])
+
+
+_region_index = None
+_region_index_lock = threading.Lock()
+
+
+def load_active_regions(database=db):
+    regions = []
+    for region in database[constants.REGION_DETAILS_SCHEMA].find(
+        {constants.IS_ACTIVE_FIELD: True},
+        {constants.INDEX_ID: 1, constants.LOCATION_FIELD: 1},
+    ):
+        coordinates = (region.get(constants.LOCATION_FIELD) or {}).get("coordinates")
+        if coordinates and len(coordinates) == 2:
+            regions.append((str(region[constants.INDEX_ID]), coordinates[0], coordinates[1]))
+    return regions
+
+
+def rebuild_region_index(database=db):
+    global _region_index
+    region_index = RegionSpatialIndex(load_active_regions(database))
+    with _region_index_lock:
+        _region_index = region_index
+    logger.debug(f"Region Spatial Index rebuilt with {region_index.size} regions")
+    return region_index
+
+
+def get_region_index():
+    region_index = _region_index
+    if region_index is None:
+        region_index = rebuild_region_index()
+    return region_index
+
+
+def nearest_region(location):
+    """
+    Nearest active region to {"latitude", "longitude"} as (region_id,
+    distance_in_metres), answered from memory.
+    """
+    return get_region_index().nearest(location.get("longitude"), location.get("latitude"))
+
+
+def nearest_region_record(location):
+    # Same shape the $nearSphere lookup used to return: [{"_id": ObjectId}].
+    region = nearest_region(location)
+    if region is None:
+        return None
+    return [{constants.INDEX_ID: ObjectId(region[0])}]
@@ -0,0 +1,179 @@
+import time
+from bson import ObjectId
+from pymongo import UpdateOne, DeleteMany
+from database import db
+from common_layer import constants
+from common_layer.common_schemas.property_schema import PropertyStatus
+from prospect_app.logging_module import logger
+
+
+# One document per region, keyed by the region id string that properties
+# store in `region_id`. Region display fields are copied in so get_regions
+# reads this collection alone.
+REGION_FIELDS = {
+    constants.TITLE_FIELD: 1,
+    constants.ICON_IMAGE_FIELD: 1,
+    constants.IS_ACTIVE_FIELD: 1,
+    constants.CREATED_AT_FIELD: 1,
+}
+
+
+def region_stats_group_stage():
+    return {
+        "$group": {
+            "_id": f"${constants.REGION_ID_FIELD}",
+            "listed_properties_count": {"$sum": 1},
+            "active_properties_count": {
+                "$sum": {
+                    "$cond": [
+                        {"$eq": [f"${constants.STATUS_FIELD}", PropertyStatus.ACTIVE.value]},
+                        1,
+                        0,
+                    ]
+                }
+            },
+            "min_area": {"$min": "$area"},
+            "max_area": {"$max": "$area"},
+        }
+    }
+
+
+def empty_region_stats():
+    # Area bounds are left unset rather than zeroed so the first $min/$max
+    # from record_property_added sets them instead of comparing against 0.
+    return {"listed_properties_count": 0, "active_properties_count": 0}
+
+
+def region_stats_update(region_stats, extra_fields=None):
+    update = {
+        constants.UPDATE_INDEX_DATA: {
+            **(extra_fields or {}),
+            **(region_stats or empty_region_stats()),
+            constants.UPDATED_AT_FIELD: time.time(),
+        }
+    }
+    if not region_stats:
+        update["$unset"] = {"min_area": "", "max_area": ""}
+    return update
+
+
+def record_property_added(region_id, area, status=PropertyStatus.ACTIVE.value):
+    """
+    Fold a newly listed property into its region without rescanning the
+    region: counts are incremented and the area bounds widened in place.
+    """
+    if not region_id:
+        return
+    active_increment = 1 if status == PropertyStatus.ACTIVE.value else 0
+    db[constants.REGION_STATS_SCHEMA].update_one(
+        {constants.INDEX_ID: str(region_id)},
+        {
+            "$inc": {
+                "listed_properties_count": 1,
+                "active_properties_count": active_increment,
+            },
+            "$min": {"min_area": area},
+            "$max": {"max_area": area},
+            constants.UPDATE_INDEX_DATA: {constants.UPDATED_AT_FIELD: time.time()},
+        },
+        upsert=True,
+    )
+
+
+def record_property_status_changed(region_id, previous_status, status):
+    if not region_id or previous_status == status:
+        return
+    if PropertyStatus.ACTIVE.value not in (previous_status, status):
+        return
+    db[constants.REGION_STATS_SCHEMA].update_one(
+        {constants.INDEX_ID: str(region_id)},
+        {
+            "$inc": {
+                "active_properties_count": 1
+                if status == PropertyStatus.ACTIVE.value
+                else -1
+            },
+            constants.UPDATE_INDEX_DATA: {constants.UPDATED_AT_FIELD: time.time()},
+        },
+    )
+
+
+def refresh_region_stats(region_ids):
+    """
+    Recompute the stats of the given regions only. Used when an edit can
+    shrink an area bound or move a property between regions, which cannot be
+    applied with $inc/$min/$max alone.
+    """
+    region_ids = list({str(region_id) for region_id in region_ids if region_id})
+    if not region_ids:
+        return
+    computed_stats = {
+        region_stat.pop(constants.INDEX_ID): region_stat
+        for region_stat in db[constants.PROPERTY_DETAILS_SCHEMA].aggregate(
+            [
+                {"$match": {constants.REGION_ID_FIELD: {constants.IN_OPERATOR: region_ids}}},
+                region_stats_group_stage(),
+            ]
+        )
+    }
+    db[constants.REGION_STATS_SCHEMA].bulk_write(
+        [
+            UpdateOne(
+                {constants.INDEX_ID: region_id},
+                region_stats_update(computed_stats.get(region_id)),
+                upsert=True,
+            )
+            for region_id in region_ids
+        ]
+    )
+
+
+def sync_region_details(region_id):
+    """Copy a region's display fields after it is added, edited or toggled."""
+    region = db[constants.REGION_DETAILS_SCHEMA].find_one(
+        {constants.INDEX_ID: ObjectId(region_id)}, REGION_FIELDS
+    )
+    if region is None:
+        db[constants.REGION_STATS_SCHEMA].delete_one({constants.INDEX_ID: str(region_id)})
+        return
+    del region[constants.INDEX_ID]
+    db[constants.REGION_STATS_SCHEMA].update_one(
+        {constants.INDEX_ID: str(region_id)},
+        {
+            constants.UPDATE_INDEX_DATA: {**region, constants.UPDATED_AT_FIELD: time.time()},
+            "$setOnInsert": empty_region_stats(),
+        },
+        upsert=True,
+    )
+
+
+def reconcile_region_stats():
+    """
+    Rebuild region_stats from region_details and property_details, fixing
+    any drift left by failed or out-of-band writes. Runs periodically.
+    """
+    logger.debug("Inside Reconcile Region Stats")
+    regions = list(db[constants.REGION_DETAILS_SCHEMA].find({}, REGION_FIELDS))
+    region_ids = [str(region[constants.INDEX_ID]) for region in regions]
+    computed_stats = {
+        region_stat.pop(constants.INDEX_ID): region_stat
+        for region_stat in db[constants.PROPERTY_DETAILS_SCHEMA].aggregate(
+            [
+                {"$match": {constants.REGION_ID_FIELD: {constants.IN_OPERATOR: region_ids}}},
+                region_stats_group_stage(),
+            ]
+        )
+    }
+    operations = []
+    for region in regions:
+        region_id = str(region.pop(constants.INDEX_ID))
+        operations.append(
+            UpdateOne(
+                {constants.INDEX_ID: region_id},
+                region_stats_update(computed_stats.get(region_id), region),
+                upsert=True,
+            )
+        )
+    operations.append(DeleteMany({constants.INDEX_ID: {"$nin": region_ids}}))
+    db[constants.REGION_STATS_SCHEMA].bulk_write(operations, ordered=False)
+    logger.debug(f"Region Stats Reconciled for {len(region_ids)} regions")
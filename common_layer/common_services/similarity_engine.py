@@ -0,0 +1,458 @@
+import math
+import threading
+import time
+import numpy as np
+from bson import ObjectId
+from pymongo import DeleteOne, ReplaceOne, UpdateMany, UpdateOne
+from database import db, async_db
+from common_layer import constants
+from common_layer.common_schemas.property_schema import (
+    Category,
+    ListingType,
+    PropertyStatus,
+)
+from prospect_app.logging_module import logger
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+FEATURE_PROJECTION = {
+    constants.INDEX_ID: 1,
+    constants.PRICE_FIELD: 1,
+    "area": 1,
+    constants.ROI_PERCENTAGE: 1,
+    constants.CATEGORY_FIELD: 1,
+    constants.LISTING_TYPE_FIELD: 1,
+    constants.LOCATION_FIELD: 1,
+}
+
+CATEGORY_VALUES = [category.value for category in Category]
+LISTING_TYPE_VALUES = [listing_type.value for listing_type in ListingType]
+
+
+def numeric_columns(documents):
+    """Raw (log price, log area, roi) columns; missing values become NaN."""
+    columns = np.full((len(documents), 3), np.nan, dtype=np.float64)
+    for row, document in enumerate(documents):
+        for column, field in enumerate(
+            (constants.PRICE_FIELD, "area", constants.ROI_PERCENTAGE)
+        ):
+            value = document.get(field)
+            if isinstance(value, (int, float)) and math.isfinite(value):
+                columns[row, column] = math.log1p(max(value, 0)) if column < 2 else value
+    return columns
+
+
+def feature_stats(columns):
+    mean = np.nanmean(columns, axis=0) if len(columns) else np.zeros(3)
+    std = np.nanstd(columns, axis=0) if len(columns) else np.ones(3)
+    mean = np.nan_to_num(mean)
+    std = np.where(np.nan_to_num(std) > 0, np.nan_to_num(std), 1.0)
+    return mean, std
+
+
+def build_feature_matrix(documents, stats=None):
+    """
+    One float32 row per property:
+
+    - z-scored log(price), log(area) and roi_percentage (missing -> mean)
+    - one-hot category and listing_type
+    - location as a unit-sphere vector scaled so SIMILARITY_LOCATION_SCALE_KM
+      of separation counts as one unit, the same as one standard deviation
+      of price
+
+    Returns (matrix, stats); pass stats back in to featurise new rows on the
+    same scale as an existing matrix.
+    """
+    columns = numeric_columns(documents)
+    mean, std = stats if stats is not None else feature_stats(columns)
+    numeric = np.nan_to_num((columns - mean) / std)
+
+    categorical = np.zeros(
+        (len(documents), len(CATEGORY_VALUES) + len(LISTING_TYPE_VALUES)), dtype=np.float64
+    )
+    location = np.zeros((len(documents), 3), dtype=np.float64)
+    for row, document in enumerate(documents):
+        category = document.get(constants.CATEGORY_FIELD)
+        if category in CATEGORY_VALUES:
+            categorical[row, CATEGORY_VALUES.index(category)] = 1.0
+        listing_type = document.get(constants.LISTING_TYPE_FIELD)
+        if listing_type in LISTING_TYPE_VALUES:
+            categorical[row, len(CATEGORY_VALUES) + LISTING_TYPE_VALUES.index(listing_type)] = 1.0
+        coordinates = (document.get(constants.LOCATION_FIELD) or {}).get("coordinates")
+        if coordinates and len(coordinates) == 2:
+            longitude, latitude = np.radians(coordinates[0]), np.radians(coordinates[1])
+            location[row] = (
+                np.cos(latitude) * np.cos(longitude),
+                np.cos(latitude) * np.sin(longitude),
+                np.sin(latitude),
+            )
+    location *= EARTH_RADIUS_KM / constants.SIMILARITY_LOCATION_SCALE_KM
+
+    matrix = np.hstack([numeric, categorical, location]).astype(np.float32)
+    return matrix, (mean, std)
+
+
+def partial_distances(rows, matrix, matrix_norms):
+    # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b; |a|^2 is constant along a row so it
+    # does not change the ranking and is left out. Built in place, so the
+    # block costs one (rows x n) buffer.
+    distances = rows @ matrix.T
+    distances *= -2.0
+    distances += matrix_norms[None, :]
+    return distances
+
+
+def squared_distances(rows, matrix, matrix_norms):
+    distances = partial_distances(rows, matrix, matrix_norms)
+    distances += np.einsum("ij,ij->i", rows, rows)[:, None]
+    return np.maximum(distances, 0.0, out=distances)
+
+
+def nearest_neighbours(matrix, k, block_rows=None):
+    """
+    Exact k nearest neighbours (excluding self) for every row, computed in
+    row blocks so peak memory stays around SIMILARITY_BLOCK_CELLS floats.
+    Returns (indices, squared_distances), both shaped (n, k) and sorted.
+    """
+    count = len(matrix)
+    k = min(k, count - 1)
+    if k <= 0:
+        return np.empty((count, 0), dtype=np.int64), np.empty((count, 0), dtype=np.float32)
+    block_rows = block_rows or max(1, constants.SIMILARITY_BLOCK_CELLS // count)
+    matrix_norms = np.einsum("ij,ij->i", matrix, matrix)
+    indices = np.empty((count, k), dtype=np.int64)
+    distances = np.empty((count, k), dtype=np.float32)
+    for start in range(0, count, block_rows):
+        stop = min(start + block_rows, count)
+        block = partial_distances(matrix[start:stop], matrix, matrix_norms)
+        block[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        candidates = np.argpartition(block, k - 1, axis=1)[:, :k]
+        candidate_distances = np.take_along_axis(block, candidates, axis=1)
+        candidate_distances += matrix_norms[start:stop, None]
+        np.maximum(candidate_distances, 0.0, out=candidate_distances)
+        order = np.argsort(candidate_distances, axis=1)
+        indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        distances[start:stop] = np.take_along_axis(candidate_distances, order, axis=1)
+    return indices, distances
+
+
+def similarity_document(property_id, neighbour_ids, neighbour_distances, updated_at):
+    similar = [
+        {constants.PROPERTY_ID_FIELD: neighbour_id, "distance": round(float(distance), 6)}
+        for neighbour_id, distance in zip(neighbour_ids, np.sqrt(neighbour_distances))
+    ]
+    return {
+        constants.INDEX_ID: property_id,
+        "similar": similar,
+        constants.UPDATED_AT_FIELD: updated_at,
+    }
+
+
+class SimilarityState:
+    """
+    Feature matrix and per-row kth-neighbour distance of the last build, kept
+    for incremental refreshes. kth distances only ever go stale upwards, which
+    costs a few extra (trimmed) pushes, never a missed one. Rows changed by
+    another worker's refresh go stale here, so the state is reloaded once it
+    is older than SIMILARITY_STATE_TTL_SECONDS.
+    """
+
+    def __init__(self, property_ids, matrix, stats, kth_distances):
+        self.property_ids = property_ids
+        self.rows = {property_id: row for row, property_id in enumerate(property_ids)}
+        self.matrix = matrix
+        self.norms = np.einsum("ij,ij->i", matrix, matrix)
+        self.stats = stats
+        self.kth_distances = kth_distances
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self):
+        return time.monotonic() - self.loaded_at > constants.SIMILARITY_STATE_TTL_SECONDS
+
+    def upsert(self, property_id, vector):
+        row = self.rows.get(property_id)
+        if row is None:
+            row = self.rows[property_id] = len(self.property_ids)
+            self.property_ids.append(property_id)
+            self.matrix = np.vstack([self.matrix, vector[None, :]])
+            self.norms = np.append(self.norms, np.float32(vector @ vector))
+            self.kth_distances = np.append(self.kth_distances, np.float32(np.inf))
+        else:
+            self.matrix[row] = vector
+            self.norms[row] = vector @ vector
+        return row
+
+    def remove(self, property_id):
+        # Rows are tombstoned (pushed to infinity) rather than compacted.
+        row = self.rows.pop(property_id, None)
+        if row is not None:
+            self.norms[row] = np.inf
+            self.kth_distances[row] = 0
+
+
+_state = None
+_state_lock = threading.Lock()
+# Serialises the nightly rebuild and the incremental refresh cron.
+_job_lock = threading.RLock()
+
+
+def load_active_properties(database=db):
+    return list(
+        database[constants.PROPERTY_DETAILS_SCHEMA].find(
+            {constants.STATUS_FIELD: PropertyStatus.ACTIVE.value}, FEATURE_PROJECTION
+        )
+    )
+
+
+def rebuild_similarities(database=db):
+    """Batch job: recompute every active property's neighbour list."""
+    with _job_lock:
+        return _rebuild_similarities(database)
+
+
+def _rebuild_similarities(database):
+    global _state
+    started_at = time.perf_counter()
+    documents = load_active_properties(database)
+    property_ids = [str(document[constants.INDEX_ID]) for document in documents]
+    matrix, stats = build_feature_matrix(documents)
+    indices, distances = nearest_neighbours(matrix, constants.SIMILAR_PROPERTIES_K)
+
+    similarity_collection = database[constants.PROPERTY_SIMILARITY_SCHEMA]
+    updated_at = time.time()
+    operations = []
+    for row, property_id in enumerate(property_ids):
+        operations.append(
+            ReplaceOne(
+                {constants.INDEX_ID: property_id},
+                similarity_document(
+                    property_id,
+                    [property_ids[index] for index in indices[row]],
+                    distances[row],
+                    updated_at,
+                ),
+                upsert=True,
+            )
+        )
+        if len(operations) >= constants.ANALYTICS_BULK_WRITE_BATCH_SIZE:
+            similarity_collection.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        similarity_collection.bulk_write(operations, ordered=False)
+    similarity_collection.delete_many({constants.UPDATED_AT_FIELD: {"$lt": updated_at}})
+
+    kth_distances = (
+        np.sqrt(distances[:, -1]) if distances.shape[1] else np.full(len(property_ids), np.inf)
+    ).astype(np.float32)
+    with _state_lock:
+        _state = SimilarityState(property_ids, matrix, stats, kth_distances)
+    logger.debug(
+        f"Similarities rebuilt for {len(property_ids)} properties in "
+        f"{time.perf_counter() - started_at:.2f}s"
+    )
+    return len(property_ids)
+
+
+def load_similarity_state(database=db):
+    """
+    Rebuild the in-memory state from the active properties and the stored
+    neighbour lists, without recomputing any neighbours. Used after a
+    restart and when the state has gone stale.
+    """
+    documents = load_active_properties(database)
+    property_ids = [str(document[constants.INDEX_ID]) for document in documents]
+    matrix, stats = build_feature_matrix(documents)
+    # Lists shorter than k take any closer property, so their kth is infinite.
+    kth_by_id = {
+        similarity[constants.INDEX_ID]: similarity["kth_distance"]
+        for similarity in database[constants.PROPERTY_SIMILARITY_SCHEMA].aggregate(
+            [
+                {
+                    "$match": {
+                        f"similar.{constants.SIMILAR_PROPERTIES_K - 1}": {"$exists": True}
+                    }
+                },
+                {"$project": {"kth_distance": {"$arrayElemAt": ["$similar.distance", -1]}}},
+            ]
+        )
+    }
+    kth_distances = np.array(
+        [kth_by_id.get(property_id, np.inf) for property_id in property_ids],
+        dtype=np.float32,
+    )
+    return SimilarityState(property_ids, matrix, stats, kth_distances)
+
+
+def mark_property_changed(property_id, database=db):
+    """Queue a property for the next incremental refresh."""
+    mark_properties_changed([property_id], database)
+
+
+def mark_properties_changed(property_ids, database=db):
+    """
+    Markers live in Mongo so changes made by any process (the admin app
+    included) are picked up by the prospect app's refresh cron. Marking a
+    property again releases any claim on it, so it is refreshed once more.
+    """
+    changed_at = time.time()
+    operations = [
+        UpdateOne(
+            {constants.INDEX_ID: property_id},
+            {"$set": {"changed_at": changed_at}, "$unset": {"claimed_by": "", "claimed_at": ""}},
+            upsert=True,
+        )
+        for property_id in dict.fromkeys(str(property_id) for property_id in property_ids)
+    ]
+    if operations:
+        database[constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA].bulk_write(operations, ordered=False)
+
+
+def claim_changed_properties(database=db):
+    """
+    Take the current markers for this worker. Claims are per document, so
+    each marker goes to one worker; claims left by a worker that died are
+    taken over after ten refresh intervals.
+    """
+    change_collection = database[constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA]
+    claim_id, claimed_at = str(ObjectId()), time.time()
+    change_collection.update_many(
+        {
+            "$or": [
+                {"claimed_by": None},
+                {"claimed_at": {"$lt": claimed_at - 10 * constants.SIMILARITY_REFRESH_SECONDS}},
+            ]
+        },
+        {"$set": {"claimed_by": claim_id, "claimed_at": claimed_at}},
+    )
+    property_ids = [
+        change[constants.INDEX_ID]
+        for change in change_collection.find({"claimed_by": claim_id}, {constants.INDEX_ID: 1})
+    ]
+    return claim_id, property_ids
+
+
+def release_changed_properties(claim_id, database=db):
+    # Markers set again since the claim no longer carry claim_id and stay.
+    database[constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA].delete_many({"claimed_by": claim_id})
+
+
+def refresh_changed_properties(database=db):
+    """
+    Incremental refresh for properties changed since the last run: recompute
+    their own lists against the last build's matrix, and push them into the
+    lists of properties they are now closer to than their current kth
+    neighbour. Lists that lose a neighbour this way are made whole again by
+    the next rebuild_similarities.
+    """
+    with _job_lock:
+        return _refresh_changed_properties(database)
+
+
+def _refresh_changed_properties(database):
+    global _state
+    claim_id, property_ids = claim_changed_properties(database)
+    if not property_ids:
+        return 0
+    with _state_lock:
+        state = _state
+    if state is None or state.is_stale():
+        state = load_similarity_state(database)
+        with _state_lock:
+            _state = state
+
+    documents = {
+        str(document[constants.INDEX_ID]): document
+        for document in database[constants.PROPERTY_DETAILS_SCHEMA].find(
+            {constants.INDEX_ID: {"$in": [ObjectId(property_id) for property_id in property_ids]}},
+            {**FEATURE_PROJECTION, constants.STATUS_FIELD: 1},
+        )
+    }
+    similarity_collection = database[constants.PROPERTY_SIMILARITY_SCHEMA]
+    operations = []
+    updated_at = time.time()
+    with _state_lock:
+        for property_id in property_ids:
+            # Drop the old entry everywhere; it is re-inserted below if still close.
+            operations.append(
+                UpdateMany(
+                    {f"similar.{constants.PROPERTY_ID_FIELD}": property_id},
+                    {"$pull": {"similar": {constants.PROPERTY_ID_FIELD: property_id}}},
+                )
+            )
+            document = documents.get(property_id)
+            if (
+                document is None
+                or document.get(constants.STATUS_FIELD) != PropertyStatus.ACTIVE.value
+            ):
+                state.remove(property_id)
+                operations.append(DeleteOne({constants.INDEX_ID: property_id}))
+                continue
+            vector, _ = build_feature_matrix([document], state.stats)
+            state.upsert(property_id, vector[0])
+
+        for property_id in property_ids:
+            row = state.rows.get(property_id)
+            if row is None:
+                continue
+            distances = squared_distances(
+                state.matrix[row:row + 1], state.matrix, state.norms
+            )[0]
+            distances[row] = np.inf
+            k = min(constants.SIMILAR_PROPERTIES_K, len(state.rows) - 1)
+            if k <= 0:
+                continue
+            nearest = np.argpartition(distances, k - 1)[:k]
+            nearest = nearest[np.argsort(distances[nearest])]
+            operations.append(
+                ReplaceOne(
+                    {constants.INDEX_ID: property_id},
+                    similarity_document(
+                        property_id,
+                        [state.property_ids[index] for index in nearest],
+                        distances[nearest],
+                        updated_at,
+                    ),
+                    upsert=True,
+                )
+            )
+            distances = np.sqrt(distances)
+            state.kth_distances[row] = distances[nearest[-1]]
+            for index in np.flatnonzero(distances < state.kth_distances):
+                other_id = state.property_ids[index]
+                operations.append(
+                    UpdateOne(
+                        {constants.INDEX_ID: other_id},
+                        {
+                            "$push": {
+                                "similar": {
+                                    "$each": [
+                                        {
+                                            constants.PROPERTY_ID_FIELD: property_id,
+                                            "distance": round(float(distances[index]), 6),
+                                        }
+                                    ],
+                                    "$sort": {"distance": 1},
+                                    "$slice": constants.SIMILAR_PROPERTIES_K,
+                                }
+                            }
+                        },
+                    )
+                )
+    # Ordered: each $pull must land before the matching $push.
+    similarity_collection.bulk_write(operations)
+    release_changed_properties(claim_id, database)
+    logger.debug(f"Similarities refreshed for {len(property_ids)} changed properties")
+    return len(property_ids)
+
+
+async def get_similar_property_ids_async(property_id, database=async_db):
+    similarity = await database[constants.PROPERTY_SIMILARITY_SCHEMA].find_one(
+        {constants.INDEX_ID: str(property_id)}, {"similar": 1}
+    )
+    if similarity is None:
+        return None
+    return [
+        (entry[constants.PROPERTY_ID_FIELD], entry["distance"])
+        for entry in similarity.get("similar", [])
+    ]
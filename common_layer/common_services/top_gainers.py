@@ -0,0 +1,130 @@
+import time
+from bson import ObjectId
+from database import db
+from common_layer import constants
+from common_layer.common_services.batch_loader import BatchLoader
+from prospect_app.logging_module import logger
+
+
+# Read model for /get-top-gainers: one document per active region holding its
+# top TOP_GAINERS_LIMIT candles with the property card fields already joined.
+# Logos are stored as S3 keys and signed when the endpoint is served.
+
+
+def build_region_leaderboard(region, database=db):
+    region_id = str(region[constants.INDEX_ID])
+    property_ids = [
+        str(property_detail[constants.INDEX_ID])
+        for property_detail in database[constants.PROPERTY_DETAILS_SCHEMA].find(
+            {constants.REGION_ID_FIELD: region_id}, {constants.INDEX_ID: 1}
+        )
+    ]
+    candle_data = []
+    if property_ids:
+        candle_data = list(
+            database[constants.CANDLE_DETAILS_SCHEMA]
+            .find(
+                {constants.PROPERTY_ID_FIELD: {"$in": property_ids}},
+                {
+                    constants.PROPERTY_ID_FIELD: 1,
+                    constants.CANDLE_DATA_FIELD: 1,
+                    constants.PROPERTY_GAIN_FIELD: 1,
+                },
+            )
+            .sort(constants.PROPERTY_GAIN_FIELD, -1)
+            .limit(constants.TOP_GAINERS_LIMIT)
+        )
+
+    property_loader = BatchLoader(
+        constants.PROPERTY_DETAILS_SCHEMA,
+        {
+            constants.PROJECT_TITLE_FIELD: 1,
+            constants.PROJECT_LOGO_FIELD: 1,
+            constants.PRICE_FIELD: 1,
+        },
+    )
+    property_loader.add_many(data.get(constants.PROPERTY_ID_FIELD) for data in candle_data)
+    property_loader.load(database)
+
+    gainers = []
+    for data in candle_data:
+        property_details = property_loader.get(data.get(constants.PROPERTY_ID_FIELD))
+        if not property_details:
+            continue
+        gainers.append(
+            {
+                constants.ID: str(data.get(constants.INDEX_ID)),
+                constants.CANDLE_DATA_FIELD: data.get(constants.CANDLE_DATA_FIELD),
+                constants.PROPERTY_GAIN_FIELD: data.get(constants.PROPERTY_GAIN_FIELD),
+                "property_details": {
+                    constants.ID: str(property_details.get(constants.INDEX_ID)),
+                    constants.PROJECT_TITLE_FIELD: property_details.get(
+                        constants.PROJECT_TITLE_FIELD
+                    ),
+                    constants.PROJECT_LOGO_FIELD: property_details.get(
+                        constants.PROJECT_LOGO_FIELD
+                    ),
+                    constants.PRICE_FIELD: property_details.get(constants.PRICE_FIELD),
+                },
+            }
+        )
+    return {
+        constants.INDEX_ID: region_id,
+        "region_name": region.get(constants.TITLE_FIELD),
+        "created_at": region.get(constants.CREATED_AT_FIELD),
+        "gainers": gainers,
+        constants.UPDATED_AT_FIELD: time.time(),
+    }
+
+
+def refresh_region_leaderboard(region_id, database=db):
+    """
+    Recompute one region's board after a candle, property or region change.
+    Inactive or deleted regions lose their board.
+    """
+    region_id = str(region_id)
+    region = database[constants.REGION_DETAILS_SCHEMA].find_one(
+        {constants.INDEX_ID: ObjectId(region_id)},
+        {
+            constants.TITLE_FIELD: 1,
+            constants.IS_ACTIVE_FIELD: 1,
+            constants.CREATED_AT_FIELD: 1,
+        },
+    )
+    leaderboard_collection = database[constants.TOP_GAINERS_SCHEMA]
+    if region is None or not region.get(constants.IS_ACTIVE_FIELD):
+        leaderboard_collection.delete_one({constants.INDEX_ID: region_id})
+        return None
+    leaderboard = build_region_leaderboard(region, database)
+    leaderboard_collection.replace_one(
+        {constants.INDEX_ID: region_id}, leaderboard, upsert=True
+    )
+    return leaderboard
+
+
+def rebuild_leaderboards(database=db):
+    regions = list(
+        database[constants.REGION_DETAILS_SCHEMA].find(
+            {constants.IS_ACTIVE_FIELD: True},
+            {constants.TITLE_FIELD: 1, constants.CREATED_AT_FIELD: 1},
+        )
+    )
+    leaderboard_collection = database[constants.TOP_GAINERS_SCHEMA]
+    for region in regions:
+        leaderboard = build_region_leaderboard(region, database)
+        leaderboard_collection.replace_one(
+            {constants.INDEX_ID: leaderboard[constants.INDEX_ID]}, leaderboard, upsert=True
+        )
+    leaderboard_collection.delete_many(
+        {constants.INDEX_ID: {"$nin": [str(region[constants.INDEX_ID]) for region in regions]}}
+    )
+    logger.debug(f"Top Gainers rebuilt for {len(regions)} regions")
+    return len(regions)
+
+
+def get_leaderboards(database=db):
+    return list(
+        database[constants.TOP_GAINERS_SCHEMA]
+        .find({})
+        .sort(constants.CREATED_AT_FIELD, -1)
+    )
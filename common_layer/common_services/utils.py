@@ -10,6 +10,7 @@ from auth_layer.prospect.prospect_services import html_text
 from fastapi import HTTPException, Header
 from core_layer.firebase.firebase_services import firebase_service
 from database import db
+from common_layer.common_services import region_locator
 from bson import ObjectId
 from http import HTTPStatus
 import hashlib
@@ -140,20 +141,9 @@ def upload_image(file, user_id, base, object_id):
     return response
 
 def get_nearest_region_id(location):
-    region_collection = db[constants.REGION_DETAILS_SCHEMA]
-    region_record = list(region_collection.find(
-        {
-            constants.LOCATION_FIELD: {
-                "$nearSphere": {
-                    "$geometry": {
-                        "type": "Point",
-                        "coordinates": [location.get("longitude"), location.get("latitude")],
-                    }
-                }
-            }
-        }, {constants.INDEX_ID: 1}
-    ).limit(1))
-    return region_record if region_record else None
+    # Answered from the in-process spatial index, so async callers need no
+    # awaitable variant.
+    return region_locator.nearest_region_record(location)
 
 def upload_pdf(file, user_id, base, object_id):
     logger.debug("Inside the Upload PDF Router")
@@ -0,0 +1,70 @@
+import threading
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from database import db
+from common_layer import constants
+from prospect_app.logging_module import logger
+
+
+class ViewCountBuffer:
+    """
+    Write-behind aggregator for property views. Views are counted in memory
+    per property and applied with one unordered bulk_write of `$inc` updates
+    on flush, so a hot listing costs one write per flush interval instead of
+    one per view. Counts from a failed flush are put back for the next one.
+    """
+
+    def __init__(self, collection_name=constants.PROPERTY_DETAILS_SCHEMA):
+        self.collection_name = collection_name
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+
+    def record(self, property_id, views=1):
+        object_id = ObjectId(property_id)
+        with self.lock:
+            self.pending[object_id] = self.pending.get(object_id, 0) + views
+
+    def _restore(self, counts):
+        with self.lock:
+            for object_id, views in counts.items():
+                self.pending[object_id] = self.pending.get(object_id, 0) + views
+
+    def flush(self, database=db):
+        # flush_lock keeps the cron and shutdown/nightly flushes from interleaving.
+        with self.flush_lock:
+            with self.lock:
+                counts, self.pending = self.pending, {}
+            if not counts:
+                return 0
+            object_ids = list(counts)
+            operations = [
+                UpdateOne(
+                    {constants.INDEX_ID: object_id},
+                    {"$inc": {constants.VIEW_COUNT_FIELD: counts[object_id]}},
+                )
+                for object_id in object_ids
+            ]
+            try:
+                database[self.collection_name].bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                # Only the failed operations are retried; the rest were applied.
+                failed_ids = {
+                    object_ids[error["index"]]
+                    for error in e.details.get("writeErrors", [])
+                }
+                self._restore(
+                    {object_id: counts[object_id] for object_id in failed_ids}
+                )
+                logger.error(f"View count flush failed for {len(failed_ids)} properties: {e}")
+                return len(counts) - len(failed_ids)
+            except Exception as e:
+                self._restore(counts)
+                logger.error(f"View count flush failed, {len(counts)} properties re-queued: {e}")
+                return 0
+            logger.debug(f"Flushed view counts for {len(counts)} properties")
+            return len(counts)
+
+
+view_counter = ViewCountBuffer()
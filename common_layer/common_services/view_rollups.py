@@ -0,0 +1,213 @@
+import sys
+import time
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+from fastapi import HTTPException
+from pymongo import UpdateOne
+from database import db
+from common_layer import constants
+from common_layer.common_schemas.property_schema import AnalyticsGranularity
+from prospect_app.logging_module import logger
+
+
+# One bucket document per (property, granularity, period). Each bucket keeps
+# the day -> views map for its period, so re-running a day overwrites that
+# day's entry and `views` is recomputed from the map instead of incremented.
+
+
+def utc_date(timestamp=None):
+    """Snapshot days are UTC dates; everything that names "today" uses this."""
+    return datetime.utcfromtimestamp(time.time() if timestamp is None else timestamp).date()
+
+
+def period_key(day, granularity):
+    if granularity == AnalyticsGranularity.WEEKLY.value:
+        iso_year, iso_week, _ = day.isocalendar()
+        return f"{iso_year}-W{iso_week:02d}"
+    if granularity == AnalyticsGranularity.MONTHLY.value:
+        return day.strftime("%Y-%m")
+    return day.isoformat()
+
+
+def period_start(day, granularity):
+    if granularity == AnalyticsGranularity.WEEKLY.value:
+        return day - timedelta(days=day.weekday())
+    if granularity == AnalyticsGranularity.MONTHLY.value:
+        return day.replace(day=1)
+    return day
+
+
+def rollup_operations(property_id, user_id, formatted_date, views, total_views):
+    """Upserts that record one day's views in every granularity's bucket."""
+    day = date.fromisoformat(formatted_date)
+    operations = []
+    for granularity in AnalyticsGranularity:
+        granularity = granularity.value
+        operations.append(
+            UpdateOne(
+                {
+                    constants.PROPERTY_ID_FIELD: property_id,
+                    "granularity": granularity,
+                    "period": period_key(day, granularity),
+                },
+                [
+                    {
+                        "$set": {
+                            constants.USER_ID_FIELD: user_id,
+                            "period_start": period_start(day, granularity).isoformat(),
+                            "days": {
+                                "$mergeObjects": [
+                                    {"$ifNull": ["$days", {}]},
+                                    {formatted_date: views},
+                                ]
+                            },
+                            # Cumulative total as of the latest day in the bucket.
+                            "total_views": {
+                                "$cond": [
+                                    {"$gte": [formatted_date, {"$ifNull": ["$last_date", ""]}]},
+                                    total_views,
+                                    "$total_views",
+                                ]
+                            },
+                            "last_date": {"$max": [{"$ifNull": ["$last_date", ""]}, formatted_date]},
+                        }
+                    },
+                    {
+                        "$set": {
+                            constants.VIEW_COUNT_FIELD: {
+                                "$sum": {
+                                    "$map": {
+                                        "input": {"$objectToArray": "$days"},
+                                        "as": "day",
+                                        "in": "$$day.v",
+                                    }
+                                }
+                            }
+                        }
+                    },
+                ],
+                upsert=True,
+            )
+        )
+    return operations
+
+
+def period_range(from_date, to_date, granularity):
+    """Default to the last ANALYTICS_DEFAULT_RANGE_DAYS when bounds are missing."""
+    to_date = to_date or utc_date()
+    from_date = from_date or to_date - timedelta(days=constants.ANALYTICS_DEFAULT_RANGE_DAYS)
+    if from_date > to_date:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="from must not be after to",
+        )
+    return period_key(from_date, granularity), period_key(to_date, granularity)
+
+
+def property_view_series(property_id, from_date, to_date, granularity, database=db):
+    first_period, last_period = period_range(from_date, to_date, granularity)
+    return list(
+        database[constants.PROPERTY_VIEW_ROLLUP_SCHEMA]
+        .find(
+            {
+                constants.PROPERTY_ID_FIELD: property_id,
+                "granularity": granularity,
+                "period": {"$gte": first_period, "$lte": last_period},
+            },
+            {
+                constants.INDEX_ID: 0,
+                "period": 1,
+                "period_start": 1,
+                constants.VIEW_COUNT_FIELD: 1,
+                "total_views": 1,
+            },
+        )
+        .sort("period", 1)
+    )
+
+
+def user_view_series(user_id, from_date, to_date, granularity, database=db):
+    first_period, last_period = period_range(from_date, to_date, granularity)
+    return list(
+        database[constants.PROPERTY_VIEW_ROLLUP_SCHEMA].aggregate(
+            [
+                {
+                    "$match": {
+                        constants.USER_ID_FIELD: user_id,
+                        "granularity": granularity,
+                        "period": {"$gte": first_period, "$lte": last_period},
+                    }
+                },
+                {
+                    "$group": {
+                        constants.INDEX_ID: "$period",
+                        "period_start": {"$first": "$period_start"},
+                        constants.VIEW_COUNT_FIELD: {"$sum": f"${constants.VIEW_COUNT_FIELD}"},
+                        "total_views": {"$sum": "$total_views"},
+                    }
+                },
+                {"$sort": {constants.INDEX_ID: 1}},
+            ]
+        )
+    )
+
+
+def latest_daily_snapshots(snapshots):
+    """
+    The old nightly job could write several snapshots for the same property
+    and day. From snapshots sorted by (property_id, data, _id), yield only
+    the last one written for each (property_id, data).
+    """
+    latest = None
+    for snapshot in snapshots:
+        if latest is not None and (
+            snapshot.get(constants.PROPERTY_ID_FIELD),
+            snapshot["data"],
+        ) != (latest.get(constants.PROPERTY_ID_FIELD), latest["data"]):
+            yield latest
+        latest = snapshot
+    if latest is not None:
+        yield latest
+
+
+def backfill_view_rollups(database=db):
+    """
+    Rebuild every bucket from the daily cumulative snapshots. Only needed once
+    for history written before the rollups existed; safe to run again. Each
+    day's views are its latest snapshot minus the previous distinct day's.
+    Writes are ordered because consecutive days of a property share buckets.
+    """
+    daily_collection = database[constants.CUSTOMER_DAILY_PROPERTY_ANALYTICS_SCHEMA]
+    rollup_collection = database[constants.PROPERTY_VIEW_ROLLUP_SCHEMA]
+    operations, previous_property_id, previous_total, snapshots = [], None, 0, 0
+    cursor = daily_collection.find(
+        {}, {constants.INDEX_ID: 0}, batch_size=constants.ANALYTICS_BULK_WRITE_BATCH_SIZE
+    ).sort([(constants.PROPERTY_ID_FIELD, 1), ("data", 1), (constants.INDEX_ID, 1)])
+    for snapshot in latest_daily_snapshots(cursor):
+        property_id = snapshot.get(constants.PROPERTY_ID_FIELD)
+        total_views = snapshot.get(constants.VIEW_COUNT_FIELD) or 0
+        if property_id != previous_property_id:
+            previous_property_id, previous_total = property_id, 0
+        operations.extend(
+            rollup_operations(
+                property_id,
+                snapshot.get(constants.USER_ID_FIELD),
+                snapshot["data"],
+                total_views - previous_total,
+                total_views,
+            )
+        )
+        previous_total = total_views
+        snapshots += 1
+        if len(operations) >= constants.ANALYTICS_BULK_WRITE_BATCH_SIZE:
+            rollup_collection.bulk_write(operations)
+            operations = []
+    if operations:
+        rollup_collection.bulk_write(operations)
+    logger.debug(f"View rollups backfilled from {snapshots} daily snapshots")
+    return snapshots
+
+if __name__ == "__main__":
+    # One-off backfill: `python -m common_layer.common_services.view_rollups`
+    backfill_view_rollups()
+    sys.exit(0)
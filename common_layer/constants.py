@@ -5,6 +5,39 @@ LOG_LEVEL = "DEBUG"
 HTTP_RESPONSE_SUCCESS = "success"
 HTTP_RESPONSE_FAILURE = "error"
 MONGODB_URL = os.getenv("MONGODB_URL")
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", 50))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", 0))
+MONGODB_ASYNC_MAX_POOL_SIZE = int(os.getenv("MONGODB_ASYNC_MAX_POOL_SIZE", 200))
+MONGODB_ASYNC_MIN_POOL_SIZE = int(os.getenv("MONGODB_ASYNC_MIN_POOL_SIZE", 10))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", 10000))
+QUERY_INSTRUMENTATION_ENABLED = os.getenv("QUERY_INSTRUMENTATION_ENABLED", "true").lower() == "true"
+QUERY_REPEAT_WARNING_THRESHOLD = int(os.getenv("QUERY_REPEAT_WARNING_THRESHOLD", 5))
+REGIONS_CACHE_TTL_SECONDS = int(os.getenv("REGIONS_CACHE_TTL_SECONDS", 300))
+REGIONS_CACHE_REFRESH_SECONDS = int(os.getenv("REGIONS_CACHE_REFRESH_SECONDS", 60))
+REGION_STATS_RECONCILE_SECONDS = int(os.getenv("REGION_STATS_RECONCILE_SECONDS", 3600))
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", 30))
+COUNT_CACHE_SIZE = int(os.getenv("COUNT_CACHE_SIZE", 10000))
+SEARCH_HISTOGRAM_BUCKETS = int(os.getenv("SEARCH_HISTOGRAM_BUCKETS", 6))
+SEARCH_PREFIX_EXPANSIONS = int(os.getenv("SEARCH_PREFIX_EXPANSIONS", 50))
+PROPERTY_TEXT_INDEX_REFRESH_SECONDS = int(os.getenv("PROPERTY_TEXT_INDEX_REFRESH_SECONDS", 300))
+PROPERTY_DETAIL_CACHE_TTL_SECONDS = int(os.getenv("PROPERTY_DETAIL_CACHE_TTL_SECONDS", 120))
+VIEW_COUNT_FLUSH_SECONDS = int(os.getenv("VIEW_COUNT_FLUSH_SECONDS", 5))
+ANALYTICS_BULK_WRITE_BATCH_SIZE = int(os.getenv("ANALYTICS_BULK_WRITE_BATCH_SIZE", 1000))
+ANALYTICS_DEFAULT_RANGE_DAYS = int(os.getenv("ANALYTICS_DEFAULT_RANGE_DAYS", 90))
+ANALYTICS_PREVIOUS_COUNT_WINDOW_DAYS = int(os.getenv("ANALYTICS_PREVIOUS_COUNT_WINDOW_DAYS", 7))
+TOP_GAINERS_LIMIT = int(os.getenv("TOP_GAINERS_LIMIT", 5))
+TOP_GAINERS_CACHE_TTL_SECONDS = int(os.getenv("TOP_GAINERS_CACHE_TTL_SECONDS", 60))
+TOP_GAINERS_REBUILD_SECONDS = int(os.getenv("TOP_GAINERS_REBUILD_SECONDS", 3600))
+SIMILAR_PROPERTIES_K = int(os.getenv("SIMILAR_PROPERTIES_K", 20))
+SIMILARITY_LOCATION_SCALE_KM = int(os.getenv("SIMILARITY_LOCATION_SCALE_KM", 50))
+SIMILARITY_BLOCK_CELLS = int(os.getenv("SIMILARITY_BLOCK_CELLS", 25000000))
+SIMILARITY_REFRESH_SECONDS = int(os.getenv("SIMILARITY_REFRESH_SECONDS", 60))
+SIMILARITY_STATE_TTL_SECONDS = int(os.getenv("SIMILARITY_STATE_TTL_SECONDS", 3600))
+RECOMMENDATION_NEIGHBOURS = int(os.getenv("RECOMMENDATION_NEIGHBOURS", 50))
+RECOMMENDATION_MAX_ITEMS_PER_USER = int(os.getenv("RECOMMENDATION_MAX_ITEMS_PER_USER", 200))
+RECOMMENDATIONS_LIMIT = int(os.getenv("RECOMMENDATIONS_LIMIT", 100))
+PROPERTY_IMPORT_CHUNK_SIZE = int(os.getenv("PROPERTY_IMPORT_CHUNK_SIZE", 500))
+PROPERTY_IMPORT_MAX_ERRORS = int(os.getenv("PROPERTY_IMPORT_MAX_ERRORS", 1000))
 UPDATE_INDEX_DATA = "$set"
 OR_INDEX_OPERATOR = "$or"
 NOT_EQUAL_TO_OPERATOR = "$ne"
@@ -56,6 +89,14 @@ TXT_TYPE = "txt"
 AWS_CLOUDFRONT_KEY_ID = os.getenv("AWS_CLOUDFRONT_KEY_ID")
 AWS_CLOUDFRONT_PRIVATE_KEY = os.getenv("AWS_CLOUDFRONT_PRIVATE_KEY")
 CLOUDFRONT_URL = os.getenv("CLOUDFRONT_URL")
+CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS = 86400 * 2
+CLOUDFRONT_SIGNED_URL_CACHE_TTL_SECONDS = int(os.getenv("CLOUDFRONT_SIGNED_URL_CACHE_TTL_SECONDS", 43200))
+CLOUDFRONT_SIGNED_URL_CACHE_SIZE = int(os.getenv("CLOUDFRONT_SIGNED_URL_CACHE_SIZE", 50000))
+CLOUDFRONT_SIGN_POOL_WORKERS = int(os.getenv("CLOUDFRONT_SIGN_POOL_WORKERS", 0))
+CLOUDFRONT_SIGN_POOL_MIN_BATCH = int(os.getenv("CLOUDFRONT_SIGN_POOL_MIN_BATCH", 256))
+CLOUDFRONT_MEDIA_DELIVERY_MODE = os.getenv("CLOUDFRONT_MEDIA_DELIVERY_MODE", "signed_url")
+CLOUDFRONT_MEDIA_GRANT_LIFETIME_SECONDS = int(os.getenv("CLOUDFRONT_MEDIA_GRANT_LIFETIME_SECONDS", 86400))
+CLOUDFRONT_COOKIE_DOMAIN = os.getenv("CLOUDFRONT_COOKIE_DOMAIN")
 
 REGION_ICON_BASE = "region_icons"
 WELCOME_CARD_BASE = "welcome_card"
@@ -67,6 +108,8 @@ PROJECT_LOGO_BASE = "project_logo"
 ADS_IMAGES_BASE = "ads_images"
 PROPERTY_DOCUMENT_BASE = "property_documents"
 TERMS_AND_POLICY_BASE = "terms_and_policy"
+# Public listing media served through signed cookies in signed_cookie mode.
+CLOUDFRONT_MEDIA_PREFIXES = [PROPERTY_IMAGES_BASE, PROJECT_LOGO_BASE]
 
 
 # Firebase
@@ -94,12 +137,19 @@ CUSTOMER_LEADS_SCHEMA = "customer_leads"
 CUSTOMER_CONVERSATION_SCHEMA = "customer_conversations"
 CUSTOMER_PROPERTY_ANALYTICS_SCHEMA = "customer_property_analytics"
 CUSTOMER_DAILY_PROPERTY_ANALYTICS_SCHEMA = "customer_daily_property_analytics"
+PROPERTY_VIEW_ROLLUP_SCHEMA = "property_view_rollups"
+TOP_GAINERS_SCHEMA = "top_gainers"
+PROPERTY_SIMILARITY_SCHEMA = "property_similarities"
+PROPERTY_SIMILARITY_CHANGE_SCHEMA = "property_similarity_changes"
+PROPERTY_COOCCURRENCE_SCHEMA = "property_cooccurrences"
+PROPERTY_IMPORT_JOB_SCHEMA = "property_import_jobs"
 CUSTOMER_BANK_DETAILS_SCHEMA = "customer_bank_details_schema"
 CUSTOMER_KYC_DETAILS_SCHEMA = "kyc_details_schema"
 PORTFOLIO_ANALYSIS_SCHEMA = "portfolio_analysis"
 CUSTOMER_FAVORITE_PROPERTY_SCHEMA = "customer_favorite_schema"
 NOTIFICATION_DETAILS_SCHEMA = "notification_details"
 TERMS_AND_POLICY_SCHEMA = "terms_and_policy"
+REGION_STATS_SCHEMA = "region_stats"
 
 # Schemas Fields
 STATUS_FIELD = "status"
@@ -137,6 +187,7 @@ LONGITUDE_FIELD = "longitude"
 ICON_IMAGE_FIELD = "icon_image_key"
 LOCATION_FIELD = "location"
 REGION_ID_FIELD = "region_id"
+REGION_TITLE_FIELD = "region_title"
 PROPERTY_CATEGORY_ID_FIELD = "property_category_id"
 DROPDOWN_TYPE_FIELD = "drop_down_type"
 LISTED_BY_USER_ID_FIELD = "listed_by_user_id"
@@ -180,6 +231,7 @@ POSSESSOION_TYPE_FIELD= "possession_type"
 LISTING_TYPE_FIELD="listing_type"
 IS_READ="is_read"
 SOURCE_TYPE_FIELD = "source_type"
+DISTANCE_FIELD = "distance"
 
 
 # Messages
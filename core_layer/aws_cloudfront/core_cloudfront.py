@@ -1,35 +1,216 @@
+import base64
 import datetime
-import rsa
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 from common_layer import constants
+from common_layer.common_services.timed_cache import TimedCache
 from botocore.signers import CloudFrontSigner
 import time
 from prospect_app.logging_module import logger
 AWS_CLOUDFRONT_KEY_ID = constants.AWS_CLOUDFRONT_KEY_ID
 AWS_CLOUDFRONT_PRIVATE_KEY = constants.AWS_CLOUDFRONT_PRIVATE_KEY
 
+# Signed URLs are reused per S3 key until half their lifetime has passed, so
+# a cached URL always has at least that long left when it is handed out.
+signed_url_cache = TimedCache(
+    min(
+        constants.CLOUDFRONT_SIGNED_URL_CACHE_TTL_SECONDS,
+        constants.CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS // 2,
+    ),
+    max_entries=constants.CLOUDFRONT_SIGNED_URL_CACHE_SIZE,
+)
 
-def rsa_signer(message):
-    private_key = AWS_CLOUDFRONT_PRIVATE_KEY
-    return rsa.sign(
-        message, rsa.PrivateKey.load_pkcs1(private_key.encode("utf-8")), "SHA-1"
+
+@functools.lru_cache(maxsize=1)
+def load_private_key():
+    # Parsing the PEM is as slow as a signature; do it once per process.
+    return serialization.load_pem_private_key(
+        AWS_CLOUDFRONT_PRIVATE_KEY.encode("utf-8"), password=None
     )
 
 
+def rsa_signer(message):
+    # OpenSSL-backed PKCS#1 v1.5 / SHA-1, the scheme CloudFront expects.
+    return load_private_key().sign(message, padding.PKCS1v15(), hashes.SHA1())
+
+
+@functools.lru_cache(maxsize=1)
 def get_cloudfront_signer_instance():
     cloudfront_signer = CloudFrontSigner(AWS_CLOUDFRONT_KEY_ID, rsa_signer)
     return cloudfront_signer
 
 
+def sign_url(s3_key_path):
+    date = datetime.datetime.fromtimestamp(time.time() + constants.CLOUDFRONT_SIGNATURE_LIFETIME_SECONDS)
+    url = f"{constants.CLOUDFRONT_URL}{s3_key_path}"
+    return get_cloudfront_signer_instance().generate_presigned_url(
+        url, date_less_than=date
+    )
+
+
+# Media delivery modes. In "signed_url" mode every URL carries its own
+# signature. In "signed_cookie" mode keys under CLOUDFRONT_MEDIA_PREFIXES are
+# returned as plain, stable CloudFront URLs and access is granted by one
+# wildcard custom policy per prefix, delivered as cookies (or as a query
+# string for clients without a cookie jar) by get_media_grants().
+SIGNED_URL_MODE = "signed_url"
+SIGNED_COOKIE_MODE = "signed_cookie"
+
+
+def is_cookie_media_key(s3_key_path):
+    return constants.CLOUDFRONT_MEDIA_DELIVERY_MODE == SIGNED_COOKIE_MODE and any(
+        s3_key_path.startswith(f"{prefix}/") for prefix in constants.CLOUDFRONT_MEDIA_PREFIXES
+    )
+
+
 def cloudfront_sign(s3_key_path, expires_days=1):
-    logger.debug("Inside Cloudfront Sign")
-    date = datetime.datetime.fromtimestamp(time.time() + 86400 * 2)
-    cloudfront_signer_instance = get_cloudfront_signer_instance()
-    url_base = constants.CLOUDFRONT_URL
     if s3_key_path.startswith("/"):
         s3_key_path = s3_key_path[1:]
-    url = f"{url_base}{s3_key_path}"
-    signed_url = cloudfront_signer_instance.generate_presigned_url(
-        url, date_less_than=date
-    )
-    logger.debug("Returning From Cloudfront Sign")
+    if is_cookie_media_key(s3_key_path):
+        return f"{constants.CLOUDFRONT_URL}{s3_key_path}"
+    signed_url = signed_url_cache.get(s3_key_path)
+    if signed_url is None:
+        logger.debug(f"Signing Cloudfront URL for {s3_key_path}")
+        signed_url = signed_url_cache.set(s3_key_path, sign_url(s3_key_path))
     return signed_url
+
+
+_sign_pool = None
+_sign_pool_lock = threading.Lock()
+
+
+def init_sign_worker(key_id, private_key, cloudfront_url):
+    # Hand the parent's signing settings to the worker explicitly, so pools
+    # started with spawn or forkserver sign exactly like forked ones.
+    global AWS_CLOUDFRONT_KEY_ID, AWS_CLOUDFRONT_PRIVATE_KEY
+    AWS_CLOUDFRONT_KEY_ID, AWS_CLOUDFRONT_PRIVATE_KEY = key_id, private_key
+    constants.CLOUDFRONT_URL = cloudfront_url
+    load_private_key.cache_clear()
+    get_cloudfront_signer_instance.cache_clear()
+
+
+def get_sign_pool():
+    global _sign_pool
+    with _sign_pool_lock:
+        if _sign_pool is None:
+            # Spawned, not forked: the app process holds Mongo clients, an
+            # event loop and scheduler threads that must not be copied.
+            _sign_pool = ProcessPoolExecutor(
+                max_workers=constants.CLOUDFRONT_SIGN_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_sign_worker,
+                initargs=(AWS_CLOUDFRONT_KEY_ID, AWS_CLOUDFRONT_PRIVATE_KEY, constants.CLOUDFRONT_URL),
+            )
+        return _sign_pool
+
+
+def shutdown_sign_pool():
+    global _sign_pool
+    with _sign_pool_lock:
+        if _sign_pool is not None:
+            logger.debug("Shutting down Cloudfront signing pool")
+            _sign_pool.shutdown(cancel_futures=True)
+            _sign_pool = None
+
+
+def sign_urls(s3_key_paths):
+    # Runs in the pool workers, which load the key once each.
+    return [sign_url(s3_key_path) for s3_key_path in s3_key_paths]
+
+
+def sign_many(s3_key_paths):
+    """
+    Sign a batch of S3 keys; returns {s3_key_path: url} for every non-empty
+    key, with keys as given. Cached URLs are reused as in cloudfront_sign.
+    When at least CLOUDFRONT_SIGN_POOL_MIN_BATCH keys still need a
+    signature and CLOUDFRONT_SIGN_POOL_WORKERS is set, they are split
+    across a process pool; smaller batches are signed inline, where the
+    pool's hand-off costs more than it saves (see
+    benchmarks/cloudfront_sign_many_benchmark.py).
+    """
+    urls, unsigned = {}, {}
+    for s3_key_path in dict.fromkeys(s3_key_paths):
+        if not s3_key_path:
+            continue
+        key = s3_key_path[1:] if s3_key_path.startswith("/") else s3_key_path
+        if is_cookie_media_key(key):
+            urls[s3_key_path] = f"{constants.CLOUDFRONT_URL}{key}"
+            continue
+        signed_url = signed_url_cache.get(key)
+        if signed_url is None:
+            unsigned.setdefault(key, []).append(s3_key_path)
+        else:
+            urls[s3_key_path] = signed_url
+
+    keys = list(unsigned)
+    workers = constants.CLOUDFRONT_SIGN_POOL_WORKERS
+    if workers > 0 and len(keys) >= constants.CLOUDFRONT_SIGN_POOL_MIN_BATCH:
+        logger.debug(f"Signing {len(keys)} Cloudfront URLs across {workers} processes")
+        chunk_size = -(-len(keys) // workers)
+        chunks = [keys[start:start + chunk_size] for start in range(0, len(keys), chunk_size)]
+        signed = [url for chunk in get_sign_pool().map(sign_urls, chunks) for url in chunk]
+    else:
+        if keys:
+            logger.debug(f"Signing {len(keys)} Cloudfront URLs")
+        signed = sign_urls(keys)
+
+    for key, signed_url in zip(keys, signed):
+        signed_url_cache.set(key, signed_url)
+        for s3_key_path in unsigned[key]:
+            urls[s3_key_path] = signed_url
+    return urls
+
+
+media_grant_cache = TimedCache(constants.CLOUDFRONT_MEDIA_GRANT_LIFETIME_SECONDS // 2)
+
+
+def cloudfront_b64encode(data):
+    # CloudFront's URL-safe variant of base64.
+    return (
+        base64.b64encode(data)
+        .replace(b"+", b"-")
+        .replace(b"=", b"_")
+        .replace(b"/", b"~")
+        .decode("utf-8")
+    )
+
+
+def build_media_grant(prefix):
+    expires_at = int(time.time()) + constants.CLOUDFRONT_MEDIA_GRANT_LIFETIME_SECONDS
+    policy = get_cloudfront_signer_instance().build_policy(
+        f"{constants.CLOUDFRONT_URL}{prefix}/*",
+        datetime.datetime.fromtimestamp(expires_at),
+    ).encode("utf-8")
+    cookies = {
+        "CloudFront-Policy": cloudfront_b64encode(policy),
+        "CloudFront-Signature": cloudfront_b64encode(rsa_signer(policy)),
+        "CloudFront-Key-Pair-Id": AWS_CLOUDFRONT_KEY_ID,
+    }
+    return {
+        "prefix": prefix,
+        "path": f"/{prefix}/",
+        "expires_at": expires_at,
+        "cookies": cookies,
+        # Same grant for URL-only clients: append to any URL under the prefix.
+        "query": (
+            f"Policy={cookies['CloudFront-Policy']}"
+            f"&Signature={cookies['CloudFront-Signature']}"
+            f"&Key-Pair-Id={AWS_CLOUDFRONT_KEY_ID}"
+        ),
+    }
+
+
+def get_media_grants():
+    """
+    One wildcard-policy grant per media prefix. Grants are shared by every
+    session and re-signed once half their lifetime has passed, so the
+    signing cost is a handful of RSA operations per process per day.
+    """
+    return [
+        media_grant_cache.get_or_load(prefix, lambda: build_media_grant(prefix))
+        for prefix in constants.CLOUDFRONT_MEDIA_PREFIXES
+    ]
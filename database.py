@@ -1,10 +1,28 @@
 import pymongo
 from common_layer import constants
 from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from common_layer.common_services.query_instrumentation import command_listener
 
 mongodb_uri = f"{constants.MONGODB_URL}"
-client = MongoClient(mongodb_uri)
+event_listeners = [command_listener] if constants.QUERY_INSTRUMENTATION_ENABLED else []
+client = MongoClient(
+    mongodb_uri,
+    maxPoolSize=constants.MONGODB_MAX_POOL_SIZE,
+    minPoolSize=constants.MONGODB_MIN_POOL_SIZE,
+    waitQueueTimeoutMS=constants.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+    event_listeners=event_listeners,
+)
 db_name = pymongo.uri_parser.parse_uri(mongodb_uri)['database']
 db = client[f'{db_name}']
 
-                
+# Async handle for the `async def` routers. It shares the database with `db`
+# but keeps its own pool so event-loop traffic never waits on threadpool work.
+async_client = AsyncIOMotorClient(
+    mongodb_uri,
+    maxPoolSize=constants.MONGODB_ASYNC_MAX_POOL_SIZE,
+    minPoolSize=constants.MONGODB_ASYNC_MIN_POOL_SIZE,
+    waitQueueTimeoutMS=constants.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+    event_listeners=event_listeners,
+)
+async_db = async_client[f'{db_name}']
@@ -21,11 +21,13 @@ from routers import (
 )
 from auth_layer.prospect.prospect_services import customer_property_service, customer_investment_service
 from auth_layer.admin.admin_services import admin_user_management_service
-from database import db
+from database import db, client, async_client
 from common_layer import constants
-from common_layer.common_services import user_management_service
+from common_layer.common_services import user_management_service, index_registry, region_stats, region_locator, property_text_index, top_gainers, similarity_engine, recommendations
+from common_layer.common_services.query_instrumentation import QueryInstrumentationMiddleware
+from common_layer.common_services.view_counter import view_counter
+from core_layer.aws_cloudfront import core_cloudfront
 from common_layer.common_schemas.user_schema import UserTypes, RegisterRequest
-from pymongo import GEOSPHERE
 
 
 middleware = [
@@ -48,6 +50,8 @@ app = FastAPI(
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+if constants.QUERY_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryInstrumentationMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -65,7 +69,15 @@ app.include_router(customer_conversation_router.router)
 app.include_router(customer_kyc_router.router)
 
 
-schedule.every().day.at("00:05").do(customer_property_service.add_todays_property_count)
+# Long batch jobs get their own scheduler, drained from a sync task so they
+# run in the threadpool; the default one is drained on the event loop.
+batch_job_schedule = schedule.Scheduler()
+batch_job_schedule.every().day.at("00:05").do(customer_property_service.add_todays_property_count)
+@app.on_event("startup")
+@repeat_every(seconds=60)
+def batch_job_cron()->None:
+        batch_job_schedule.run_pending()
+
 
 @app.on_event("startup")
 @repeat_every(seconds=60)
@@ -89,7 +101,7 @@ def add_seed_users():
             password_confirmed="Test@123",
             user_type=UserTypes.SUPER_ADMIN.value,
         )
-        response = user_management_service.register_user(admin_user)
+        user_management_service.register_user(admin_user)
         logger.debug("Admin user added")
     if (
         db[constants.USER_DETAILS_SCHEMA].count_documents(
@@ -105,7 +117,7 @@ def add_seed_users():
             password_confirmed="Test@123",
             user_type=UserTypes.PARTNER.value,
         )
-        response = user_management_service.register_user(partner_user)
+        user_management_service.register_user(partner_user)
         logger.debug("Partner user added" )
 
     if (
@@ -122,28 +134,63 @@ def add_seed_users():
             password_confirmed="Test@123",
             user_type=UserTypes.CUSTOMER.value,
         )
-        response = user_management_service.register_user(customer_user)
+        user_management_service.register_user(customer_user)
         logger.debug("Customer user added ")
-    if db[constants.PROPERTY_DETAILS_SCHEMA].count_documents({}) == 0:
-        response = db[constants.PROPERTY_DETAILS_SCHEMA].create_index(
-            [("location", GEOSPHERE)]
-        )
-        logger.debug("Index created: " + str(response))
-        response2 = db[constants.REGION_DETAILS_SCHEMA].create_index(
-            [("location", GEOSPHERE)]
-        )
-        logger.debug("Index created: " + str(response2))
-        logger.debug("App startup: " + str(datetime.now()))
+    index_registry.ensure_indexes()
+    logger.debug("App startup: " + str(datetime.now()))
 
 
 
 
+@app.on_event("shutdown")
+def close_database_connections():
+    view_counter.flush()
+    logger.debug("Closing MongoDB connections")
+    async_client.close()
+    client.close()
+    core_cloudfront.shutdown_sign_pool()
+
+
 schedule.every().day.at("23:50").do(customer_investment_service.user_wallet_snapshot_handler)
 @app.on_event("startup")
 @repeat_every(seconds=60)
 async def user_wallet_snapshot_cron()->None:
         schedule.run_pending()
 
+@app.on_event("startup")
+@repeat_every(seconds=constants.REGIONS_CACHE_REFRESH_SECONDS)
+def regions_cache_refresh_cron()->None:
+        region_locator.rebuild_region_index()
+        customer_property_service.refresh_regions_cache()
+
+@app.on_event("startup")
+@repeat_every(seconds=constants.REGION_STATS_RECONCILE_SECONDS)
+def region_stats_reconcile_cron()->None:
+        region_stats.reconcile_region_stats()
+        customer_property_service.refresh_regions_cache()
+
+@app.on_event("startup")
+@repeat_every(seconds=constants.PROPERTY_TEXT_INDEX_REFRESH_SECONDS)
+def property_text_index_rebuild_cron()->None:
+        property_text_index.rebuild_property_text_index()
+
+@app.on_event("startup")
+@repeat_every(seconds=constants.VIEW_COUNT_FLUSH_SECONDS)
+def view_count_flush_cron()->None:
+        view_counter.flush()
+
+@app.on_event("startup")
+@repeat_every(seconds=constants.TOP_GAINERS_REBUILD_SECONDS)
+def top_gainers_rebuild_cron()->None:
+        top_gainers.rebuild_leaderboards()
+
+batch_job_schedule.every().day.at("01:00").do(similarity_engine.rebuild_similarities)
+batch_job_schedule.every().day.at("01:30").do(recommendations.rebuild_cooccurrences)
+@app.on_event("startup")
+@repeat_every(seconds=constants.SIMILARITY_REFRESH_SECONDS)
+def similarity_refresh_cron()->None:
+        similarity_engine.refresh_changed_properties()
+
 
 @app.get("/privacy-policy", response_class=HTMLResponse)
 def get_privacy_policy(request: Request):
@@ -13,9 +13,9 @@ router = APIRouter(
 )
 
 @router.get("/get-customer-conversation")
-def get_user_wallet(page_number:int, per_page:int,type:str, token: str = Depends(oauth2_scheme)):
+async def get_user_wallet(page_number:int, per_page:int,type:str, include_total: bool = True, token: str = Depends(oauth2_scheme)):
     logger.debug("Inside Get User Wallet Router")
-    response = customer_conversation_service.get_customer_conversations(page_number, per_page,type, token)
+    response = await customer_conversation_service.get_customer_conversations(page_number, per_page,type, token, include_total)
     logger.debug("Returning From the Get User Wallet Router")
     return response
 
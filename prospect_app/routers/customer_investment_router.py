@@ -14,9 +14,9 @@ router = APIRouter(
 
 
 @router.get("/user-wallet")
-def get_user_wallet(token: str = Depends(oauth2_scheme)):
+async def get_user_wallet(token: str = Depends(oauth2_scheme)):
     logger.debug("Inside Get User Wallet Router")
-    response = customer_investment_service.get_user_wallet(token=token)
+    response = await customer_investment_service.get_user_wallet(token=token)
     logger.debug("Returning From the Get User Wallet Router")
     return response
 
@@ -35,16 +35,16 @@ def withdraw_balance(token: str = Depends(oauth2_scheme), amount: float = Form(.
     return response
 
 @router.post("/buy-investment-share")
-def buy_investment_quanity(token: str = Depends(oauth2_scheme), quantity: int = Form(...), property_id: str = Form(...)):
+async def buy_investment_quanity(token: str = Depends(oauth2_scheme), quantity: int = Form(...), property_id: str = Form(...)):
     logger.debug("Inside Buy Investment Share Router")
-    response = customer_investment_service.buy_investment_share(token=token, quantity=quantity, property_id=property_id)
+    response = await customer_investment_service.buy_investment_share(token=token, quantity=quantity, property_id=property_id)
     logger.debug("Returning From the Buy Investment Share Router")
     return response
 
 @router.post("/sell-investment-share")
-def sell_investment_quanity(token: str = Depends(oauth2_scheme), quantity: int = Form(...), property_id: str = Form(...)):
+async def sell_investment_quanity(token: str = Depends(oauth2_scheme), quantity: int = Form(...), property_id: str = Form(...)):
     logger.debug("Inside Sell Investment Share Router")
-    response = customer_investment_service.sell_investment_share(token=token, quantity=quantity, property_id=property_id)
+    response = await customer_investment_service.sell_investment_share(token=token, quantity=quantity, property_id=property_id)
     logger.debug("Returning From the Sell Investment Share Router")
     return response
 
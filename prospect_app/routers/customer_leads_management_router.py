@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, Form, UploadFile, File
+from datetime import date
+from fastapi import APIRouter, Depends, Form, UploadFile, File, Query
 from logging_module import logger
 from pydantic import EmailStr
 from typing import Annotated, List
 from common_layer.common_services.utils import valid_content_length
 from common_layer.common_services.oauth_handler import oauth2_scheme
 from auth_layer.prospect.prospect_services import customer_leads_management_service
+from common_layer.common_schemas.property_schema import AnalyticsGranularity
 
 router = APIRouter(
     prefix="/api/v1",
@@ -70,15 +72,26 @@ def change_lead_status(lead_id:str, status:str, token: str = Depends(oauth2_sche
     return response
 
 @router.get("/get-property-analytics")
-def get_property_analytics(property_id:str, token: str = Depends(oauth2_scheme)):
+def get_property_analytics(
+    property_id: str,
+    from_date: date = Query(None, alias="from", description="First day, YYYY-MM-DD"),
+    to_date: date = Query(None, alias="to", description="Last day, YYYY-MM-DD"),
+    granularity: AnalyticsGranularity = Query(AnalyticsGranularity.DAILY, description="daily, weekly or monthly"),
+    token: str = Depends(oauth2_scheme),
+):
     logger.debug("Inside Get Property Analytics Router")
-    response = customer_leads_management_service.get_property_analytics(property_id, token)
+    response = customer_leads_management_service.get_property_analytics(property_id, from_date, to_date, granularity.value, token)
     logger.debug("Returning From the Get Property Analytics Router")
     return response
 
 @router.get("/get-dashboard-analytics")
-def get_dashboard_analytics(token: str = Depends(oauth2_scheme)):
+def get_dashboard_analytics(
+    from_date: date = Query(None, alias="from", description="First day, YYYY-MM-DD"),
+    to_date: date = Query(None, alias="to", description="Last day, YYYY-MM-DD"),
+    granularity: AnalyticsGranularity = Query(AnalyticsGranularity.DAILY, description="daily, weekly or monthly"),
+    token: str = Depends(oauth2_scheme),
+):
     logger.debug("Inside Get Dashboard Analytics Router")
-    response = customer_leads_management_service.get_dashboard_analytics(token)
+    response = customer_leads_management_service.get_dashboard_analytics(from_date, to_date, granularity.value, token)
     logger.debug("Returning From the Get Dashboard Analytics Router")
     return response
\ No newline at end of file
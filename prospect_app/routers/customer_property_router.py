@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Form, UploadFile, File, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Response, UploadFile, File, Query
 from logging_module import logger
 from pydantic import EmailStr
 from typing import Annotated, List
@@ -9,6 +9,7 @@ from common_layer.common_schemas.property_schema import (
     ResidentialPropertyRequestSchema, 
     CommercialPropertyRequestSchema,
     FarmPropertyRequestSchema,
+    BatchPropertyRequestSchema,
 )
 router = APIRouter(
     prefix="/api/v1",
@@ -81,6 +82,20 @@ def add_farm_property(request :FarmPropertyRequestSchema , token: str = Depends(
     response = customer_property_service.add_farm_property(request=request, token=token)
     logger.debug("Returning From the Add Farm Property Router")
     return response
+
+@router.post("/import-properties")
+def import_properties(background_tasks: BackgroundTasks, file: UploadFile = File(...), token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Import Properties Router")
+    response = customer_property_service.import_properties(file=file, background_tasks=background_tasks, token=token)
+    logger.debug("Returning From the Import Properties Router")
+    return response
+
+@router.get("/import-properties/{job_id}")
+def get_property_import_job(job_id: str, token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Get Property Import Job Router")
+    response = customer_property_service.get_property_import_job(job_id=job_id, token=token)
+    logger.debug("Returning From the Get Property Import Job Router")
+    return response
     
 @router.put("/update-farm-property")
 def update_farm_property(property_id:str, request: FarmPropertyRequestSchema, token: str = Depends(oauth2_scheme)):
@@ -98,40 +113,54 @@ def update_property_view_count(property_id:str):
 
 # Add Pagination
 @router.get("/get-list-of-featured-properties")
-def get_list_of_featured_properties(latitude:float, longitude:float, per_page: int, page_number: int):
+async def get_list_of_featured_properties(latitude:float, longitude:float, per_page: int, page_number: int = 1, cursor: str = None, include_total: bool = True):
     logger.debug("Inside Get List of Featured Properties Router")
-    response = customer_property_service.get_list_of_featured_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number)
+    response = await customer_property_service.get_list_of_featured_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number, cursor=cursor, include_total=include_total)
     logger.debug("Returning From the Get List of Featured Properties Router")
     return response
 
 # Add Pagination
 @router.get("/get-list-of-recommended-properties")
-def get_list_of_recommended_properties(per_page: int, page_number: int,latitude:float, longitude:float):
+async def get_list_of_recommended_properties(per_page: int, page_number: int,latitude:float, longitude:float, include_total: bool = True):
     logger.debug("Inside Get List of Recommended Properties Router")
-    response = customer_property_service.get_list_of_recommended_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number)
+    response = await customer_property_service.get_list_of_recommended_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number, include_total=include_total)
     logger.debug("Returning From the Get List of Recommended Properties Router")
     return response
 
+@router.get("/media-access")
+def get_media_access(response: Response, token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Get Media Access Router")
+    service_response = customer_property_service.get_media_access(http_response=response, token=token)
+    logger.debug("Returning From the Get Media Access Router")
+    return service_response
+
+@router.get("/recommendations/me")
+async def get_my_recommendations(per_page: int, page_number: int, latitude: float, longitude: float, include_total: bool = True, token: str = Depends(oauth2_scheme)):
+    logger.debug("Inside Get My Recommendations Router")
+    response = await customer_property_service.get_my_recommendations(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number, include_total=include_total, token=token)
+    logger.debug("Returning From the Get My Recommendations Router")
+    return response
+
 # Add Pagination
 @router.get("/get-list-of-most-viewed-properties")
-def get_list_of_most_viewed_properties(per_page: int, page_number: int):
+async def get_list_of_most_viewed_properties(per_page: int, page_number: int, include_total: bool = True):
     logger.debug("Inside Get List of Most Viewed Properties Router")
-    response = customer_property_service.get_list_of_most_viewed_properties(per_page=per_page, page_number=page_number)
+    response = await customer_property_service.get_list_of_most_viewed_properties(per_page=per_page, page_number=page_number, include_total=include_total)
     logger.debug("Returning From the Get List of Most Viewed Properties Router")
     return response
 
 # Add Pagination
 @router.get("/get-list-of-top-properties")
-def get_list_of_top_properties(latitude:float, longitude:float, per_page: int, page_number: int):
+async def get_list_of_top_properties(latitude:float, longitude:float, per_page: int, page_number: int, include_total: bool = True):
     logger.debug("Inside Get List of Top Properties Router")
-    response = customer_property_service.get_list_of_top_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number)
+    response = await customer_property_service.get_list_of_top_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number, include_total=include_total)
     logger.debug("Returning From the Get List of Top Properties Router")
     return response
 
 @router.get("/get-nearby-properties")
-def get_nearby_properties(latitude:float, longitude:float, per_page: int, page_number: int):
+async def get_nearby_properties(latitude:float, longitude:float, per_page: int, page_number: int, include_total: bool = True, max_distance: float = Query(None, gt=0, description="Search radius in metres")):
     logger.debug("Inside Get Nearby Properties Router")
-    response = customer_property_service.get_nearby_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number)
+    response = await customer_property_service.get_nearby_properties(latitude=latitude, longitude=longitude, per_page=per_page, page_number=page_number, include_total=include_total, max_distance=max_distance)
     logger.debug("Returning From the Get Nearby Properties Router")
     return response
 
@@ -172,20 +201,20 @@ def get_property_by_id(property_id:str):
     return response
 
 @router.post("/get-property-list")
-def get_property_list(per_page:int, page_number:int, filter_dict:dict, sort_dict:dict):
+async def get_property_list(per_page:int, filter_dict:dict, sort_dict:dict, page_number:int = 1, cursor: str = None, include_total: bool = True):
     logger.debug("Inside Get Property List Router")
-    response = customer_property_service.get_property_list(
+    response = await customer_property_service.get_property_list(
         per_page=per_page, page_number=page_number,
-        filter_dict=filter_dict, sort_dict=sort_dict
+        filter_dict=filter_dict, sort_dict=sort_dict, cursor=cursor, include_total=include_total
     )
     logger.debug("Returning From the Get Property List Router")
     return response
 
 @router.post("/get-property-list-by-region-id")
-def get_property_list_by_region_id(per_page:int, page_number:int, region_id:str):
+async def get_property_list_by_region_id(per_page:int, region_id:str, page_number:int = 1, cursor: str = None, include_total: bool = True):
     logger.debug("Inside Get Property List by Region Id Router")
-    response = customer_property_service.get_property_list_by_region_id(
-        per_page=per_page, page_number=page_number,region_id=region_id
+    response = await customer_property_service.get_property_list_by_region_id(
+        per_page=per_page, page_number=page_number,region_id=region_id, cursor=cursor, include_total=include_total
         
     )
     logger.debug("Returning From the Get Property List by Region ID Router")
@@ -209,9 +238,9 @@ def get_top_gainers():
     return response
 
 @router.get("/get-similar-properties")
-def get_similar_properties(region_id:str, page_number:int, per_page:int):
+async def get_similar_properties(per_page:int, region_id:str = None, page_number:int = 1, cursor: str = None, include_total: bool = True, property_id: str = None):
     logger.debug("Inside Get Similar Properties Router")
-    response = customer_property_service.get_similar_properties(region_id=region_id, page_number=page_number, per_page=per_page)
+    response = await customer_property_service.get_similar_properties(region_id=region_id, page_number=page_number, per_page=per_page, cursor=cursor, include_total=include_total, property_id=property_id)
     logger.debug("Returning From the Get Similar Properties Router")
     return response
 
@@ -223,7 +252,7 @@ def change_property_status(property_id:str, status:str, token: str = Depends(oau
     return response
 
 @router.get("/filter-properties")
-def filter_properties(
+async def filter_properties(
     listing_type: str = Query(None, description="Listing type filter"),
     listed_by: str = Query(None, description="Listed by filter"),
     category: str = Query(None, description="Category filter"),
@@ -233,13 +262,62 @@ def filter_properties(
     region_id: str = Query(None, description="Region ID filter"),
     roi_percentage_max: int = Query(None, description="Maximum ROI percentage filter"),
     page_number: int = Query(1, ge=1, description="Page number starting from 1"),
-    per_page: int = Query(10, le=50, description="Number of items per page (max: 50)")
+    per_page: int = Query(10, le=50, description="Number of items per page (max: 50)"),
+    cursor: str = Query(None, description="next_cursor from the previous page; overrides page_number"),
+    include_total: bool = Query(True, description="Set false to skip the total count")
 ):
     logger.debug("Inside Filter Property Router")
-    response = customer_property_service.get_filtered_properties(listing_type, listed_by,category,possession_type,price_max,area_max,region_id,roi_percentage_max, page_number, per_page)
+    response = await customer_property_service.get_filtered_properties(listing_type, listed_by,category,possession_type,price_max,area_max,region_id,roi_percentage_max, page_number, per_page, cursor, include_total)
     logger.debug("Returning From the Change Property Status Router")
     return response
 
+@router.get("/search-properties")
+async def search_properties(
+    listing_type: str = Query(None, description="Listing type filter"),
+    listed_by: str = Query(None, description="Listed by filter"),
+    category: str = Query(None, description="Category filter"),
+    possession_type: str = Query(None, description="Possession type filter"),
+    price_max: float = Query(None, description="Maximum price filter"),
+    area_max: int = Query(None, description="Maximum area filter"),
+    region_id: str = Query(None, description="Region ID filter"),
+    roi_percentage_max: int = Query(None, description="Maximum ROI percentage filter"),
+    page_number: int = Query(1, ge=1, description="Page number starting from 1"),
+    per_page: int = Query(10, le=50, description="Number of items per page (max: 50)"),
+    include_total: bool = Query(True, description="Set false to skip the total count")
+):
+    logger.debug("Inside Search Properties Router")
+    response = await customer_property_service.search_properties(listing_type, listed_by,category,possession_type,price_max,area_max,region_id,roi_percentage_max, page_number, per_page, include_total)
+    logger.debug("Returning From the Search Properties Router")
+    return response
+
+@router.post("/properties/batch")
+def get_properties_batch(request: BatchPropertyRequestSchema):
+    logger.debug("Inside Get Properties Batch Router")
+    response = customer_property_service.get_properties_batch(request)
+    logger.debug("Returning From the Get Properties Batch Router")
+    return response
+
+@router.get("/search")
+async def text_search_properties(
+    q: str = Query(..., min_length=1, max_length=100, description="Project title, address or region"),
+    page_number: int = Query(1, ge=1, description="Page number starting from 1"),
+    per_page: int = Query(10, le=50, description="Number of items per page (max: 50)"),
+):
+    logger.debug("Inside Text Search Properties Router")
+    response = await customer_property_service.text_search_properties(q, page_number, per_page)
+    logger.debug("Returning From the Text Search Properties Router")
+    return response
+
+@router.get("/search/suggest")
+def get_search_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="Partially typed search text"),
+    limit: int = Query(8, ge=1, le=20, description="Number of suggestions (max: 20)"),
+):
+    logger.debug("Inside Get Search Suggestions Router")
+    response = customer_property_service.get_search_suggestions(q, limit)
+    logger.debug("Returning From the Get Search Suggestions Router")
+    return response
+
 @router.post("/add-customer-favorite-property")
 def add_customer_favorite_property(property_id:str, token: str = Depends(oauth2_scheme)):
     logger.debug("Inside Add Customer Favorite Property Router")
@@ -255,9 +333,9 @@ def remove_customer_favorite_property(property_id:str, token: str = Depends(oaut
     return response
 
 @router.get("/get-customer-favorite-property")
-def get_customer_favorite_property(page_number:int, per_page:int, token: str = Depends(oauth2_scheme)):
+async def get_customer_favorite_property(per_page:int, page_number:int = 1, cursor: str = None, include_total: bool = True, token: str = Depends(oauth2_scheme)):
     logger.debug("Inside Get Customer Favorite Property Router")
-    response = customer_property_service.get_customer_bookmarks(page_number=page_number,per_page=per_page,  token=token)
+    response = await customer_property_service.get_customer_bookmarks(page_number=page_number,per_page=per_page,  token=token, cursor=cursor, include_total=include_total)
     logger.debug("Returning From the Get Customer Favorite Property Router")
     return response
 
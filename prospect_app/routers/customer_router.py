@@ -235,13 +235,14 @@ def get_welcome_card_info():
 
 
 @router.get("/get-notifications")
-def get_notifications(
+async def get_notifications(
     page_number: int,
     per_page: int,
     token: Annotated[str, Depends(oauth2_scheme)],
+    include_total: bool = True,
 ):
     logger.debug("Inside Get Notifications Router")
-    response = customer_management_service.get_notifications(page_number,per_page,token)
+    response = await customer_management_service.get_notifications(page_number,per_page,token,include_total)
     logger.debug("Returning From the Get Notifications Router")
     return response
 
@@ -0,0 +1,46 @@
+import copy
+import os
+import sys
+import pytest
+from pymongo import monitoring
+
+# common_layer.constants reads these at import time; point the suite at a
+# throwaway database unless the environment already configures one.
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017/metachecker_test")
+os.environ.setdefault("IMAGE_CONTENT_SIZE", "5")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRY_TIME", "60")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRY_TIME", "1440")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("ALGORITHM", "HS256")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Keeps every command sent while `commands` is a list."""
+
+    def __init__(self):
+        self.commands = None
+
+    def started(self, event):
+        if self.commands is not None:
+            self.commands.append((event.command_name, copy.deepcopy(dict(event.command))))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Registered before database.py builds its clients so both the pymongo and
+# the Motor client report to it.
+recorder = CommandRecorder()
+monitoring.register(recorder)
+
+
+@pytest.fixture
+def command_recorder():
+    recorder.commands = []
+    yield recorder
+    recorder.commands = None
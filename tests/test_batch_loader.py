@@ -0,0 +1,62 @@
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from common_layer import constants
+from common_layer.common_services.batch_loader import BatchLoader
+
+
+@pytest.fixture
+def database():
+    return mongomock.MongoClient()["metachecker_test"]
+
+
+def test_loader_keyed_on_other_field_returns_documents(database):
+    database[constants.CANDLE_DETAILS_SCHEMA].insert_many(
+        [
+            {constants.PROPERTY_ID_FIELD: "a", "candle_data": [{"price": 1}]},
+            {constants.PROPERTY_ID_FIELD: "b", "candle_data": [{"price": 2}]},
+        ]
+    )
+    loader = BatchLoader(
+        constants.CANDLE_DETAILS_SCHEMA,
+        {constants.INDEX_ID: 0, "candle_data": 1},
+        key_field=constants.PROPERTY_ID_FIELD,
+    )
+    loader.add_many(["a", "b", "missing"])
+    loader.load(database)
+
+    assert loader.get("a") == {"candle_data": [{"price": 1}]}
+    assert loader.get("b") == {"candle_data": [{"price": 2}]}
+    assert loader.get("missing") is None
+
+
+def test_loader_keeps_key_field_when_projected(database):
+    database[constants.CANDLE_DETAILS_SCHEMA].insert_one(
+        {constants.PROPERTY_ID_FIELD: "a", "candle_data": []}
+    )
+    loader = BatchLoader(
+        constants.CANDLE_DETAILS_SCHEMA,
+        {constants.INDEX_ID: 0, constants.PROPERTY_ID_FIELD: 1},
+        key_field=constants.PROPERTY_ID_FIELD,
+    )
+    loader.add("a")
+    loader.load(database)
+
+    assert loader.get("a") == {constants.PROPERTY_ID_FIELD: "a"}
+
+
+def test_loader_converts_object_ids(database):
+    inserted_id = database[constants.PROPERTY_DETAILS_SCHEMA].insert_one(
+        {constants.PROJECT_TITLE_FIELD: "Tower"}
+    ).inserted_id
+    loader = BatchLoader(
+        constants.PROPERTY_DETAILS_SCHEMA, {constants.PROJECT_TITLE_FIELD: 1}
+    )
+    loader.add_many([str(inserted_id), "not-an-object-id"])
+    loader.load(database)
+
+    assert loader.get(str(inserted_id)) == {
+        constants.INDEX_ID: inserted_id,
+        constants.PROJECT_TITLE_FIELD: "Tower",
+    }
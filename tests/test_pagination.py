@@ -0,0 +1,41 @@
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from common_layer import constants
+from common_layer.common_services.pagination import KeysetPage, encode_cursor
+
+
+def test_created_at_listing_seeks_past_cursor():
+    page = KeysetPage([(constants.CREATED_AT_FIELD, "desc")], per_page=2)
+    last_id = ObjectId()
+    cursor = page.next_cursor(
+        [{constants.CREATED_AT_FIELD: 5, constants.INDEX_ID: ObjectId()},
+         {constants.CREATED_AT_FIELD: 3, constants.INDEX_ID: last_id}]
+    )
+
+    next_page = KeysetPage([(constants.CREATED_AT_FIELD, -1)], per_page=2, cursor=cursor)
+    assert next_page.skip == 0
+    assert next_page.filter({}) == {
+        "$or": [
+            {constants.CREATED_AT_FIELD: {"$lt": 3}},
+            {constants.CREATED_AT_FIELD: 3, constants.INDEX_ID: {"$lt": last_id}},
+        ]
+    }
+
+
+def test_unindexed_sort_pages_by_skip_without_cursor():
+    page = KeysetPage([(constants.PRICE_FIELD, 1)], page_number=3, per_page=2)
+    assert page.skip == 4
+    assert page.next_cursor([{constants.INDEX_ID: ObjectId()}] * 2) is None
+
+    cursor = encode_cursor(page.sort_fields, [None, ObjectId()])
+    with pytest.raises(HTTPException) as error:
+        KeysetPage([(constants.PRICE_FIELD, 1)], cursor=cursor)
+    assert error.value.status_code == 400
+
+
+@pytest.mark.parametrize("direction", ["ascending", 0, 2, None, True, [1]])
+def test_invalid_sort_direction_is_a_bad_request(direction):
+    with pytest.raises(HTTPException) as error:
+        KeysetPage([(constants.CREATED_AT_FIELD, direction)])
+    assert error.value.status_code == 400
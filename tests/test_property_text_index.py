@@ -0,0 +1,36 @@
+from bson import ObjectId
+from common_layer import constants
+from common_layer.common_services.property_text_index import PropertyTextIndex
+
+
+def listing(title):
+    return {constants.INDEX_ID: ObjectId(), constants.PROJECT_TITLE_FIELD: title}
+
+
+def test_complete_returns_most_frequent_terms_capped(monkeypatch):
+    monkeypatch.setattr(constants, "SEARCH_PREFIX_EXPANSIONS", 2)
+    text_index = PropertyTextIndex()
+    for title in ["tower", "tower", "tower", "towne", "towne", "town"]:
+        text_index.add(listing(title))
+    text_index.build_top_terms()
+
+    assert text_index.complete("to") == ["tower", "towne"]
+    assert text_index.complete("town") == ["towne", "town"]
+    assert text_index.complete("x") == []
+
+
+def test_complete_follows_incremental_updates(monkeypatch):
+    monkeypatch.setattr(constants, "SEARCH_PREFIX_EXPANSIONS", 2)
+    text_index = PropertyTextIndex()
+    added = [listing(title) for title in ["tower", "towne", "towne"]]
+    for property_details in added:
+        text_index.add(property_details)
+    text_index.build_top_terms()
+
+    for _ in range(3):
+        text_index.add(listing("town"))
+    assert text_index.complete("to") == ["town", "towne"]
+
+    text_index.remove(added[0][constants.INDEX_ID])
+    assert "tower" not in text_index.complete("t")
+    assert text_index.complete("tow", 1) == ["town"]
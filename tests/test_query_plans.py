@@ -0,0 +1,204 @@
+import asyncio
+import time
+import pytest
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from common_layer import constants
+
+
+def mongodb_available():
+    try:
+        MongoClient(constants.MONGODB_URL, serverSelectionTimeoutMS=1000).admin.command("ping")
+        return True
+    except PyMongoError:
+        return False
+
+
+requires_mongodb = pytest.mark.skipif(
+    not mongodb_available(), reason="needs a MongoDB server at MONGODB_URL"
+)
+
+
+@pytest.fixture
+def seeded_database():
+    from database import db
+    from common_layer.common_services import index_registry, region_locator, property_text_index
+    from common_layer.common_schemas.property_schema import PropertyStatus
+    from common_layer.common_schemas.user_schema import UserTypes
+
+    if not db.name.endswith("_test"):
+        pytest.skip("MONGODB_URL must name a *_test database; it is dropped")
+    db.client.drop_database(db.name)
+    index_registry.ensure_indexes(db)
+
+    user_id, region_id, property_id = ObjectId(), ObjectId(), ObjectId()
+    # Stored the way add_region and add_property write them, so the geo and
+    # featured/recommended lookups reach their real queries.
+    location = {"type": "Point", "coordinates": [77.59, 12.97]}
+    db[constants.USER_DETAILS_SCHEMA].insert_one(
+        {
+            constants.INDEX_ID: user_id,
+            "legal_name": "John Doe",
+            constants.EMAIL_ID_FIELD: "johndoe@mailinator.com",
+            constants.MOBILE_NUMBER_FIELD: "919999999999",
+            constants.USER_TYPE_FIELD: UserTypes.CUSTOMER.value,
+            constants.IS_ACTIVE_FIELD: True,
+            "profile_picture_url_key": f"{constants.PROFILE_PICTURE_BASE}/{user_id}.jpeg",
+        }
+    )
+    db[constants.REGION_DETAILS_SCHEMA].insert_one(
+        {
+            constants.INDEX_ID: region_id,
+            "title": "Bengaluru",
+            constants.LOCATION_FIELD: location,
+            constants.IS_ACTIVE_FIELD: True,
+            constants.FEATURED_PROPERTIES_FIELD: [str(property_id)],
+            constants.RECOMMENDED_PROPERTIES_FIELD: [str(property_id)],
+            constants.CREATED_AT_FIELD: time.time(),
+        }
+    )
+    db[constants.PROPERTY_DETAILS_SCHEMA].insert_one(
+        {
+            constants.INDEX_ID: property_id,
+            constants.PROJECT_TITLE_FIELD: "Tower",
+            constants.PRICE_FIELD: 1000000,
+            constants.REGION_ID_FIELD: str(region_id),
+            constants.LOCATION_FIELD: location,
+            constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
+            constants.LISTED_BY_USER_ID_FIELD: str(user_id),
+            constants.IMAGES_FIELD: [],
+            constants.CREATED_AT_FIELD: time.time(),
+        }
+    )
+    db[constants.CANDLE_DETAILS_SCHEMA].insert_one(
+        {constants.PROPERTY_ID_FIELD: str(property_id), "candle_data": []}
+    )
+    region_locator.rebuild_region_index(db)
+    property_text_index.rebuild_property_text_index(db)
+    yield db, str(user_id), str(region_id), str(property_id)
+    db.client.drop_database(db.name)
+    region_locator.rebuild_region_index(db)
+    property_text_index.rebuild_property_text_index(db)
+
+
+async def run_read_services(token, user_id, region_id, property_id):
+    from auth_layer.prospect.prospect_services import (
+        customer_property_service,
+        customer_investment_service,
+        customer_management_service,
+        customer_conversation_service,
+        customer_leads_management_service,
+    )
+    from auth_layer.admin.admin_services import admin_user_management_service
+    from common_layer.common_schemas.property_schema import BatchPropertyRequestSchema
+
+    latitude, longitude = 12.97, 77.59
+    customer_property_service.get_regions()
+    customer_property_service.get_top_gainers()
+    customer_property_service.get_property_by_id(property_id)
+    customer_property_service.get_properties_batch(
+        BatchPropertyRequestSchema(property_ids=[property_id])
+    )
+    customer_property_service.get_search_suggestions("tow", 5)
+    customer_property_service.get_customer_bookmarks_ids(token)
+    await customer_property_service.get_list_of_featured_properties(latitude, longitude, 10, 1)
+    await customer_property_service.get_list_of_recommended_properties(latitude, longitude, 10, 1)
+    await customer_property_service.get_my_recommendations(latitude, longitude, 10, 1, token)
+    await customer_property_service.get_list_of_most_viewed_properties(10, 1)
+    await customer_property_service.get_list_of_top_properties(latitude, longitude, 10, 1)
+    await customer_property_service.get_nearby_properties(latitude, longitude, 10, 1)
+    await customer_property_service.get_property_list_by_region_id(1, 10, region_id)
+    await customer_property_service.get_similar_properties(region_id, 1, 10, property_id=property_id)
+    await customer_property_service.get_filtered_properties(
+        None, None, None, None, None, None, region_id, None, 1, 10
+    )
+    await customer_property_service.search_properties(
+        None, None, None, None, None, None, region_id, None, 1, 10
+    )
+    await customer_property_service.text_search_properties("tower", 1, 10)
+    await customer_property_service.get_customer_bookmarks(1, 10, token)
+    # The nightly job runs the same lookups against a full catalogue.
+    customer_property_service.add_todays_property_count()
+
+    await customer_investment_service.get_user_wallet(token)
+    customer_investment_service.get_customers_transactions(token)
+    customer_investment_service.get_customer_fiat_transactions(1, 10, token)
+    customer_investment_service.get_property_current_wallet_value(property_id, token)
+    customer_investment_service.get_investment_progress_details(property_id, token)
+    customer_investment_service.get_property_order_history(property_id, token, 1, 10)
+
+    await customer_management_service.get_notifications(1, 10, token)
+    customer_management_service.get_notification_count(token)
+    await customer_conversation_service.get_customer_conversations(1, 10, "sent", token)
+
+    customer_leads_management_service.get_investors_projects(1, 10, token)
+    customer_leads_management_service.get_investors_leads(1, 10, token)
+    customer_leads_management_service.get_candle_of_property(property_id, token)
+    customer_leads_management_service.get_dashboard_details(token)
+    customer_leads_management_service.get_property_analytics(property_id, token=token)
+    customer_leads_management_service.get_dashboard_analytics(token=token)
+
+    admin_user_management_service.get_users_list(1, 10, None, None, None, None, token)
+
+
+@requires_mongodb
+def test_service_queries_use_indexes(seeded_database, command_recorder):
+    from datetime import timedelta
+    from common_layer.common_services import index_registry
+    from common_layer.common_services.oauth_handler import create_access_token
+    from common_layer.common_schemas.user_schema import UserTypes
+
+    database, user_id, region_id, property_id = seeded_database
+    token = create_access_token(
+        {
+            constants.ID: user_id,
+            constants.EMAIL_ID_FIELD: "johndoe@mailinator.com",
+            constants.USER_TYPE_FIELD: UserTypes.CUSTOMER.value,
+        },
+        timedelta(minutes=5),
+    )
+    asyncio.run(run_read_services(token, user_id, region_id, property_id))
+    recorded = [
+        (command_name, command)
+        for command_name, command in command_recorder.commands
+        if command.get("$db") == database.name
+    ]
+    command_recorder.commands = None
+
+    assert recorded, "the services issued no queries"
+    assert index_registry.find_collection_scans(recorded, database) == []
+
+
+def test_explainable_commands_skip_full_reads():
+    from common_layer.common_services import index_registry
+
+    assert index_registry.explainable_commands("find", {"find": "c", "filter": {}}) == []
+    assert index_registry.explainable_commands(
+        "aggregate", {"aggregate": "c", "pipeline": [{"$group": {"_id": None}}]}
+    ) == []
+    assert index_registry.explainable_commands(
+        "find", {"find": "c", "filter": {"a": 1}, "lsid": {}, "$db": "x"}
+    ) == [{"find": "c", "filter": {"a": 1}}]
+    assert index_registry.explainable_commands(
+        "update", {"update": "c", "updates": [{"q": {"a": 1}, "u": {}}, {"q": {}, "u": {}}]}
+    ) == [{"update": "c", "updates": [{"q": {"a": 1}, "u": {}}]}]
+
+
+class ExplainDatabase:
+    def __init__(self, stage):
+        self.stage = stage
+
+    def command(self, name, command, verbosity=None):
+        # Aggregations report their plan under the first stage's $cursor.
+        return {"stages": [{"$cursor": {"queryPlanner": {"winningPlan": {"stage": self.stage}}}}]}
+
+
+def test_find_collection_scans_reports_collscan_plans():
+    from common_layer.common_services import index_registry
+
+    recorded = [("aggregate", {"aggregate": "c", "pipeline": [{"$match": {"a": 1}}], "cursor": {}})]
+    assert index_registry.find_collection_scans(recorded, ExplainDatabase("COLLSCAN")) == [
+        recorded[0][1]
+    ]
+    assert index_registry.find_collection_scans(recorded, ExplainDatabase("IXSCAN")) == []
@@ -0,0 +1,61 @@
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from common_layer import constants
+from common_layer.common_schemas.property_schema import PropertyStatus
+from common_layer.common_services import similarity_engine
+
+
+@pytest.fixture
+def database():
+    return mongomock.MongoClient()["metachecker_test"]
+
+
+def test_changes_are_claimed_once_and_released(database):
+    similarity_engine.mark_properties_changed(["a", "b", "a"], database)
+
+    claim_id, property_ids = similarity_engine.claim_changed_properties(database)
+    assert sorted(property_ids) == ["a", "b"]
+    assert similarity_engine.claim_changed_properties(database)[1] == []
+
+    similarity_engine.release_changed_properties(claim_id, database)
+    assert database[constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA].count_documents({}) == 0
+
+
+def test_change_marked_during_refresh_is_kept(database):
+    similarity_engine.mark_property_changed("a", database)
+    claim_id, _ = similarity_engine.claim_changed_properties(database)
+
+    similarity_engine.mark_property_changed("a", database)
+    similarity_engine.release_changed_properties(claim_id, database)
+
+    assert similarity_engine.claim_changed_properties(database)[1] == ["a"]
+
+
+def test_refresh_after_restart_loads_state_without_rebuilding(database, monkeypatch):
+    database[constants.PROPERTY_DETAILS_SCHEMA].insert_many(
+        [
+            {
+                constants.STATUS_FIELD: PropertyStatus.ACTIVE.value,
+                constants.PRICE_FIELD: 1000 * (index + 1),
+                constants.LOCATION_FIELD: {"latitude": 12.9, "longitude": 77.6 + index / 100},
+            }
+            for index in range(5)
+        ]
+    )
+    similarity_engine.rebuild_similarities(database)
+    monkeypatch.setattr(similarity_engine, "_state", None)
+    monkeypatch.setattr(
+        similarity_engine,
+        "_rebuild_similarities",
+        lambda database: pytest.fail("refresh must not rebuild every list"),
+    )
+
+    property_id = str(database[constants.PROPERTY_DETAILS_SCHEMA].find_one()[constants.INDEX_ID])
+    similarity_engine.mark_property_changed(property_id, database)
+
+    assert similarity_engine.refresh_changed_properties(database) == 1
+    assert database[constants.PROPERTY_SIMILARITY_CHANGE_SCHEMA].count_documents({}) == 0
+    similarity = database[constants.PROPERTY_SIMILARITY_SCHEMA].find_one({constants.INDEX_ID: property_id})
+    assert len(similarity["similar"]) == 4
@@ -0,0 +1,36 @@
+from common_layer import constants
+from common_layer.common_schemas.property_schema import AnalyticsGranularity
+from common_layer.common_services import view_rollups
+from common_layer.common_services.view_rollups import latest_daily_snapshots
+
+
+def snapshot(property_id, day, views):
+    return {constants.PROPERTY_ID_FIELD: property_id, "data": day, constants.VIEW_COUNT_FIELD: views}
+
+
+def test_latest_daily_snapshots_drops_duplicate_days():
+    snapshots = [
+        snapshot("a", "2024-01-01", 10),
+        snapshot("a", "2024-01-02", 15),
+        snapshot("a", "2024-01-02", 16),
+        snapshot("a", "2024-01-03", 20),
+        snapshot("b", "2024-01-02", 3),
+        snapshot("b", "2024-01-02", 3),
+    ]
+
+    assert list(latest_daily_snapshots(snapshots)) == [
+        snapshot("a", "2024-01-01", 10),
+        snapshot("a", "2024-01-02", 16),
+        snapshot("a", "2024-01-03", 20),
+        snapshot("b", "2024-01-02", 3),
+    ]
+
+
+def test_latest_daily_snapshots_empty():
+    assert list(latest_daily_snapshots([])) == []
+
+
+def test_default_range_ends_on_the_utc_day(monkeypatch):
+    # 23:30 UTC on 2024-01-31 is already 2024-02-01 east of UTC.
+    monkeypatch.setattr(view_rollups.time, "time", lambda: 1706743800.0)
+    assert view_rollups.period_range(None, None, AnalyticsGranularity.DAILY.value)[1] == "2024-01-31"